@@ -135,6 +135,8 @@ DATASETS: Final[tuple[DatasetConfig, ...]] = (
     ),
 )
 
+_DATASETS_BY_NAME: Final[dict[str, DatasetConfig]] = {d.name: d for d in DATASETS}
+
 
 def get_dataset_by_name(name: str) -> DatasetConfig:
     """Look up a dataset configuration by its machine-readable name.
@@ -148,10 +150,10 @@ def get_dataset_by_name(name: str) -> DatasetConfig:
     Raises:
         KeyError: If no dataset matches the given name.
     """
-    for dataset in DATASETS:
-        if dataset.name == name:
-            return dataset
-    valid_names = ", ".join(d.name for d in DATASETS)
+    dataset = _DATASETS_BY_NAME.get(name)
+    if dataset is not None:
+        return dataset
+    valid_names = ", ".join(_DATASETS_BY_NAME)
     raise KeyError(f"Unknown dataset '{name}'. Valid names: {valid_names}")
 
 
@@ -13,7 +13,7 @@ Delay, Gap) and are excluded from the validation scope.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Final
 
 
@@ -47,6 +47,15 @@ class SchemaContract:
     dataset_name: str
     columns: tuple[ColumnContract, ...]
     min_row_count: int
+    # Lower-cased names, computed once; validation matches headers
+    # case-insensitively for every file.
+    _column_names_lower: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _required_lower: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        lowered = tuple(c.name.lower() for c in self.columns)
+        object.__setattr__(self, "_column_names_lower", lowered)
+        object.__setattr__(self, "_required_lower", frozenset(lowered))
 
     @property
     def column_names(self) -> tuple[str, ...]:
@@ -58,6 +67,16 @@ class SchemaContract:
         """Return set of column names that must be present."""
         return frozenset(c.name for c in self.columns)
 
+    @property
+    def column_names_lower(self) -> tuple[str, ...]:
+        """Return lower-cased column names, in contract order."""
+        return self._column_names_lower
+
+    @property
+    def required_columns_lower(self) -> frozenset[str]:
+        """Return lower-cased names of the columns that must be present."""
+        return self._required_lower
+
     @property
     def nullable_columns(self) -> frozenset[str]:
         """Return set of column names that permit null values."""
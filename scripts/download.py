@@ -19,6 +19,7 @@ import logging
 import os
 import re
 import sys
+import threading
 import time
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
@@ -106,10 +107,23 @@ class DownloadManifest:
     Reads and writes a JSON file at the given path. Before each download,
     the caller checks whether a matching entry exists (same URL, same byte
     size on disk). If so, the download is skipped.
+
+    Mutations and saves are guarded by an internal lock so one manifest
+    can be shared by datasets downloading on concurrent threads. Entries
+    are indexed by URL so lookups do not scan the list.
     """
 
     path: Path
     entries: list[ManifestEntry] = field(default_factory=list)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    _by_url: dict[str, ManifestEntry] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._by_url = {e.url: e for e in self.entries}
 
     @classmethod
     def load(cls, path: Path) -> DownloadManifest:
@@ -135,19 +149,17 @@ class DownloadManifest:
         """Persist manifest to disk via atomic write (temp file + replace)."""
         self.path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path: Path = self.path.with_suffix(".tmp")
-        payload: str = json.dumps(
-            [asdict(e) for e in self.entries],
-            indent=2,
-        )
-        tmp_path.write_text(payload, encoding="utf-8")
-        os.replace(str(tmp_path), str(self.path))
+        with self._lock:
+            payload: str = json.dumps(
+                [asdict(e) for e in self.entries],
+                indent=2,
+            )
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(str(tmp_path), str(self.path))
 
     def find_entry(self, url: str) -> ManifestEntry | None:
         """Look up an existing manifest entry by URL."""
-        for entry in self.entries:
-            if entry.url == url:
-                return entry
-        return None
+        return self._by_url.get(url)
 
     def should_skip(self, url: str) -> bool:
         """Return True if the file for this URL already exists with correct size."""
@@ -161,8 +173,11 @@ class DownloadManifest:
 
     def upsert(self, entry: ManifestEntry) -> None:
         """Insert or update a manifest entry keyed by URL."""
-        self.entries = [e for e in self.entries if e.url != entry.url]
-        self.entries.append(entry)
+        with self._lock:
+            if entry.url in self._by_url:
+                self.entries = [e for e in self.entries if e.url != entry.url]
+            self.entries.append(entry)
+            self._by_url[entry.url] = entry
 
     def prune(self) -> int:
         """Remove entries whose files no longer exist on disk.
@@ -172,6 +187,7 @@ class DownloadManifest:
         """
         before: int = len(self.entries)
         self.entries = [e for e in self.entries if Path(e.file_path).exists()]
+        self._by_url = {e.url: e for e in self.entries}
         removed: int = before - len(self.entries)
         if removed > 0:
             logger.info("Pruned %d stale manifest entries", removed)
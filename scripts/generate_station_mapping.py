@@ -14,8 +14,13 @@ import csv
 import logging
 import re
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Final, NamedTuple
+from typing import Final
 
 logging.basicConfig(
     level=logging.INFO,
@@ -27,6 +32,11 @@ logger: Final = logging.getLogger(__name__)
 _INPUT_FILE: Final = Path("data/working/station_name_analysis.csv")
 _OUTPUT_FILE: Final = Path("seeds/ttc_station_mapping.csv")
 
+# Parallel resolution only pays off for inputs well beyond the ~1k names
+# observed in the S001 analysis
+_PARALLEL_MIN_NAMES: Final = 5000
+_PARALLEL_CHUNK_SIZE: Final = 1000
+
 _VALID_LINES: Final[frozenset[str]] = frozenset({"YU", "BD", "SHP", "SRT"})
 
 _OUTPUT_COLUMNS: Final[list[str]] = [
@@ -37,107 +47,103 @@ _OUTPUT_COLUMNS: Final[list[str]] = [
 ]
 
 
-class StationRef(NamedTuple):
-    """Reference entry for a canonical TTC subway station."""
-
-    canonical_name: str
-    station_key: str
-    default_line: str
-
-
 # ---------------------------------------------------------------------------
 # Canonical station registry — 75 unique physical stations + Unknown
 # Keys ordered: YU (ST_001-ST_038), BD (ST_039-ST_066), SHP (ST_067-ST_070),
 # SRT (ST_071-ST_075), Unknown (ST_000).
+# Maps station_key → (canonical_name, default_line).
 # ---------------------------------------------------------------------------
-_REGISTRY: Final[dict[str, StationRef]] = {
-    "ST_000": StationRef("Unknown", "ST_000", "YU"),
+_REGISTRY: Final[dict[str, tuple[str, str]]] = {
+    "ST_000": ("Unknown", "YU"),
     # --- Line 1 Yonge-University (YU) ---
-    "ST_001": StationRef("Finch", "ST_001", "YU"),
-    "ST_002": StationRef("North York Centre", "ST_002", "YU"),
-    "ST_003": StationRef("Sheppard-Yonge", "ST_003", "YU"),
-    "ST_004": StationRef("York Mills", "ST_004", "YU"),
-    "ST_005": StationRef("Lawrence", "ST_005", "YU"),
-    "ST_006": StationRef("Eglinton", "ST_006", "YU"),
-    "ST_007": StationRef("Davisville", "ST_007", "YU"),
-    "ST_008": StationRef("St. Clair", "ST_008", "YU"),
-    "ST_009": StationRef("Summerhill", "ST_009", "YU"),
-    "ST_010": StationRef("Rosedale", "ST_010", "YU"),
-    "ST_011": StationRef("Bloor-Yonge", "ST_011", "YU"),
-    "ST_012": StationRef("Wellesley", "ST_012", "YU"),
-    "ST_013": StationRef("College", "ST_013", "YU"),
-    "ST_014": StationRef("Dundas", "ST_014", "YU"),
-    "ST_015": StationRef("Queen", "ST_015", "YU"),
-    "ST_016": StationRef("King", "ST_016", "YU"),
-    "ST_017": StationRef("Union", "ST_017", "YU"),
-    "ST_018": StationRef("St. Andrew", "ST_018", "YU"),
-    "ST_019": StationRef("Osgoode", "ST_019", "YU"),
-    "ST_020": StationRef("St. Patrick", "ST_020", "YU"),
-    "ST_021": StationRef("Queen's Park", "ST_021", "YU"),
-    "ST_022": StationRef("Museum", "ST_022", "YU"),
-    "ST_023": StationRef("St. George", "ST_023", "YU"),
-    "ST_024": StationRef("Spadina", "ST_024", "YU"),
-    "ST_025": StationRef("Dupont", "ST_025", "YU"),
-    "ST_026": StationRef("St. Clair West", "ST_026", "YU"),
-    "ST_027": StationRef("Eglinton West", "ST_027", "YU"),
-    "ST_028": StationRef("Glencairn", "ST_028", "YU"),
-    "ST_029": StationRef("Lawrence West", "ST_029", "YU"),
-    "ST_030": StationRef("Yorkdale", "ST_030", "YU"),
-    "ST_031": StationRef("Wilson", "ST_031", "YU"),
-    "ST_032": StationRef("Sheppard West", "ST_032", "YU"),
-    "ST_033": StationRef("Downsview Park", "ST_033", "YU"),
-    "ST_034": StationRef("Finch West", "ST_034", "YU"),
-    "ST_035": StationRef("York University", "ST_035", "YU"),
-    "ST_036": StationRef("Pioneer Village", "ST_036", "YU"),
-    "ST_037": StationRef("Highway 407", "ST_037", "YU"),
-    "ST_038": StationRef("Vaughan Metropolitan Centre", "ST_038", "YU"),
+    "ST_001": ("Finch", "YU"),
+    "ST_002": ("North York Centre", "YU"),
+    "ST_003": ("Sheppard-Yonge", "YU"),
+    "ST_004": ("York Mills", "YU"),
+    "ST_005": ("Lawrence", "YU"),
+    "ST_006": ("Eglinton", "YU"),
+    "ST_007": ("Davisville", "YU"),
+    "ST_008": ("St. Clair", "YU"),
+    "ST_009": ("Summerhill", "YU"),
+    "ST_010": ("Rosedale", "YU"),
+    "ST_011": ("Bloor-Yonge", "YU"),
+    "ST_012": ("Wellesley", "YU"),
+    "ST_013": ("College", "YU"),
+    "ST_014": ("Dundas", "YU"),
+    "ST_015": ("Queen", "YU"),
+    "ST_016": ("King", "YU"),
+    "ST_017": ("Union", "YU"),
+    "ST_018": ("St. Andrew", "YU"),
+    "ST_019": ("Osgoode", "YU"),
+    "ST_020": ("St. Patrick", "YU"),
+    "ST_021": ("Queen's Park", "YU"),
+    "ST_022": ("Museum", "YU"),
+    "ST_023": ("St. George", "YU"),
+    "ST_024": ("Spadina", "YU"),
+    "ST_025": ("Dupont", "YU"),
+    "ST_026": ("St. Clair West", "YU"),
+    "ST_027": ("Eglinton West", "YU"),
+    "ST_028": ("Glencairn", "YU"),
+    "ST_029": ("Lawrence West", "YU"),
+    "ST_030": ("Yorkdale", "YU"),
+    "ST_031": ("Wilson", "YU"),
+    "ST_032": ("Sheppard West", "YU"),
+    "ST_033": ("Downsview Park", "YU"),
+    "ST_034": ("Finch West", "YU"),
+    "ST_035": ("York University", "YU"),
+    "ST_036": ("Pioneer Village", "YU"),
+    "ST_037": ("Highway 407", "YU"),
+    "ST_038": ("Vaughan Metropolitan Centre", "YU"),
     # --- Line 2 Bloor-Danforth (BD) ---
-    "ST_039": StationRef("Kipling", "ST_039", "BD"),
-    "ST_040": StationRef("Islington", "ST_040", "BD"),
-    "ST_041": StationRef("Royal York", "ST_041", "BD"),
-    "ST_042": StationRef("Old Mill", "ST_042", "BD"),
-    "ST_043": StationRef("Jane", "ST_043", "BD"),
-    "ST_044": StationRef("Runnymede", "ST_044", "BD"),
-    "ST_045": StationRef("High Park", "ST_045", "BD"),
-    "ST_046": StationRef("Keele", "ST_046", "BD"),
-    "ST_047": StationRef("Dundas West", "ST_047", "BD"),
-    "ST_048": StationRef("Lansdowne", "ST_048", "BD"),
-    "ST_049": StationRef("Dufferin", "ST_049", "BD"),
-    "ST_050": StationRef("Ossington", "ST_050", "BD"),
-    "ST_051": StationRef("Christie", "ST_051", "BD"),
-    "ST_052": StationRef("Bathurst", "ST_052", "BD"),
+    "ST_039": ("Kipling", "BD"),
+    "ST_040": ("Islington", "BD"),
+    "ST_041": ("Royal York", "BD"),
+    "ST_042": ("Old Mill", "BD"),
+    "ST_043": ("Jane", "BD"),
+    "ST_044": ("Runnymede", "BD"),
+    "ST_045": ("High Park", "BD"),
+    "ST_046": ("Keele", "BD"),
+    "ST_047": ("Dundas West", "BD"),
+    "ST_048": ("Lansdowne", "BD"),
+    "ST_049": ("Dufferin", "BD"),
+    "ST_050": ("Ossington", "BD"),
+    "ST_051": ("Christie", "BD"),
+    "ST_052": ("Bathurst", "BD"),
     # Spadina BD → reuse ST_024
     # St. George BD → reuse ST_023
-    "ST_053": StationRef("Bay", "ST_053", "BD"),
+    "ST_053": ("Bay", "BD"),
     # Bloor-Yonge BD → reuse ST_011
-    "ST_054": StationRef("Sherbourne", "ST_054", "BD"),
-    "ST_055": StationRef("Castle Frank", "ST_055", "BD"),
-    "ST_056": StationRef("Broadview", "ST_056", "BD"),
-    "ST_057": StationRef("Chester", "ST_057", "BD"),
-    "ST_058": StationRef("Pape", "ST_058", "BD"),
-    "ST_059": StationRef("Donlands", "ST_059", "BD"),
-    "ST_060": StationRef("Greenwood", "ST_060", "BD"),
-    "ST_061": StationRef("Coxwell", "ST_061", "BD"),
-    "ST_062": StationRef("Woodbine", "ST_062", "BD"),
-    "ST_063": StationRef("Main Street", "ST_063", "BD"),
-    "ST_064": StationRef("Victoria Park", "ST_064", "BD"),
-    "ST_065": StationRef("Warden", "ST_065", "BD"),
-    "ST_066": StationRef("Kennedy", "ST_066", "BD"),
+    "ST_054": ("Sherbourne", "BD"),
+    "ST_055": ("Castle Frank", "BD"),
+    "ST_056": ("Broadview", "BD"),
+    "ST_057": ("Chester", "BD"),
+    "ST_058": ("Pape", "BD"),
+    "ST_059": ("Donlands", "BD"),
+    "ST_060": ("Greenwood", "BD"),
+    "ST_061": ("Coxwell", "BD"),
+    "ST_062": ("Woodbine", "BD"),
+    "ST_063": ("Main Street", "BD"),
+    "ST_064": ("Victoria Park", "BD"),
+    "ST_065": ("Warden", "BD"),
+    "ST_066": ("Kennedy", "BD"),
     # --- Line 4 Sheppard (SHP) ---
     # Sheppard-Yonge SHP → reuse ST_003
-    "ST_067": StationRef("Bayview", "ST_067", "SHP"),
-    "ST_068": StationRef("Bessarion", "ST_068", "SHP"),
-    "ST_069": StationRef("Leslie", "ST_069", "SHP"),
-    "ST_070": StationRef("Don Mills", "ST_070", "SHP"),
+    "ST_067": ("Bayview", "SHP"),
+    "ST_068": ("Bessarion", "SHP"),
+    "ST_069": ("Leslie", "SHP"),
+    "ST_070": ("Don Mills", "SHP"),
     # --- Line 3 Scarborough RT (SRT) ---
     # Kennedy SRT → reuse ST_066
-    "ST_071": StationRef("Lawrence East", "ST_071", "SRT"),
-    "ST_072": StationRef("Ellesmere", "ST_072", "SRT"),
-    "ST_073": StationRef("Midland", "ST_073", "SRT"),
-    "ST_074": StationRef("Scarborough Centre", "ST_074", "SRT"),
-    "ST_075": StationRef("McCowan", "ST_075", "SRT"),
+    "ST_071": ("Lawrence East", "SRT"),
+    "ST_072": ("Ellesmere", "SRT"),
+    "ST_073": ("Midland", "SRT"),
+    "ST_074": ("Scarborough Centre", "SRT"),
+    "ST_075": ("McCowan", "SRT"),
 }
 
+# Station key → canonical name, flattened from the registry for resolution
+_CANON: Final[dict[str, str]] = {key: name for key, (name, _) in _REGISTRY.items()}
+
 
 # ---------------------------------------------------------------------------
 # Core name lookup: maps normalized station core names to (key, line).
@@ -516,6 +522,23 @@ _EXPLICIT: Final[dict[str, tuple[str, str]]] = {
     "QUEENS PARK STATION": ("ST_021", "YU"),
 }
 
+# Lookup tables with the canonical name folded in, so a hit resolves to the
+# final (canonical_name, station_key, line_code) tuple in one probe.
+_EXPLICIT_FULL: Final[dict[str, tuple[str, str, str]]] = {
+    raw: (_CANON[key], key, line) for raw, (key, line) in _EXPLICIT.items()
+}
+_CORE_FULL: Final[dict[str, tuple[str, str, str]]] = {
+    core: (_CANON[key], key, line) for core, (key, line) in _CORE_LOOKUP.items()
+}
+
+# Substring-match candidates (core names of 4+ characters), longest first.
+# The sort is stable, so equal-length names keep their _CORE_LOOKUP order.
+_CORE_BY_LEN: Final[tuple[tuple[str, tuple[str, str, str]], ...]] = tuple(
+    (core, resolved)
+    for core, resolved in sorted(_CORE_FULL.items(), key=lambda item: -len(item[0]))
+    if len(core) >= 4
+)
+
 # Suffixes stripped during normalization (order matters — longest first)
 _STRIP_SUFFIXES: Final[list[str]] = [
     " STATION TO",
@@ -565,6 +588,21 @@ _LINE_SUFFIXES: Final[list[str]] = [
     " SHEP",
 ]
 
+# Compound-name patterns used by _resolve_station
+_TO_PATTERN: Final[re.Pattern[str]] = re.compile(r"^(.+?)\s+TO\s+")
+_AND_PATTERN: Final[re.Pattern[str]] = re.compile(r"^(.+?)\s+AND\s+")
+_APPROACH_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"^\(?APPROACH(?:ING)?\)?\s*(.+)"
+)
+_BETWEEN_PATTERN: Final[re.Pattern[str]] = re.compile(r"^BETWEEN\s+(.+?)\s+AND\s+")
+
+# Line-code tokens recognised inside free-form line values; no token's
+# suffix is another's prefix, so non-overlapping findall sees every one
+_LINE_TOKEN_PATTERN: Final[re.Pattern[str]] = re.compile(r"SRT|SHE?P|BD|YU")
+
+# Characters that force csv.writer to quote a field
+_CSV_QUOTE_PATTERN: Final[re.Pattern[str]] = re.compile(r'[,"\r\n]')
+
 
 def _normalize_line_code(raw_line: str) -> str:
     """Normalize a raw line code to a valid enum value.
@@ -575,17 +613,14 @@ def _normalize_line_code(raw_line: str) -> str:
     upper = raw_line.strip().upper()
     if upper in _VALID_LINES:
         return upper
-    if "SRT" in upper:
+    tokens = set(_LINE_TOKEN_PATTERN.findall(upper))
+    if "SRT" in tokens:
         return "SRT"
-    if "SHP" in upper or "SHEP" in upper:
+    if "SHP" in tokens or "SHEP" in tokens:
         return "SHP"
-    if "BD" in upper and "YU" not in upper:
+    if "BD" in tokens and "YU" not in tokens:
         return "BD"
-    if "YU" in upper and "BD" not in upper:
-        return "YU"
-    # Mixed references (YU/BD etc.) default to YU as the primary line
-    if "YU" in upper:
-        return "YU"
+    # YU-only and mixed references (YU/BD etc.) default to YU as the primary line
     return "YU"
 
 
@@ -597,32 +632,46 @@ def _strip_suffix(name: str, suffixes: list[str]) -> str:
     return name
 
 
+@cache
 def _resolve_station(
     raw_name: str,
     primary_line: str,
 ) -> tuple[str, str, str]:
     """Resolve a raw station name to (canonical_name, station_key, line_code).
 
-    Applies matching rules in priority order:
+    Matching rules apply in priority order, with a leading "(APPROACHING)"
+    qualifier stripped after the explicit lookup on the full name:
     1. Explicit override dictionary
     2. Core lookup after normalization
     3. Substring matching against canonical station names
     4. Default to Unknown
+
+    Expects raw_name already upper-cased, matching the lookup table keys.
+    Results are memoized on (raw_name, primary_line), so repeated names
+    resolve once.
     """
-    # Priority 1: Explicit overrides
-    if raw_name in _EXPLICIT:
-        key, line = _EXPLICIT[raw_name]
-        ref = _REGISTRY[key]
-        return (ref.canonical_name, ref.station_key, line)
+    # Priority 1: Explicit overrides, on the name as given so an override
+    # can target a qualified spelling
+    resolved = _EXPLICIT_FULL.get(raw_name)
+    if resolved is not None:
+        return resolved
+
+    # Strip an "(APPROACHING) X" qualifier so X goes through the normal rules
+    approach_match = _APPROACH_PATTERN.match(raw_name)
+    if approach_match:
+        raw_name = approach_match.group(1).strip()
+        resolved = _EXPLICIT_FULL.get(raw_name)
+        if resolved is not None:
+            return resolved
 
     # Priority 2: Normalize and look up core name
     core = raw_name
 
     # Strip station-related suffixes
     for suffix in _STRIP_SUFFIXES:
-        if suffix in core:
-            idx = core.find(suffix)
-            core = core[:idx].rstrip()
+        head, sep, _ = core.partition(suffix)
+        if sep:
+            core = head.rstrip()
             break
 
     # Strip facility suffixes
@@ -632,108 +681,133 @@ def _resolve_station(
     core = _strip_suffix(core, _LINE_SUFFIXES)
 
     # Try core lookup
-    if core in _CORE_LOOKUP:
-        key, line = _CORE_LOOKUP[core]
-        ref = _REGISTRY[key]
-        return (ref.canonical_name, ref.station_key, line)
+    resolved = _CORE_FULL.get(core)
+    if resolved is not None:
+        return resolved
 
     # Priority 3: Handle "X TO Y" patterns — extract first station
-    to_match = re.match(r"^(.+?)\s+TO\s+", raw_name)
+    to_match = _TO_PATTERN.match(raw_name)
     if to_match:
         first_part = to_match.group(1).strip()
-        first_core = _strip_suffix(first_part, _STRIP_SUFFIXES[:])
+        first_core = _strip_suffix(first_part, _STRIP_SUFFIXES)
         first_core = _strip_suffix(first_core, _LINE_SUFFIXES)
-        if first_core in _CORE_LOOKUP:
-            key, line = _CORE_LOOKUP[first_core]
-            ref = _REGISTRY[key]
-            return (ref.canonical_name, ref.station_key, line)
+        resolved = _CORE_FULL.get(first_core)
+        if resolved is not None:
+            return resolved
 
     # Priority 4: Handle "X AND Y" patterns — extract first station
-    and_match = re.match(r"^(.+?)\s+AND\s+", raw_name)
+    and_match = _AND_PATTERN.match(raw_name)
     if and_match:
         first_part = and_match.group(1).strip()
         first_core = _strip_suffix(first_part, _LINE_SUFFIXES)
-        if first_core in _CORE_LOOKUP:
-            key, line = _CORE_LOOKUP[first_core]
-            ref = _REGISTRY[key]
-            return (ref.canonical_name, ref.station_key, line)
-
-    # Priority 5: Substring match — find longest canonical match in raw name
-    best_match: tuple[str, str] | None = None
-    best_len = 0
-    for core_name, (key, line) in _CORE_LOOKUP.items():
-        if len(core_name) > best_len and core_name in raw_name and len(core_name) >= 4:
-            best_match = (key, line)
-            best_len = len(core_name)
-
-    if best_match is not None:
-        key, line = best_match
-        ref = _REGISTRY[key]
-        return (ref.canonical_name, ref.station_key, line)
-
-    # Priority 6: Handle "(APPROACHING) X" pattern
-    approach_match = re.match(r"^\(?APPROACH(?:ING)?\)?\s*(.+)", raw_name)
-    if approach_match:
-        remainder = approach_match.group(1).strip()
-        return _resolve_station(remainder, primary_line)
+        resolved = _CORE_FULL.get(first_core)
+        if resolved is not None:
+            return resolved
 
-    # Priority 7: Handle "BETWEEN X AND Y" pattern
-    between_match = re.match(r"^BETWEEN\s+(.+?)\s+AND\s+", raw_name)
+    # Priority 5: Substring match — first (longest) canonical match in raw name
+    for core_name, resolved in _CORE_BY_LEN:
+        if core_name in raw_name:
+            return resolved
+
+    # Priority 6: Handle "BETWEEN X AND Y" pattern
+    between_match = _BETWEEN_PATTERN.match(raw_name)
     if between_match:
         first_part = between_match.group(1).strip()
-        first_core = _strip_suffix(first_part, _STRIP_SUFFIXES[:])
+        first_core = _strip_suffix(first_part, _STRIP_SUFFIXES)
         first_core = _strip_suffix(first_core, _LINE_SUFFIXES)
-        if first_core in _CORE_LOOKUP:
-            key, line = _CORE_LOOKUP[first_core]
-            ref = _REGISTRY[key]
-            return (ref.canonical_name, ref.station_key, line)
+        resolved = _CORE_FULL.get(first_core)
+        if resolved is not None:
+            return resolved
 
     # Default: Unknown
     valid_line = _normalize_line_code(primary_line)
     return ("Unknown", "ST_000", valid_line)
 
 
+def _resolve_batch(pairs: list[tuple[str, str]]) -> list[list[str]]:
+    """Resolve (raw_name, primary_line) pairs to output mapping rows."""
+    # Resolve on the upper-cased name but keep the raw spelling, which is the
+    # join key against stg_ttc_subway_delays
+    return [
+        [raw_name, *_resolve_station(raw_name.upper(), primary_line)]
+        for raw_name, primary_line in pairs
+    ]
+
+
+def _resolve_all(pairs: list[tuple[str, str]]) -> list[list[str]]:
+    """Resolve all names, fanning out across processes for large inputs.
+
+    Names resolve independently, so chunks are mapped over a process pool
+    once the input reaches _PARALLEL_MIN_NAMES. Smaller inputs resolve
+    inline, where worker start-up would cost more than it saves. Row order
+    matches the input order either way.
+    """
+    if len(pairs) < _PARALLEL_MIN_NAMES:
+        return _resolve_batch(pairs)
+
+    chunks = [
+        pairs[i : i + _PARALLEL_CHUNK_SIZE]
+        for i in range(0, len(pairs), _PARALLEL_CHUNK_SIZE)
+    ]
+    with ProcessPoolExecutor() as executor:
+        return [row for batch in executor.map(_resolve_batch, chunks) for row in batch]
+
+
 def _read_unique_names(
     input_path: Path,
 ) -> list[tuple[str, str, int]]:
     """Read analysis CSV and collapse to unique (name, primary_line, total).
 
-    Returns list sorted alphabetically by raw_station_name.
+    Totals and per-line counts are accumulated in two flat Counters in a
+    single pass over the input. Returns list sorted alphabetically by
+    raw_station_name.
     """
-    from collections import defaultdict
-
-    name_data: dict[str, dict[str, int | dict[str, int]]] = {}
-
-    with input_path.open(encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+    totals: Counter[str] = Counter()
+    per_line: Counter[tuple[str, str]] = Counter()
+
+    with input_path.open(encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        name_idx = header.index("raw_station_name")
+        line_idx = header.index("line_code")
+        count_idx = header.index("occurrence_count")
         for row in reader:
-            name = row["raw_station_name"]
-            line = row["line_code"]
-            count = int(row["occurrence_count"])
-            if name not in name_data:
-                name_data[name] = {"total": 0, "lines": defaultdict(int)}
-            stats = name_data[name]
-            total = stats["total"]
-            assert isinstance(total, int)
-            stats["total"] = total + count
-            lines = stats["lines"]
-            assert isinstance(lines, dict)
-            lines[line] = lines.get(line, 0) + count
-
+            name = row[name_idx]
+            count = int(row[count_idx])
+            totals[name] += count
+            per_line[name, row[line_idx]] += count
+
+    # The stable sort keeps each name's lines in first-seen order, so max()
+    # breaks count ties in favour of the first line observed.
+    by_name = sorted(per_line.items(), key=lambda item: item[0][0])
     result: list[tuple[str, str, int]] = []
-    for name in sorted(name_data):
-        stats = name_data[name]
-        total = stats["total"]
-        assert isinstance(total, int)
-        lines_raw = stats["lines"]
-        assert isinstance(lines_raw, dict)
-        lines_dict: dict[str, int] = lines_raw
-        primary_line = max(lines_dict, key=lambda k: lines_dict[k])
-        result.append((name, primary_line, total))
+    for name, group in groupby(by_name, key=lambda item: item[0][0]):
+        (_, primary_line), _ = max(group, key=itemgetter(1))
+        result.append((name, primary_line, totals[name]))
 
     return result
 
 
+def _write_mapping(output_path: Path, rows: list[list[str]]) -> None:
+    """Write the mapping seed CSV with a header row.
+
+    When no field needs quoting the file is encoded once and written as a
+    single bytes payload, bypassing the text layer; otherwise csv.writer
+    handles the escaping. Both paths produce byte-identical output for
+    unquoted data.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if any(_CSV_QUOTE_PATTERN.search(field) for row in rows for field in row):
+        with output_path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(_OUTPUT_COLUMNS)
+            writer.writerows(rows)
+        return
+
+    lines = [",".join(_OUTPUT_COLUMNS), *(",".join(row) for row in rows)]
+    output_path.write_bytes(("\r\n".join(lines) + "\r\n").encode("utf-8"))
+
+
 def main() -> None:
     """Generate ttc_station_mapping.csv from analysis data."""
     if not _INPUT_FILE.exists():
@@ -743,24 +817,17 @@ def main() -> None:
     names = _read_unique_names(_INPUT_FILE)
     logger.info("Read %d unique raw station names", len(names))
 
-    rows: list[list[str]] = []
-    unknown_count = 0
-    unknown_occurrences = 0
+    rows = _resolve_all([(raw_name, line) for raw_name, line, _ in names])
+    unknown_counts = [
+        occ_count
+        for row, (_, _, occ_count) in zip(rows, names, strict=True)
+        if row[2] == "ST_000"
+    ]
+    unknown_count = len(unknown_counts)
+    unknown_occurrences = sum(unknown_counts)
     total_occurrences = sum(t for _, _, t in names)
 
-    for raw_name, primary_line, occ_count in names:
-        canonical, key, line = _resolve_station(raw_name, primary_line)
-        rows.append([raw_name, canonical, key, line])
-        if key == "ST_000":
-            unknown_count += 1
-            unknown_occurrences += occ_count
-
-    # Write output
-    _OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with _OUTPUT_FILE.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(_OUTPUT_COLUMNS)
-        writer.writerows(rows)
+    _write_mapping(_OUTPUT_FILE, rows)
 
     mapped_occ = total_occurrences - unknown_occurrences
     coverage = mapped_occ / total_occurrences * 100 if total_occurrences else 0
@@ -789,8 +856,8 @@ def main() -> None:
             sorted(missing),
         )
         for k in sorted(missing):
-            ref = _REGISTRY[k]
-            logger.warning("  %s: %s (%s)", k, ref.canonical_name, ref.default_line)
+            name, default_line = _REGISTRY[k]
+            logger.warning("  %s: %s (%s)", k, name, default_line)
 
     # Verify uniqueness on raw_station_name
     raw_names = [row[0] for row in rows]
@@ -1,47 +1,70 @@
 """Pipeline orchestrator for Toronto Urban Mobility data ingestion.
 
-Sequences download, transform, validate, and Snowflake load stages
-with per-dataset atomic transaction boundaries. Each dataset processes
-independently: a failure in one dataset does not block others.
+Streams datasets through download, transform + validate, and Snowflake
+load stages connected by bounded queues, with per-dataset atomic
+transaction boundaries. Each dataset processes independently: a failure
+in one dataset does not block others.
 
 Usage:
     python scripts/ingest.py --all
     python scripts/ingest.py --dataset ttc_subway_delays
     python scripts/ingest.py --all --skip-download
+    python scripts/ingest.py --all --workers 2
+    python scripts/ingest.py --all --no-pipeline
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import logging
+import os
+import queue
 import sys
+import threading
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import partial
+from logging.handlers import QueueHandler, QueueListener
+from operator import attrgetter
 from pathlib import Path
-from typing import Final
-
-import snowflake.connector
+from typing import TYPE_CHECKING, Any, Final
 
 from scripts.config import DATASETS, get_dataset_by_name
-from scripts.contracts import CONTRACTS
-from scripts.download import DownloadError, download_dataset
-from scripts.download import DownloadManifest as _DownloadManifest
-from scripts.load import (
-    DatasetStatus,
-    LoadError,
-    MergeResult,
-    PipelineStage,
-    SnowflakeConnectionManager,
-    get_table_config,
-    load_dataset,
-)
-from scripts.validate import SchemaValidationError
+
+# Stage modules (and snowflake.connector / httpx behind them) are imported
+# inside the functions that use them, so --help and argument errors return
+# without paying their import cost.
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from types import TracebackType
+
+    from snowflake.connector import SnowflakeConnection
+
+    from scripts.download import DownloadManifest
+    from scripts.load import (
+        DatasetStatus,
+        MergeResult,
+        PipelineStage,
+        SnowflakeConnectionManager,
+    )
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
 _RAW_DIR: Final[Path] = Path("data/raw")
 _VALIDATED_DIR: Final[Path] = Path("data/validated")
 
+# Modules whose code shapes validated output; their source is part of the
+# validation cache fingerprint, so editing them forces re-validation.
+_PIPELINE_SOURCES: Final[tuple[Path, ...]] = (
+    Path(__file__).with_name("transform.py"),
+    Path(__file__).with_name("validate.py"),
+)
+
+# Jobs buffered between adjacent stages before the upstream stage blocks.
+_STAGE_QUEUE_DEPTH: Final[int] = 2
+
 
 # ---- Result dataclasses -----------------------------------------------------
 
@@ -78,7 +101,7 @@ class PipelineResult:
         success: True only if every dataset succeeded.
     """
 
-    datasets_processed: list[DatasetResult] = field(default_factory=list)
+    datasets_processed: tuple[DatasetResult, ...] = ()
     total_rows_loaded: int = 0
     total_elapsed_seconds: float = 0.0
     success: bool = True
@@ -96,64 +119,182 @@ _DATASET_SUBDIRS: Final[dict[str, str]] = {
 }
 
 
+# Validated CSV listings per dataset; cleared when validation rewrites the tree.
+_VALIDATED_CSV_CACHE: Final[dict[str, list[Path]]] = {}
+
+
 def _get_validated_csvs(dataset_name: str) -> list[Path]:
     """Collect all validated CSV files for a dataset.
 
+    The directory walk runs once per dataset; later calls reuse the
+    cached listing until _run_transform_and_validate invalidates it.
+
     Args:
         dataset_name: Machine-readable dataset identifier.
 
     Returns:
         Sorted list of CSV file paths under data/validated/.
     """
+    cached = _VALIDATED_CSV_CACHE.get(dataset_name)
+    if cached is not None:
+        return cached
     subdir = _DATASET_SUBDIRS.get(dataset_name, "")
     validated_dir = _VALIDATED_DIR / subdir
-    if not validated_dir.exists():
-        return []
-    return sorted(validated_dir.rglob("*.csv"))
+    csvs = (
+        sorted(Path(p) for p in _walk_csvs(str(validated_dir)))
+        if validated_dir.exists()
+        else []
+    )
+    _VALIDATED_CSV_CACHE[dataset_name] = csvs
+    return csvs
+
+
+def _walk_csvs(root: str) -> Iterator[str]:
+    """Yield paths of CSV files under root via a single scandir pass.
+
+    Only matches are turned into Path objects, unlike rglob which builds
+    one per directory entry.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_csvs(entry.path)
+            elif entry.name.endswith(".csv"):
+                yield entry.path
 
 
 # ---- Stage executors ---------------------------------------------------------
 
 
-def _run_download(dataset_name: str) -> None:
+def _run_download(dataset_name: str, manifest: DownloadManifest) -> None:
     """Execute the download stage for a single dataset."""
+    from scripts.download import download_dataset
+
     config = get_dataset_by_name(dataset_name)
-    manifest_path = _RAW_DIR / ".manifest.json"
-    manifest = _DownloadManifest.load(manifest_path)
-    manifest.prune()
     download_dataset(config, _RAW_DIR, manifest)
 
 
-def _run_transform_and_validate(dataset_name: str) -> None:
+def _run_transform_and_validate(
+    dataset_name: str, process_workers: int | None = None
+) -> None:
     """Execute transform and validate stages for a single dataset.
 
     Imports the validation pipeline runner which handles XLSX conversion,
-    encoding normalization, column renaming, and schema validation.
+    encoding normalization, column renaming, and schema validation. The
+    stage is skipped when the raw inputs and contract match the last
+    successful run and its validated outputs are still in place.
+
+    Args:
+        dataset_name: Machine-readable dataset identifier.
+        process_workers: Cap on the worker processes validating this
+            dataset's files. None uses one per CPU.
     """
+    from scripts.contracts import CONTRACTS
     from scripts.validate import _run_pipeline as validate_pipeline
 
+    _VALIDATED_CSV_CACHE.pop(dataset_name, None)
     contract = CONTRACTS[dataset_name]
+    fingerprint = _source_fingerprint(dataset_name, repr(contract))
+    if _validated_outputs(dataset_name) == _cached_outputs(dataset_name, fingerprint):
+        logger.info("[%s] Raw inputs unchanged; reusing validated files", dataset_name)
+        return
+
     validate_pipeline(
         dataset_name=dataset_name,
         contract=contract,
         source_dir=_RAW_DIR,
         output_dir=_VALIDATED_DIR,
+        max_workers=process_workers,
     )
+    _VALIDATED_CSV_CACHE.pop(dataset_name, None)
+    _record_validation(dataset_name, fingerprint)
+
+
+# ---- Validation cache --------------------------------------------------------
+
+
+def _validation_record_path(dataset_name: str) -> Path:
+    """Return the path of a dataset's validation cache record."""
+    return _VALIDATED_DIR / ".cache" / f"{dataset_name}.json"
+
+
+def _source_fingerprint(dataset_name: str, contract_repr: str) -> str:
+    """Hash the raw files, code and contract that determine validated output.
+
+    Args:
+        dataset_name: Machine-readable dataset identifier.
+        contract_repr: repr() of the dataset's schema contract.
+
+    Returns:
+        Hex-encoded SHA-256 over the contract, the transform and validate
+        sources, and every raw file's relative path and content digest.
+    """
+    hasher = hashlib.sha256(contract_repr.encode("utf-8"))
+    for source in _PIPELINE_SOURCES:
+        hasher.update(source.read_bytes())
+    raw_dir = _RAW_DIR / _DATASET_SUBDIRS.get(dataset_name, "")
+    if raw_dir.exists():
+        for path in sorted(p for p in raw_dir.rglob("*") if p.is_file()):
+            with path.open("rb") as fh:
+                digest = hashlib.file_digest(fh, "sha256").hexdigest()
+            hasher.update(f"{path.relative_to(raw_dir)}\0{digest}\n".encode())
+    return hasher.hexdigest()
+
+
+def _validated_outputs(dataset_name: str) -> dict[str, list[int]]:
+    """Map each validated CSV (relative to data/validated/) to its size and mtime.
+
+    Values are lists rather than tuples so they compare equal to the
+    JSON-decoded record.
+    """
+    outputs: dict[str, list[int]] = {}
+    for path in _get_validated_csvs(dataset_name):
+        stat = path.stat()
+        outputs[str(path.relative_to(_VALIDATED_DIR))] = [
+            stat.st_size,
+            stat.st_mtime_ns,
+        ]
+    return outputs
+
+
+def _cached_outputs(dataset_name: str, fingerprint: str) -> dict[str, list[int]] | None:
+    """Return the recorded outputs if the record matches this fingerprint."""
+    record_path = _validation_record_path(dataset_name)
+    if not record_path.exists():
+        return None
+    record: dict[str, Any] = json.loads(record_path.read_text(encoding="utf-8"))
+    if record.get("fingerprint") != fingerprint:
+        return None
+    outputs: dict[str, list[int]] = record.get("outputs", {})
+    return outputs or None
+
+
+def _record_validation(dataset_name: str, fingerprint: str) -> None:
+    """Persist the fingerprint and outputs of a successful validation."""
+    outputs = _validated_outputs(dataset_name)
+    if not outputs:
+        return
+    record_path = _validation_record_path(dataset_name)
+    record_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = record_path.with_suffix(".tmp")
+    payload = {"fingerprint": fingerprint, "outputs": outputs}
+    tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    os.replace(tmp_path, record_path)
 
 
 def _run_load(
-    dataset_name: str,
-    connection_manager: SnowflakeConnectionManager,
+    dataset_name: str, conn: SnowflakeConnection, *, pipeline: bool = True
 ) -> MergeResult:
     """Execute the Snowflake load stage with atomic transaction control.
 
-    Opens a dedicated connection, begins a transaction, loads all CSV
-    files via PUT + MERGE, and commits on success or rolls back on
-    failure.
+    The shared connection runs with autocommit off, so the load's first
+    DML opens an implicit transaction; it is committed on success and
+    rolled back on failure, without an explicit BEGIN round-trip.
 
     Args:
         dataset_name: Machine-readable dataset identifier.
-        connection_manager: Pre-configured connection manager.
+        conn: Open Snowflake connection reused across datasets.
+        pipeline: Overlap batched PUTs with COPYs into staging.
 
     Returns:
         MergeResult from the load operation.
@@ -161,6 +302,8 @@ def _run_load(
     Raises:
         LoadError: If any load operation fails (transaction rolled back).
     """
+    from scripts.load import LoadError, get_table_config, load_dataset
+
     csv_files = _get_validated_csvs(dataset_name)
     if not csv_files:
         raise LoadError(
@@ -168,153 +311,300 @@ def _run_load(
             table=get_table_config(dataset_name).table_name,
         )
 
-    with connection_manager as conn:
-        cursor = conn.cursor()
+    try:
+        result = load_dataset(conn, dataset_name, csv_files, pipeline=pipeline)
+        conn.commit()
+    except BaseException:
+        # Any failure, including KeyboardInterrupt or an OSError reading a
+        # CSV, must not leave the transaction open on the shared connection.
+        conn.rollback()
+        raise
+    return result
+
+
+class _LoadSession:
+    """One Snowflake connection shared by every load in a pipeline run.
+
+    The connection opens on the first load, so runs that fail before
+    loading never authenticate, and goes back to the connection pool
+    when the session exits. Stage workers catch load failures before the
+    session exits, so the session remembers the first one and hands it
+    to the manager's ``__exit__``; a connection that saw a failed load
+    is closed rather than pooled.
+    Each dataset still commits or rolls back in its own transaction.
+    """
+
+    def __init__(
+        self, connection_manager: SnowflakeConnectionManager, *, pipeline: bool = True
+    ) -> None:
+        self._manager = connection_manager
+        self._pipeline = pipeline
+        self._conn: SnowflakeConnection | None = None
+        self._failure: BaseException | None = None
+
+    def __enter__(self) -> _LoadSession:
+        """Enter context manager; the connection is opened lazily."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit context manager; release the connection if one was opened."""
+        if exc_val is None and self._failure is not None:
+            exc_val = self._failure
+            exc_type = type(exc_val)
+            exc_tb = exc_val.__traceback__
+        self._manager.__exit__(exc_type, exc_val, exc_tb)
+        self._conn = None
+        self._failure = None
+
+    def load(self, dataset_name: str) -> MergeResult:
+        """Load one dataset over the shared connection."""
+        if self._conn is None:
+            self._conn = self._manager.connect()
         try:
-            cursor.execute("BEGIN")
-            result = load_dataset(conn, dataset_name, csv_files)
-            conn.commit()
-            return result
-        except (LoadError, snowflake.connector.errors.Error):
-            conn.rollback()
+            return _run_load(dataset_name, self._conn, pipeline=self._pipeline)
+        except BaseException as exc:
+            if self._failure is None:
+                self._failure = exc
             raise
-        finally:
-            cursor.close()
 
 
 # ---- Pipeline orchestration --------------------------------------------------
 
 
+@dataclass(slots=True)
+class _Job:
+    """A dataset moving through the stage pipeline.
+
+    Attributes:
+        index: Position in the requested dataset list, for result ordering.
+        dataset_name: Machine-readable dataset identifier.
+        started: perf_counter timestamp when the job was dispatched.
+        finished: perf_counter timestamp when its last stage completed.
+        merge_result: Outcome of the load stage, once it has run.
+        failed_stage: Stage that raised an expected pipeline error, if any.
+        error_message: Description of that failure.
+        crash: Unexpected exception, re-raised once the pipeline drains.
+    """
+
+    index: int
+    dataset_name: str
+    started: float
+    finished: float = 0.0
+    merge_result: MergeResult | None = None
+    failed_stage: PipelineStage | None = None
+    error_message: str = ""
+    crash: Exception | None = None
+
+
+class _StageWorker(threading.Thread):
+    """Persistent worker thread for one pipeline stage.
+
+    Pulls jobs from ``inbox``, runs the stage for jobs that have not
+    already failed upstream, and forwards every job to ``outbox``. A
+    ``None`` sentinel stops the worker. Bounded queues between stages
+    provide backpressure, so a fast stage never runs far ahead of a
+    slow one.
+    """
+
+    def __init__(
+        self,
+        stage: PipelineStage,
+        run_stage: Callable[[str], object],
+        inbox: queue.Queue[_Job | None],
+        outbox: queue.Queue[_Job | None],
+    ) -> None:
+        super().__init__(name=f"ingest-{stage.value.lower()}", daemon=True)
+        self._stage = stage
+        self._run_stage = run_stage
+        self._inbox = inbox
+        self._outbox = outbox
+
+    def run(self) -> None:
+        """Process jobs until the shutdown sentinel arrives."""
+        while (job := self._inbox.get()) is not None:
+            if job.failed_stage is None and job.crash is None:
+                self._process(job)
+            self._outbox.put(job)
+
+    def _process(self, job: _Job) -> None:
+        """Run this stage for one job, recording any failure on the job."""
+        from scripts.download import DownloadError
+        from scripts.load import LoadError, MergeResult
+        from scripts.validate import SchemaValidationError
+
+        logger.info("[%s] Stage: %s", job.dataset_name, self._stage.value)
+        try:
+            outcome = self._run_stage(job.dataset_name)
+        except (DownloadError, SchemaValidationError, LoadError) as exc:
+            logger.error(
+                "FAILED [%s] %s: %s",
+                job.dataset_name,
+                self._stage.value.lower(),
+                exc,
+            )
+            job.failed_stage = self._stage
+            job.error_message = str(exc)
+        except Exception as exc:
+            job.crash = exc
+        else:
+            if isinstance(outcome, MergeResult):
+                job.merge_result = outcome
+        job.finished = time.perf_counter()
+
+
 def run_pipeline(
     datasets: list[str] | None = None,
     skip_download: bool = False,
+    workers: int | None = None,
+    pipeline: bool = True,
 ) -> PipelineResult:
     """Execute the ingestion pipeline for specified datasets.
 
-    Processes each dataset independently through four stages:
-    download, transform, validate, and load. Per-dataset failures
-    are captured without blocking subsequent datasets.
+    Datasets flow through download, transform + validate, and load
+    stages, each served by its own worker threads connected by bounded
+    queues. Downloading one dataset therefore overlaps with validating
+    and loading others. Loads share one Snowflake connection with a
+    transaction per dataset. Per-dataset failures are captured without
+    blocking other datasets.
 
     Args:
         datasets: Specific datasets to process. None processes all.
         skip_download: Skip the download stage (re-process existing files).
+        workers: Worker threads for the download and validate stages.
+            None runs one per dataset.
+        pipeline: Overlap each dataset's batched PUTs with its COPYs
+            into staging; disable to diagnose load issues.
 
     Returns:
-        PipelineResult with per-dataset outcomes and aggregate metrics.
+        PipelineResult with per-dataset outcomes (in input order) and
+        aggregate metrics.
     """
-    pipeline_start = time.monotonic()
-    dataset_names = datasets or [d.name for d in DATASETS]
-    connection_manager = SnowflakeConnectionManager()
+    from scripts.download import DownloadManifest
+    from scripts.load import DatasetStatus, PipelineStage, SnowflakeConnectionManager
 
-    results: list[DatasetResult] = []
-    all_success = True
-
-    for name in dataset_names:
-        dataset_start = time.monotonic()
-        logger.info("Processing dataset: %s", name)
+    pipeline_start = time.perf_counter()
+    dataset_names = datasets or [d.name for d in DATASETS]
+    pool_size = workers or len(dataset_names)
 
-        try:
-            _process_single_dataset(
-                name,
-                connection_manager,
-                skip_download,
-            )
-        except DownloadError as exc:
-            elapsed = time.monotonic() - dataset_start
-            results.append(
-                DatasetResult(
-                    dataset_name=name,
-                    stage=PipelineStage.DOWNLOAD,
-                    rows_loaded=0,
-                    elapsed_seconds=round(elapsed, 3),
-                    status=DatasetStatus.FAILED,
-                    error_message=str(exc),
-                )
-            )
-            all_success = False
-            logger.error("FAILED [%s] download: %s", name, exc)
-            continue
-        except SchemaValidationError as exc:
-            elapsed = time.monotonic() - dataset_start
-            results.append(
-                DatasetResult(
-                    dataset_name=name,
-                    stage=PipelineStage.VALIDATE,
-                    rows_loaded=0,
-                    elapsed_seconds=round(elapsed, 3),
-                    status=DatasetStatus.FAILED,
-                    error_message=str(exc),
-                )
-            )
-            all_success = False
-            logger.error("FAILED [%s] validation: %s", name, exc)
-            continue
-        except LoadError as exc:
-            elapsed = time.monotonic() - dataset_start
-            results.append(
-                DatasetResult(
-                    dataset_name=name,
-                    stage=PipelineStage.LOAD,
-                    rows_loaded=0,
-                    elapsed_seconds=round(elapsed, 3),
-                    status=DatasetStatus.FAILED,
-                    error_message=str(exc),
-                )
-            )
-            all_success = False
-            logger.error("FAILED [%s] load: %s", name, exc)
-            continue
-
-        elapsed = time.monotonic() - dataset_start
-        csv_count = len(_get_validated_csvs(name))
-        results.append(
-            DatasetResult(
-                dataset_name=name,
-                stage=PipelineStage.LOAD,
-                rows_loaded=csv_count,
-                elapsed_seconds=round(elapsed, 3),
-                status=DatasetStatus.SUCCESS,
-            )
+    stages: list[tuple[PipelineStage, Callable[[], Callable[[str], object]]]] = []
+    if not skip_download:
+        # Loaded and pruned once per run; downloads record into this object.
+        manifest = DownloadManifest.load(_RAW_DIR / ".manifest.json")
+        if manifest.prune():
+            manifest.save()
+        stages.append(
+            (PipelineStage.DOWNLOAD, lambda: partial(_run_download, manifest=manifest))
+        )
+    # Validate threads each run a process pool; split the CPUs between them
+    # rather than starting a full pool per thread.
+    process_workers = max(1, (os.cpu_count() or 1) // pool_size)
+    stages.append(
+        (
+            PipelineStage.VALIDATE,
+            lambda: partial(
+                _run_transform_and_validate, process_workers=process_workers
+            ),
         )
-        logger.info("SUCCESS [%s] in %.1fs", name, elapsed)
+    )
+    session = _LoadSession(
+        SnowflakeConnectionManager(autocommit=False), pipeline=pipeline
+    )
+    stages.append((PipelineStage.LOAD, lambda: session.load))
+
+    queues: list[queue.Queue[_Job | None]] = [
+        queue.Queue(maxsize=_STAGE_QUEUE_DEPTH) for _ in stages
+    ]
+    queues.append(queue.Queue())
+    # A single load worker owns the shared connection; the other stages
+    # scale out to the pool size.
+    pools = [
+        [
+            _StageWorker(stage, make_runner(), queues[i], queues[i + 1])
+            for _ in range(1 if stage is PipelineStage.LOAD else pool_size)
+        ]
+        for i, (stage, make_runner) in enumerate(stages)
+    ]
+
+    with session:
+        for pool in pools:
+            for worker in pool:
+                worker.start()
+
+        for index, name in enumerate(dataset_names):
+            logger.info("Processing dataset: %s", name)
+            queues[0].put(
+                _Job(index=index, dataset_name=name, started=time.perf_counter())
+            )
+        # Stop each stage only after the one feeding it has drained.
+        for inbox, pool in zip(queues, pools, strict=False):
+            for _ in pool:
+                inbox.put(None)
+            for worker in pool:
+                worker.join()
+
+    jobs = _drain(queues[-1])
+    for job in jobs:
+        if job.crash is not None:
+            raise job.crash
 
-    total_rows = sum(r.rows_loaded for r in results)
-    pipeline_elapsed = time.monotonic() - pipeline_start
+    results: list[DatasetResult] = []
+    total_rows = 0
+    all_success = True
+    for job in jobs:
+        result = _job_result(job)
+        results.append(result)
+        total_rows += result.rows_loaded
+        all_success = all_success and result.status == DatasetStatus.SUCCESS
+    pipeline_elapsed = time.perf_counter() - pipeline_start
 
     return PipelineResult(
-        datasets_processed=results,
+        datasets_processed=tuple(results),
         total_rows_loaded=total_rows,
         total_elapsed_seconds=round(pipeline_elapsed, 3),
         success=all_success,
     )
 
 
-def _process_single_dataset(
-    dataset_name: str,
-    connection_manager: SnowflakeConnectionManager,
-    skip_download: bool,
-) -> None:
-    """Run all pipeline stages for a single dataset.
-
-    Args:
-        dataset_name: Machine-readable dataset identifier.
-        connection_manager: Pre-configured connection manager.
-        skip_download: Skip the download stage.
-
-    Raises:
-        DownloadError: If download fails.
-        SchemaValidationError: If validation fails.
-        LoadError: If Snowflake load fails.
-    """
-    if not skip_download:
-        logger.info("[%s] Stage: DOWNLOAD", dataset_name)
-        _run_download(dataset_name)
-
-    logger.info("[%s] Stage: TRANSFORM + VALIDATE", dataset_name)
-    _run_transform_and_validate(dataset_name)
+def _drain(done: queue.Queue[_Job | None]) -> list[_Job]:
+    """Collect finished jobs from the final queue in dispatch order."""
+    jobs: list[_Job] = []
+    while not done.empty():
+        job = done.get_nowait()
+        if job is not None:
+            jobs.append(job)
+    return sorted(jobs, key=attrgetter("index"))
+
+
+def _job_result(job: _Job) -> DatasetResult:
+    """Convert a finished job into its DatasetResult."""
+    from scripts.load import DatasetStatus, PipelineStage
+
+    elapsed = round(job.finished - job.started, 3)
+    if job.failed_stage is not None:
+        return DatasetResult(
+            dataset_name=job.dataset_name,
+            stage=job.failed_stage,
+            rows_loaded=0,
+            elapsed_seconds=elapsed,
+            status=DatasetStatus.FAILED,
+            error_message=job.error_message,
+        )
 
-    logger.info("[%s] Stage: LOAD", dataset_name)
-    _run_load(dataset_name, connection_manager)
+    merge = job.merge_result
+    rows_loaded = merge.rows_inserted + merge.rows_updated if merge else 0
+    logger.info("SUCCESS [%s] in %.1fs", job.dataset_name, elapsed)
+    return DatasetResult(
+        dataset_name=job.dataset_name,
+        stage=PipelineStage.LOAD,
+        rows_loaded=rows_loaded,
+        elapsed_seconds=elapsed,
+        status=DatasetStatus.SUCCESS,
+    )
 
 
 # ---- CLI ---------------------------------------------------------------------
@@ -342,6 +632,18 @@ def _build_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Skip download stage; re-process already-downloaded files.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Download/validate worker threads (default: one per dataset).",
+    )
+    parser.add_argument(
+        "--no-pipeline",
+        dest="pipeline",
+        action="store_false",
+        help="Upload all files before COPY instead of overlapping the two.",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -351,30 +653,31 @@ def _build_arg_parser() -> argparse.ArgumentParser:
 
 
 def _print_summary(result: PipelineResult) -> None:
-    """Print structured execution summary to stdout."""
-    header = f"{'Dataset':<30} {'Stage':<12} {'Status':<10} {'Rows':<10} {'Time (s)'}"
-    print(f"\n{'=' * 80}")
-    print("Pipeline Execution Summary")
-    print(f"{'=' * 80}")
-    print(header)
-    print("-" * 80)
-
-    for ds in result.datasets_processed:
-        print(
-            f"{ds.dataset_name:<30} "
-            f"{ds.stage.value:<12} "
-            f"{ds.status.value:<10} "
-            f"{ds.rows_loaded:<10} "
-            f"{ds.elapsed_seconds:.1f}"
-        )
+    """Print structured execution summary to stdout.
 
-    print("-" * 80)
-    print(
+    The summary is written in one call so it is not interleaved with log
+    output from other threads.
+    """
+    rule = "=" * 80
+    divider = "-" * 80
+    header = f"{'Dataset':<30} {'Stage':<12} {'Status':<10} {'Rows':<10} {'Time (s)'}"
+    lines = ["", rule, "Pipeline Execution Summary", rule, header, divider]
+    lines.extend(
+        f"{ds.dataset_name:<30} "
+        f"{ds.stage.value:<12} "
+        f"{ds.status.value:<10} "
+        f"{ds.rows_loaded:<10} "
+        f"{ds.elapsed_seconds:.1f}"
+        for ds in result.datasets_processed
+    )
+    lines.append(divider)
+    lines.append(
         f"Total rows: {result.total_rows_loaded}  "
         f"Elapsed: {result.total_elapsed_seconds:.1f}s  "
         f"Result: {'SUCCESS' if result.success else 'FAILED'}"
     )
-    print(f"{'=' * 80}\n")
+    lines.extend((rule, ""))
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -389,26 +692,46 @@ def main(argv: list[str] | None = None) -> int:
     parser = _build_arg_parser()
     args: argparse.Namespace = parser.parse_args(argv)
 
-    level = logging.DEBUG if args.verbose else logging.INFO
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        datefmt="%Y-%m-%dT%H:%M:%S",
-        stream=sys.stderr,
-    )
-
     if not args.run_all and args.dataset is None:
         parser.error("Specify --all or --dataset <name>")
         return 1
 
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+        return 1
+
     dataset_list: list[str] | None = None
     if args.dataset is not None:
         dataset_list = [args.dataset]
 
-    result = run_pipeline(
-        datasets=dataset_list,
-        skip_download=args.skip_download,
+    # Stage workers only enqueue log records; a single listener thread
+    # formats and writes them, so workers never contend on stderr.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(
+        logging.Formatter(
+            fmt="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+            datefmt="%Y-%m-%dT%H:%M:%S",
+        )
     )
+    queue_handler = QueueHandler(log_queue)
+    # Leave full formatting to the listener's handler.
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        handlers=[queue_handler],
+    )
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    try:
+        result = run_pipeline(
+            datasets=dataset_list,
+            skip_download=args.skip_download,
+            workers=args.workers,
+            pipeline=args.pipeline,
+        )
+    finally:
+        listener.stop()
 
     _print_summary(result)
     return 0 if result.success else 1
@@ -8,17 +8,33 @@ upserts using natural keys defined in DESIGN-DOC.md Section 6.4.
 
 from __future__ import annotations
 
+import atexit
 import enum
+import functools
+import gzip
 import logging
+import os
+import queue
+import re
+import shutil
+import tempfile
+import threading
 import time
 import tomllib
-from dataclasses import dataclass
+import weakref
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Final
+from typing import TYPE_CHECKING, Any, BinaryIO, Final, NamedTuple
 
 import snowflake.connector
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+    from concurrent.futures import Future
+
     from snowflake.connector import SnowflakeConnection
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
@@ -30,10 +46,56 @@ _DEFAULT_WAREHOUSE: Final[str] = "TRANSFORM_WH"
 _DEFAULT_DATABASE: Final[str] = "TORONTO_MOBILITY"
 _DEFAULT_SCHEMA: Final[str] = "RAW"
 _STAGE_PATH: Final[str] = "@TORONTO_MOBILITY.RAW.INGESTION_STAGE"
+# Named file format created by setup/create_ingestion_stage.sql.
+_FILE_FORMAT: Final[str] = "TORONTO_MOBILITY.RAW.CSV_DEFAULT"
+# Only staged CSVs (gzipped by PUT) directly under the COPY's stage path are
+# picked up. COPY matches PATTERN against the whole stage-relative path, so
+# _copy_sql prefixes the escaped path itself; [^/]* keeps a COPY from
+# {prefix}/ out of leftover {prefix}/batch_NNNN/ directories.
+_STAGED_FILE_PATTERN: Final[str] = "[^/]*[.]csv([.]gz)?"
 
 _LOGIN_TIMEOUT: Final[int] = 30
 _NETWORK_TIMEOUT: Final[int] = 60
 
+# Error raised when a multi-statement request exceeds the session's
+# MULTI_STATEMENT_COUNT: "000008 (0A000): Actual statement count 3 did not
+# match the desired statement count 1." The errno is not always populated
+# on the connector exception, so the message text is matched as well.
+_MULTI_STATEMENT_DISABLED_ERRNO: Final[int] = 8
+_MULTI_STATEMENT_DISABLED_MESSAGE: Final[re.Pattern[str]] = re.compile(
+    r"Actual statement count \d+ did not match the desired statement count \d+"
+)
+
+# Unquoted Snowflake identifiers; anything else is rejected before it can
+# reach an f-string SQL statement.
+_IDENTIFIER_PATTERN: Final[re.Pattern[str]] = re.compile(r"[A-Za-z_][A-Za-z0-9_$]*")
+
+# Idle connections kept per distinct session configuration.
+_POOL_MAX_SIZE: Final[int] = 4
+
+# Upload threads the connector uses for a multi-file PUT.
+_PUT_PARALLEL: Final[int] = 8
+
+# Files are gzipped client-side at a fast level on _PUT_PARALLEL threads
+# rather than by the connector's AUTO_COMPRESS, which uses level 9.
+_GZIP_LEVEL: Final[int] = 1
+_GZIP_BUFFER_BYTES: Final[int] = 1024 * 1024
+
+# CSVs larger than this are split into chunks of about this size before
+# PUT so they upload in parallel and COPY can scan them concurrently.
+_SPLIT_THRESHOLD_BYTES: Final[int] = 100 * 1024 * 1024
+_SPLIT_BLOCK_BYTES: Final[int] = 8 * 1024 * 1024
+
+# Datasets staged as more files than this are uploaded in batches of this
+# many, each batch's COPY into staging overlapping the next batch's PUT.
+_PIPELINE_BATCH_FILES: Final[int] = 4
+
+# Interval between status checks of the staging prepare submitted with
+# execute_async while the dataset's PUTs run.
+_ASYNC_POLL_SECONDS: Final[float] = 0.05
+# A prepare still running after this long is cancelled and fails the load.
+_ASYNC_PREPARE_TIMEOUT_SECONDS: Final[float] = 300.0
+
 
 # ---- Exceptions -------------------------------------------------------------
 
@@ -77,6 +139,13 @@ class PipelineStage(enum.Enum):
     LOAD = "LOAD"
 
 
+class MergeStrategy(enum.Enum):
+    """How staged rows are upserted into a RAW table."""
+
+    MERGE = "MERGE"
+    DELETE_INSERT = "DELETE_INSERT"
+
+
 class DatasetStatus(enum.Enum):
     """Outcome status for a single dataset in the pipeline."""
 
@@ -120,6 +189,8 @@ class CopyResult:
         errors_seen: Number of row-level errors encountered.
         first_error: Description of the first error, if any.
         elapsed_seconds: Wall-clock time for the COPY INTO.
+        files_loaded: Staged files loaded; removed from the stage when
+            the COPY ran with PURGE = TRUE.
     """
 
     table_name: str
@@ -128,6 +199,7 @@ class CopyResult:
     errors_seen: int
     first_error: str | None
     elapsed_seconds: float
+    files_loaded: tuple[str, ...] = ()
 
 
 @dataclass(frozen=True, slots=True)
@@ -147,6 +219,35 @@ class MergeResult:
     elapsed_seconds: float
 
 
+class _PutResultRow(NamedTuple):
+    """One PUT result row, in the connector's column order."""
+
+    source: str
+    target: str
+    source_size: int
+    target_size: int
+    source_compression: str
+    target_compression: str
+    status: str
+    message: str
+
+
+class _CopyResultRow(NamedTuple):
+    """Leading columns of one COPY INTO result row."""
+
+    file: str
+    status: str
+    rows_parsed: int
+    rows_loaded: int
+    error_limit: int
+    errors_seen: int
+    first_error: str | None
+
+
+_PUT_ROW_WIDTH: Final[int] = len(_PutResultRow._fields)
+_COPY_ROW_WIDTH: Final[int] = len(_CopyResultRow._fields)
+
+
 # ---- Table configuration registry -------------------------------------------
 
 
@@ -159,12 +260,33 @@ class TableConfig:
         columns: Snowflake column names in CSV positional order.
         natural_keys: Columns forming the natural key for MERGE dedup.
         stage_prefix: Subdirectory within the internal stage.
+        merge_strategy: MERGE for general upserts; DELETE_INSERT for
+            append-dominant tables keyed by a single column.
     """
 
     table_name: str
     columns: tuple[str, ...]
     natural_keys: tuple[str, ...]
     stage_prefix: str
+    merge_strategy: MergeStrategy = MergeStrategy.MERGE
+
+    def __post_init__(self) -> None:
+        """Validate identifiers once so SQL builders can interpolate them."""
+        _check_identifiers(self.table_name.split("."))
+        _check_identifiers(self.columns)
+        _check_identifiers(self.natural_keys)
+        missing = set(self.natural_keys) - set(self.columns)
+        if missing:
+            msg = f"Natural keys {sorted(missing)} not in {self.table_name} columns"
+            raise ValueError(msg)
+
+
+def _check_identifiers(names: Iterable[str]) -> None:
+    """Raise ValueError unless every name is a plain Snowflake identifier."""
+    for name in names:
+        if not _IDENTIFIER_PATTERN.fullmatch(name):
+            msg = f"Invalid Snowflake identifier: {name!r}"
+            raise ValueError(msg)
 
 
 TABLE_CONFIGS: Final[dict[str, TableConfig]] = {
@@ -246,6 +368,7 @@ TABLE_CONFIGS: Final[dict[str, TableConfig]] = {
         ),
         natural_keys=("TRIP_ID",),
         stage_prefix="bike_share",
+        merge_strategy=MergeStrategy.DELETE_INSERT,
     ),
     "weather_daily": TableConfig(
         table_name="TORONTO_MOBILITY.RAW.WEATHER_DAILY",
@@ -284,6 +407,7 @@ TABLE_CONFIGS: Final[dict[str, TableConfig]] = {
         ),
         natural_keys=("DATE_TIME",),
         stage_prefix="weather",
+        merge_strategy=MergeStrategy.DELETE_INSERT,
     ),
 }
 
@@ -307,8 +431,204 @@ def get_table_config(dataset_name: str) -> TableConfig:
     return config
 
 
+# ---- Timing ------------------------------------------------------------------
+
+
+@contextmanager
+def _timed() -> Iterator[Callable[[], float]]:
+    """Yield a callable returning seconds elapsed since the block began."""
+    start = time.perf_counter_ns()
+    yield lambda: (time.perf_counter_ns() - start) / 1e9
+
+
+# ---- SQL fragments -----------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class _SqlFragments:
+    """Column-derived SQL snippets for COPY INTO and MERGE statements.
+
+    Attributes:
+        cols: Comma-separated target column list.
+        on_clause: MERGE join condition over the natural keys.
+        partition_cols: Natural keys for the staging dedup window.
+        order_col: Column ordering rows within a dedup partition.
+        merge_actions: WHEN MATCHED / WHEN NOT MATCHED clauses.
+    """
+
+    cols: str
+    on_clause: str
+    partition_cols: str
+    order_col: str
+    merge_actions: str
+
+
+def _build_fragments(
+    columns: tuple[str, ...], natural_keys: tuple[str, ...]
+) -> _SqlFragments:
+    """Render the SQL fragments for one column layout."""
+    _check_identifiers(columns)
+    _check_identifiers(natural_keys)
+    key_set = frozenset(natural_keys)
+    non_key_cols = [c for c in columns if c not in key_set]
+    update_set = ", ".join(f"target.{c} = staging.{c}" for c in non_key_cols)
+    insert_cols = ", ".join(columns)
+    insert_vals = ", ".join(f"staging.{c}" for c in columns)
+
+    merge_actions = ""
+    if update_set:
+        merge_actions += f" WHEN MATCHED THEN UPDATE SET {update_set}"
+    merge_actions += (
+        f" WHEN NOT MATCHED THEN INSERT ({insert_cols}) VALUES ({insert_vals})"
+    )
+
+    return _SqlFragments(
+        cols=", ".join(columns),
+        on_clause=" AND ".join(f"target.{k} = staging.{k}" for k in natural_keys),
+        partition_cols=", ".join(natural_keys),
+        order_col=natural_keys[0] if natural_keys else "",
+        merge_actions=merge_actions,
+    )
+
+
+# Rendered once at import for every configured table, keyed by layout.
+_SQL_FRAGMENTS: Final[dict[tuple[tuple[str, ...], tuple[str, ...]], _SqlFragments]] = {
+    (cfg.columns, cfg.natural_keys): _build_fragments(cfg.columns, cfg.natural_keys)
+    for cfg in TABLE_CONFIGS.values()
+}
+
+
+def _fragments_for(
+    columns: list[str] | tuple[str, ...],
+    natural_keys: list[str] | tuple[str, ...] = (),
+) -> _SqlFragments:
+    """Return precomputed fragments for a layout, rendering unknown ones."""
+    key = (tuple(columns), tuple(natural_keys))
+    fragments = _SQL_FRAGMENTS.get(key)
+    if fragments is None:
+        fragments = _build_fragments(*key)
+    return fragments
+
+
 # ---- Connection manager (S002) ----------------------------------------------
 
+_PoolKey = tuple[str, str, str, str, str, str, bool]
+
+
+class _ConnectionPool:
+    """Bounded pool of idle Snowflake connections.
+
+    Connections are grouped by session configuration (account, user,
+    role, warehouse, database, schema, autocommit) so a checked-out
+    connection always matches the settings its caller asked for.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._idle: dict[_PoolKey, queue.Queue[SnowflakeConnection]] = {}
+
+    def _queue_for(self, key: _PoolKey) -> queue.Queue[SnowflakeConnection]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle is None:
+                idle = queue.Queue(maxsize=self._max_size)
+                self._idle[key] = idle
+            return idle
+
+    def acquire(self, key: _PoolKey) -> SnowflakeConnection | None:
+        """Check out a live idle connection, or None if none is available.
+
+        Stale connections found while searching are closed and dropped.
+        """
+        idle = self._queue_for(key)
+        while True:
+            try:
+                conn = idle.get_nowait()
+            except queue.Empty:
+                return None
+            if _is_alive(conn):
+                return conn
+            _close_quietly(conn)
+
+    def release(self, key: _PoolKey, conn: SnowflakeConnection) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        if conn.is_closed():
+            return
+        try:
+            self._queue_for(key).put_nowait(conn)
+        except queue.Full:
+            _close_quietly(conn)
+
+    def shutdown(self) -> None:
+        """Close every idle connection and empty the pool."""
+        with self._lock:
+            queues = list(self._idle.values())
+            self._idle.clear()
+        for idle in queues:
+            while True:
+                try:
+                    conn = idle.get_nowait()
+                except queue.Empty:
+                    break
+                _close_quietly(conn)
+
+
+def _is_alive(conn: SnowflakeConnection) -> bool:
+    """Return True if a pooled connection still answers a trivial query."""
+    if conn.is_closed():
+        return False
+    try:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT 1")
+        finally:
+            cursor.close()
+    except snowflake.connector.errors.Error:
+        return False
+    return True
+
+
+def _close_quietly(conn: SnowflakeConnection) -> None:
+    """Close a connection, ignoring errors from an already-dead session."""
+    try:
+        conn.close()
+    except snowflake.connector.errors.Error:
+        logger.debug("Ignoring error while closing Snowflake connection")
+
+
+_POOL: Final[_ConnectionPool] = _ConnectionPool(_POOL_MAX_SIZE)
+atexit.register(_POOL.shutdown)
+
+
+@dataclass(frozen=True, slots=True)
+class _Credentials:
+    """Resolved Snowflake login; the password is left out of the repr."""
+
+    account: str
+    user: str
+    password: str = field(repr=False)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_toml_loader_section(toml_path: Path, mtime_ns: int) -> dict[str, str]:
+    """Parse the ``[loader]`` section of a Snowflake connections.toml.
+
+    Cached on the file's path and modification time, so the file is
+    re-read only after it changes.
+
+    Args:
+        toml_path: Path to connections.toml.
+        mtime_ns: Modification time of the file, used as a cache key.
+
+    Returns:
+        The loader section's values as strings.
+    """
+    with toml_path.open("rb") as fh:
+        config = tomllib.load(fh)
+    loader = config.get("loader", {})
+    return {str(k): str(v) for k, v in loader.items()}
+
 
 class SnowflakeConnectionManager:
     """Manage Snowflake connections with layered credential resolution.
@@ -319,8 +639,13 @@ class SnowflakeConnectionManager:
          SNOWFLAKE_PASSWORD)
       3. ``~/.snowflake/connections.toml`` ``[loader]`` section
 
-    Implements the context manager protocol to guarantee connection
-    cleanup on scope exit.
+    Connections come from a process-wide pool: ``connect()`` reuses an
+    idle session with matching settings when one is still alive, and
+    exiting the context manager returns the connection to the pool
+    instead of closing it, so repeated loads skip re-authentication.
+    Idle connections are closed by ``shutdown_pool()``, which also runs
+    at interpreter exit. Pass ``autocommit=False`` for sessions whose
+    DML should open implicit transactions committed by the caller.
     """
 
     def __init__(
@@ -333,6 +658,7 @@ class SnowflakeConnectionManager:
         warehouse: str = _DEFAULT_WAREHOUSE,
         database: str = _DEFAULT_DATABASE,
         schema: str = _DEFAULT_SCHEMA,
+        autocommit: bool = True,
     ) -> None:
         self._account = account
         self._user = user
@@ -341,33 +667,39 @@ class SnowflakeConnectionManager:
         self._warehouse = warehouse
         self._database = database
         self._schema = schema
+        self._autocommit = autocommit
         self._connection: SnowflakeConnection | None = None
+        self._pool_key: _PoolKey | None = None
+        self._credentials: _Credentials | None = None
 
-    def _resolve_credentials(self) -> dict[str, str]:
-        """Resolve Snowflake credentials from available sources."""
-        import os
+    def _resolve_credentials(self) -> _Credentials:
+        """Resolve Snowflake credentials from available sources.
+
+        The result is kept on the manager, so later ``connect()`` calls
+        skip the environment and connections.toml lookups.
+        """
+        if self._credentials is not None:
+            return self._credentials
 
         account = self._account or os.environ.get("SNOWFLAKE_ACCOUNT", "")
         user = self._user or os.environ.get("SNOWFLAKE_USER", "")
         password = self._password or os.environ.get("SNOWFLAKE_PASSWORD", "")
 
+        if not (account and user and password):
+            toml_path = Path.home() / ".snowflake" / "connections.toml"
+            try:
+                mtime_ns = toml_path.stat().st_mtime_ns
+            except OSError:
+                loader: dict[str, str] = {}
+            else:
+                loader = _load_toml_loader_section(toml_path, mtime_ns)
+            account = account or loader.get("account", "")
+            user = user or loader.get("user", "")
+            password = password or loader.get("password", "")
+
         if account and user and password:
-            return {"account": account, "user": user, "password": password}
-
-        toml_path = Path.home() / ".snowflake" / "connections.toml"
-        if toml_path.exists():
-            with toml_path.open("rb") as fh:
-                config = tomllib.load(fh)
-            loader = config.get("loader", {})
-            account = account or str(loader.get("account", ""))
-            user = user or str(loader.get("user", ""))
-            password = password or str(loader.get("password", ""))
-            if account and user and password:
-                return {
-                    "account": account,
-                    "user": user,
-                    "password": password,
-                }
+            self._credentials = _Credentials(account, user, password)
+            return self._credentials
 
         raise LoadError(
             "Snowflake credentials not found. Set SNOWFLAKE_ACCOUNT, "
@@ -376,7 +708,7 @@ class SnowflakeConnectionManager:
         )
 
     def connect(self) -> SnowflakeConnection:
-        """Establish an authenticated Snowflake connection.
+        """Check out a pooled connection or establish a new one.
 
         Returns:
             Active SnowflakeConnection scoped to LOADER_ROLE.
@@ -385,15 +717,30 @@ class SnowflakeConnectionManager:
             LoadError: On authentication or network failure.
         """
         credentials = self._resolve_credentials()
+        key: _PoolKey = (
+            credentials.account,
+            credentials.user,
+            self._role,
+            self._warehouse,
+            self._database,
+            self._schema,
+            self._autocommit,
+        )
+        self._pool_key = key
+        pooled = _POOL.acquire(key)
+        if pooled is not None:
+            self._connection = pooled
+            return pooled
         try:
             conn: SnowflakeConnection = snowflake.connector.connect(
-                account=credentials["account"],
-                user=credentials["user"],
-                password=credentials["password"],
+                account=credentials.account,
+                user=credentials.user,
+                password=credentials.password,
                 role=self._role,
                 warehouse=self._warehouse,
                 database=self._database,
                 schema=self._schema,
+                autocommit=self._autocommit,
                 client_session_keep_alive=True,
                 login_timeout=_LOGIN_TIMEOUT,
                 network_timeout=_NETWORK_TIMEOUT,
@@ -417,10 +764,24 @@ class SnowflakeConnectionManager:
         exc_val: BaseException | None,
         exc_tb: Any,
     ) -> None:
-        """Exit context manager; close connection unconditionally."""
-        if self._connection is not None:
-            self._connection.close()
-            self._connection = None
+        """Exit context manager; return the connection to the pool.
+
+        The connection is closed instead when the block raised, since
+        its session state is then unknown.
+        """
+        conn = self._connection
+        if conn is None:
+            return
+        self._connection = None
+        if exc_type is None and self._pool_key is not None:
+            _POOL.release(self._pool_key, conn)
+        else:
+            _close_quietly(conn)
+
+    @staticmethod
+    def shutdown_pool() -> None:
+        """Close every idle pooled connection."""
+        _POOL.shutdown()
 
 
 # ---- Stage upload (S003) -----------------------------------------------------
@@ -444,37 +805,34 @@ def upload_to_stage(
     Raises:
         LoadError: If the PUT command fails.
     """
-    start = time.monotonic()
-    source_size = local_path.stat().st_size
+    with _timed() as timer:
+        source_size = local_path.stat().st_size
 
-    put_sql = (
-        f"PUT 'file://{local_path}' "
-        f"'{_STAGE_PATH}/{stage_path}' "
-        f"AUTO_COMPRESS=TRUE OVERWRITE=TRUE"
-    )
+        put_sql = (
+            f"PUT 'file://{local_path}' "
+            f"'{_STAGE_PATH}/{stage_path}' "
+            f"AUTO_COMPRESS=TRUE OVERWRITE=TRUE"
+        )
 
-    cursor = connection.cursor()
-    try:
-        cursor.execute(put_sql)
-        results = list(cursor.fetchall())
-    except snowflake.connector.errors.Error as exc:
-        raise LoadError(
-            f"PUT failed for {local_path}: {getattr(exc, 'msg', str(exc))}",
-            file_path=str(local_path),
-        ) from exc
-    finally:
-        cursor.close()
+        cursor = connection.cursor()
+        try:
+            cursor.execute(put_sql)
+            # A single-file PUT reports exactly one result row.
+            row = cursor.fetchone()
+        except snowflake.connector.errors.Error as exc:
+            raise LoadError(
+                f"PUT failed for {local_path}: {getattr(exc, 'msg', str(exc))}",
+                file_path=str(local_path),
+            ) from exc
+        finally:
+            cursor.close()
 
-    elapsed = time.monotonic() - start
+    elapsed = timer()
 
     status = StageUploadStatus.UPLOADED
     dest_size = 0
-    if results:
-        row = tuple(results[0])
-        status_str = str(row[6]).upper() if len(row) > 6 else ""
-        if status_str == "SKIPPED":
-            status = StageUploadStatus.SKIPPED
-        dest_size = int(row[3]) if len(row) > 3 and row[3] else 0
+    if row:
+        status, dest_size = _parse_put_row(_PutResultRow._make(row[:_PUT_ROW_WIDTH]))
 
     logger.info(
         "PUT %s -> %s/%s [%s, %.1fs]",
@@ -491,10 +849,216 @@ def upload_to_stage(
         status=status,
         source_size_bytes=source_size,
         dest_size_bytes=dest_size,
-        elapsed_seconds=round(elapsed, 3),
+        elapsed_seconds=elapsed,
     )
 
 
+def upload_files_to_stage(
+    connection: SnowflakeConnection,
+    local_paths: list[Path],
+    stage_path: str,
+) -> list[StageUploadResult]:
+    """Upload several local files to one stage directory with a single PUT.
+
+    The files are gzipped at a fast compression level into a temporary
+    directory on ``_PUT_PARALLEL`` threads and uploaded with one wildcard
+    PUT, which the connector spreads across the same number of threads.
+    Staged names keep the ``.csv.gz`` form AUTO_COMPRESS would produce;
+    files sharing a base name (e.g. from different year directories) are
+    staged as ``NNNN_<name>`` by list position so none overwrites another.
+
+    Args:
+        connection: Active Snowflake connection.
+        local_paths: Files to upload.
+        stage_path: Relative destination directory within the stage.
+
+    Returns:
+        One StageUploadResult per file reported by the PUT.
+
+    Raises:
+        LoadError: If the PUT command fails.
+    """
+    with _timed() as timer:
+        by_name = {f"{name}.gz": path for name, path in _staged_names(local_paths)}
+
+        with tempfile.TemporaryDirectory(prefix="put_") as tmp:
+            tmp_dir = Path(tmp)
+            with ThreadPoolExecutor(max_workers=_PUT_PARALLEL) as pool:
+                list(
+                    pool.map(
+                        _gzip_file,
+                        by_name.values(),
+                        [tmp_dir / name for name in by_name],
+                    )
+                )
+
+            put_sql = (
+                f"PUT 'file://{tmp_dir}/*' "
+                f"'{_STAGE_PATH}/{stage_path}' "
+                f"PARALLEL={_PUT_PARALLEL} AUTO_COMPRESS=FALSE "
+                f"SOURCE_COMPRESSION=GZIP OVERWRITE=TRUE"
+            )
+
+            cursor = connection.cursor()
+            try:
+                cursor.execute(put_sql)
+                put_rows = [
+                    _PutResultRow._make(raw_row[:_PUT_ROW_WIDTH]) for raw_row in cursor
+                ]
+            except snowflake.connector.errors.Error as exc:
+                raise LoadError(
+                    f"PUT failed for {stage_path}: {getattr(exc, 'msg', str(exc))}",
+                    file_path=stage_path,
+                ) from exc
+            finally:
+                cursor.close()
+
+    elapsed = timer()
+
+    uploads: list[StageUploadResult] = []
+    for row in put_rows:
+        local_path = by_name.get(row.source)
+        if local_path is None:
+            continue
+        status, dest_size = _parse_put_row(row)
+        uploads.append(
+            StageUploadResult(
+                local_path=local_path,
+                stage_path=f"{stage_path}{row.source.removesuffix('.gz')}",
+                status=status,
+                source_size_bytes=local_path.stat().st_size,
+                dest_size_bytes=dest_size,
+                elapsed_seconds=elapsed,
+            )
+        )
+
+    # One aggregate line per PUT; the byte total is only summed when shown.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "PUT %d files -> %s/%s (%d bytes compressed) [%.1fs]",
+            len(uploads),
+            _STAGE_PATH,
+            stage_path,
+            sum(upload.dest_size_bytes for upload in uploads),
+            elapsed,
+        )
+    return uploads
+
+
+def _staged_names(local_paths: list[Path]) -> list[tuple[str, Path]]:
+    """Pair each file with a stage name unique within one PUT.
+
+    Base names are kept unless two files share one; those are prefixed
+    with their list position.
+    """
+    counts = Counter(path.name for path in local_paths)
+    return [
+        (path.name if counts[path.name] == 1 else f"{i:04d}_{path.name}", path)
+        for i, path in enumerate(local_paths)
+    ]
+
+
+def _gzip_file(source: Path, dest: Path) -> None:
+    """Gzip ``source`` to ``dest`` at ``_GZIP_LEVEL``.
+
+    zlib releases the GIL while compressing, so calls scale across threads.
+    """
+    with (
+        source.open("rb") as src,
+        gzip.open(dest, "wb", compresslevel=_GZIP_LEVEL) as dst,
+    ):
+        shutil.copyfileobj(src, dst, _GZIP_BUFFER_BYTES)
+
+
+def _split_csv(
+    path: Path,
+    out_dir: Path,
+    target_bytes: int = _SPLIT_THRESHOLD_BYTES,
+) -> list[Path]:
+    """Split a CSV into header-prefixed chunks of roughly target_bytes.
+
+    Copies raw byte blocks and cuts only at record boundaries: newlines
+    outside quoted fields, tracked by quote parity, so multi-line quoted
+    values stay intact. Every chunk repeats the header line because the
+    stage file format skips one header row per file.
+
+    Args:
+        path: Source CSV file.
+        out_dir: Directory receiving ``<stem>_partNNNN.csv`` chunks.
+        target_bytes: Approximate body size of each chunk.
+
+    Returns:
+        Chunk paths in source order.
+    """
+    chunks: list[Path] = []
+    out: BinaryIO | None = None
+    written = 0
+    in_quotes = 0
+
+    with path.open("rb") as src:
+        header = src.readline()
+        try:
+            while block := src.read(_SPLIT_BLOCK_BYTES):
+                start = 0
+                while start < len(block):
+                    if out is None:
+                        chunk = out_dir / f"{path.stem}_part{len(chunks):04d}.csv"
+                        chunks.append(chunk)
+                        out = chunk.open("wb")
+                        out.write(header)
+                        written = 0
+                    cut = _record_end(
+                        block, start, start + target_bytes - written, in_quotes
+                    )
+                    if cut == -1:
+                        out.write(block[start:])
+                        written += len(block) - start
+                        in_quotes ^= block.count(b'"', start) & 1
+                        break
+                    out.write(block[start:cut])
+                    out.close()
+                    out = None
+                    in_quotes = 0
+                    start = cut
+        finally:
+            if out is not None:
+                out.close()
+
+    return chunks
+
+
+def _record_end(block: bytes, start: int, min_end: int, in_quotes: int) -> int:
+    """Return the offset just past the first record end at or after min_end.
+
+    Args:
+        block: Bytes being scanned.
+        start: Offset where quote parity ``in_quotes`` applies.
+        min_end: Earliest acceptable cut offset.
+        in_quotes: 1 if ``start`` falls inside a quoted field, else 0.
+
+    Returns:
+        Cut offset, or -1 if the block has no record end past min_end.
+    """
+    pos = max(start, min_end - 1)
+    parity = in_quotes ^ (block.count(b'"', start, pos) & 1)
+    while (newline := block.find(b"\n", pos)) != -1:
+        parity ^= block.count(b'"', pos, newline) & 1
+        if not parity:
+            return newline + 1
+        pos = newline + 1
+    return -1
+
+
+def _parse_put_row(row: _PutResultRow) -> tuple[StageUploadStatus, int]:
+    """Extract (status, compressed size) from one PUT result row."""
+    status = (
+        StageUploadStatus.SKIPPED
+        if str(row.status).upper() == "SKIPPED"
+        else StageUploadStatus.UPLOADED
+    )
+    return status, int(row.target_size or 0)
+
+
 # ---- COPY INTO (S003) -------------------------------------------------------
 
 
@@ -503,74 +1067,79 @@ def copy_into_table(
     table_name: str,
     stage_path: str,
     column_mapping: list[str],
+    *,
+    purge: bool = False,
 ) -> CopyResult:
     """Execute COPY INTO to bulk-load staged files into a RAW table.
 
-    Uses positional column mapping: ``$1, $2, ...`` from the staged CSV
-    are mapped to the columns listed in ``column_mapping`` in order.
+    Staged CSV fields map positionally onto the columns listed in
+    ``column_mapping``, using a plain column-list COPY with the named
+    CSV file format rather than a SELECT transformation. With ``purge``
+    loaded files are removed from the stage so later COPYs only list new
+    files.
 
     Args:
         connection: Active Snowflake connection.
         table_name: Fully-qualified target table.
-        stage_path: Stage path pattern (may include wildcards).
+        stage_path: Stage directory to load from, ending in "/".
         column_mapping: Target column names in CSV positional order.
+        purge: Remove successfully loaded files from the stage.
 
     Returns:
         CopyResult with row counts and error details.
 
     Raises:
         LoadError: If COPY INTO fails with a row-level or statement error.
+        ValueError: If stage_path does not end in "/".
     """
-    start = time.monotonic()
+    with _timed() as timer:
+        copy_sql = _copy_sql(table_name, stage_path, column_mapping, purge=purge)
 
-    cols = ", ".join(column_mapping)
-    positional = ", ".join(f"${i}" for i in range(1, len(column_mapping) + 1))
+        cursor = connection.cursor()
+        try:
+            cursor.execute(copy_sql)
+            counts = _parse_copy_rows(table_name, cursor)
+        except snowflake.connector.errors.Error as exc:
+            raise LoadError(
+                f"COPY INTO {table_name} failed: {getattr(exc, 'msg', str(exc))}",
+                table=table_name,
+                file_path=stage_path,
+            ) from exc
+        finally:
+            cursor.close()
 
-    copy_sql = (
-        f"COPY INTO {table_name} ({cols}) "
-        f"FROM (SELECT {positional} FROM {_STAGE_PATH}/{stage_path}) "
-        f"ON_ERROR = 'ABORT_STATEMENT' "
-        f"PURGE = FALSE"
+    elapsed = timer()
+
+    logger.info(
+        "COPY INTO %s: %d rows loaded (%.1fs)",
+        table_name,
+        counts.rows_loaded,
+        elapsed,
     )
 
-    cursor = connection.cursor()
-    try:
-        cursor.execute(copy_sql)
-        results = list(cursor.fetchall())
-    except snowflake.connector.errors.Error as exc:
-        raise LoadError(
-            f"COPY INTO {table_name} failed: {getattr(exc, 'msg', str(exc))}",
-            table=table_name,
-            file_path=stage_path,
-        ) from exc
-    finally:
-        cursor.close()
+    return replace(counts, elapsed_seconds=elapsed)
 
-    elapsed = time.monotonic() - start
 
+def _parse_copy_rows(table_name: str, rows: Iterable[Sequence[Any]]) -> CopyResult:
+    """Fold COPY INTO result rows into a CopyResult with no elapsed time."""
     rows_loaded = 0
     rows_parsed = 0
     errors_seen = 0
     first_error: str | None = None
-
-    for raw_row in results:
-        # COPY INTO result columns: file, status, rows_parsed, rows_loaded,
-        # error_limit, errors_seen, first_error, first_error_line, ...
-        row = tuple(raw_row)
-        if len(row) >= 4:
-            rows_parsed += int(row[2]) if row[2] else 0
-            rows_loaded += int(row[3]) if row[3] else 0
-        if len(row) >= 7:
-            errors_seen += int(row[5]) if row[5] else 0
-            if not first_error and row[6]:
-                first_error = str(row[6])
-
-    logger.info(
-        "COPY INTO %s: %d rows loaded (%.1fs)",
-        table_name,
-        rows_loaded,
-        elapsed,
-    )
+    files_loaded: list[str] = []
+
+    for raw_row in rows:
+        # A COPY with nothing to load returns a single status column.
+        if len(raw_row) < _COPY_ROW_WIDTH:
+            continue
+        row = _CopyResultRow._make(raw_row[:_COPY_ROW_WIDTH])
+        if row.status == "LOADED":
+            files_loaded.append(row.file)
+        rows_parsed += int(row.rows_parsed or 0)
+        rows_loaded += int(row.rows_loaded or 0)
+        errors_seen += int(row.errors_seen or 0)
+        if not first_error and row.first_error:
+            first_error = str(row.first_error)
 
     return CopyResult(
         table_name=table_name,
@@ -578,13 +1147,116 @@ def copy_into_table(
         rows_parsed=rows_parsed,
         errors_seen=errors_seen,
         first_error=first_error,
-        elapsed_seconds=round(elapsed, 3),
+        elapsed_seconds=0.0,
+        files_loaded=tuple(files_loaded),
     )
 
 
 # ---- MERGE upsert (S004) ----------------------------------------------------
 
 
+# Staging tables already created in each live session, so repeat loads
+# over a pooled connection TRUNCATE instead of re-running CREATE ... LIKE.
+_STAGING_TABLES: Final[weakref.WeakKeyDictionary[SnowflakeConnection, set[str]]] = (
+    weakref.WeakKeyDictionary()
+)
+_STAGING_TABLES_LOCK: Final[threading.Lock] = threading.Lock()
+
+
+def _staging_table_exists(connection: SnowflakeConnection, table: str) -> bool:
+    """Return True if this session already holds the staging table."""
+    with _STAGING_TABLES_LOCK:
+        return table in _STAGING_TABLES.get(connection, ())
+
+
+def _remember_staging_table(connection: SnowflakeConnection, table: str) -> None:
+    """Record that this session now holds the staging table."""
+    with _STAGING_TABLES_LOCK:
+        _STAGING_TABLES.setdefault(connection, set()).add(table)
+
+
+def _forget_staging_table(connection: SnowflakeConnection, table: str) -> None:
+    """Drop the record so a failed load recreates the table next time."""
+    with _STAGING_TABLES_LOCK:
+        _STAGING_TABLES.get(connection, set()).discard(table)
+
+
+def _staging_table_name(target_table: str) -> str:
+    """Return the session-scoped staging table used for a target."""
+    return f"{target_table}_STAGING"
+
+
+def _prepare_staging_sql(
+    connection: SnowflakeConnection, target_table: str, staging_table: str
+) -> str:
+    """Build the statement that leaves an empty staging table in place."""
+    if _staging_table_exists(connection, staging_table):
+        return f"TRUNCATE TABLE {staging_table}"
+    return f"CREATE OR REPLACE TEMPORARY TABLE {staging_table} LIKE {target_table}"
+
+
+def _submit_staging_prepare(connection: SnowflakeConnection, target_table: str) -> str:
+    """Start emptying the staging table without waiting; return the query ID."""
+    staging_table = _staging_table_name(target_table)
+    prepare_sql = _prepare_staging_sql(connection, target_table, staging_table)
+    _forget_staging_table(connection, staging_table)
+    cursor = connection.cursor()
+    try:
+        cursor.execute_async(prepare_sql)
+        return str(cursor.sfqid)
+    except snowflake.connector.errors.Error as exc:
+        raise LoadError(
+            f"Failed to prepare staging table {staging_table}: "
+            f"{getattr(exc, 'msg', str(exc))}",
+            table=target_table,
+        ) from exc
+    finally:
+        cursor.close()
+
+
+def _await_staging_prepare(
+    connection: SnowflakeConnection, target_table: str, query_id: str
+) -> None:
+    """Block until the submitted staging prepare finishes.
+
+    Raises:
+        LoadError: If the prepare statement failed or was still running
+            after ``_ASYNC_PREPARE_TIMEOUT_SECONDS``.
+    """
+    staging_table = _staging_table_name(target_table)
+    deadline = time.monotonic() + _ASYNC_PREPARE_TIMEOUT_SECONDS
+    try:
+        while connection.is_still_running(
+            connection.get_query_status_throw_if_error(query_id)
+        ):
+            if time.monotonic() >= deadline:
+                _cancel_query_quietly(connection, query_id)
+                raise LoadError(
+                    f"Preparing staging table {staging_table} did not finish "
+                    f"within {_ASYNC_PREPARE_TIMEOUT_SECONDS:.0f}s",
+                    table=target_table,
+                )
+            time.sleep(_ASYNC_POLL_SECONDS)
+    except snowflake.connector.errors.Error as exc:
+        raise LoadError(
+            f"Failed to prepare staging table {staging_table}: "
+            f"{getattr(exc, 'msg', str(exc))}",
+            table=target_table,
+        ) from exc
+    _remember_staging_table(connection, staging_table)
+
+
+def _cancel_query_quietly(connection: SnowflakeConnection, query_id: str) -> None:
+    """Cancel a submitted query, ignoring errors (it may have finished)."""
+    cursor = connection.cursor()
+    try:
+        cursor.abort_query(query_id)
+    except snowflake.connector.errors.Error:
+        logger.debug("Cancelling query %s failed", query_id, exc_info=True)
+    finally:
+        cursor.close()
+
+
 def merge_into_table(
     connection: SnowflakeConnection,
     target_table: str,
@@ -593,21 +1265,46 @@ def merge_into_table(
     *,
     stage_path: str,
     column_mapping: list[str],
+    merge_strategy: MergeStrategy = MergeStrategy.MERGE,
+    batch_roundtrip: bool = True,
+    purge: bool = False,
+    staging_prepared: bool = False,
+    prestaged_rows: int | None = None,
 ) -> MergeResult:
     """Execute an idempotent MERGE upsert from staged files into target.
 
-    Creates a session-scoped temporary table with identical DDL to the
-    target, loads staged data via COPY INTO, then MERGEs into the target
-    using the specified natural keys. The temporary table is dropped in
-    all code paths.
+    Loads staged data via COPY INTO a session-scoped temporary table
+    with identical DDL to the target, materializes one row per natural
+    key into a second temporary table, then MERGEs that into the target
+    using the specified natural keys. With ``MergeStrategy.DELETE_INSERT``
+    the MERGE is replaced by a key-pruned DELETE of matching target rows
+    followed by a bulk INSERT, which avoids the full target join.
+
+    The staging table is created once per session and truncated on later
+    loads; Snowflake drops both temporary tables when the session ends.
+    With ``purge`` staged files are removed once copied. When the COPY
+    reports zero rows loaded the upsert is skipped.
+
+    With ``batch_roundtrip`` the create, COPY and dedup statements are
+    sent as one multi-statement request, falling back to one request
+    per statement when the account disables multi-statement requests.
 
     Args:
         connection: Active Snowflake connection.
         target_table: Fully-qualified target table.
         natural_keys: Columns forming the deduplication key.
         all_columns: All columns in the target table.
-        stage_path: Stage path for COPY INTO the temporary table.
+        stage_path: Stage directory for COPY INTO the temporary table,
+            ending in "/".
         column_mapping: Column names in CSV positional order for COPY.
+        merge_strategy: Upsert statement pattern to apply.
+        batch_roundtrip: Send the staging statements in one request.
+        purge: Remove staged files once copied into the staging table.
+        staging_prepared: The caller already emptied the staging table
+            (see ``load_dataset``), so the prepare step is skipped.
+        prestaged_rows: Rows the caller already copied into the prepared
+            staging table (see ``load_dataset``'s pipelined upload); when
+            given, the prepare and COPY steps are skipped.
 
     Returns:
         MergeResult with insert/update counts.
@@ -615,39 +1312,89 @@ def merge_into_table(
     Raises:
         LoadError: If COPY INTO or MERGE fails.
     """
-    staging_table = f"{target_table}_STAGING"
-    start = time.monotonic()
-
-    cursor = connection.cursor()
-    try:
-        try:
-            cursor.execute(
-                f"CREATE TEMPORARY TABLE {staging_table} LIKE {target_table}"
-            )
-        except snowflake.connector.errors.Error as exc:
-            raise LoadError(
-                f"Failed to create staging table {staging_table}: "
-                f"{getattr(exc, 'msg', str(exc))}",
-                table=target_table,
-            ) from exc
-
-        _copy_into_staging(cursor, staging_table, stage_path, column_mapping)
-
-        result = _execute_merge(
-            cursor,
-            target_table,
-            staging_table,
-            natural_keys,
-            all_columns,
+    staging_table = _staging_table_name(target_table)
+    dedup_table = f"{staging_table}_DEDUP"
+    with _timed() as timer:
+        prepare_sql = _prepare_staging_sql(connection, target_table, staging_table)
+        copy_sql = _copy_sql(staging_table, stage_path, column_mapping, purge=purge)
+        dedup_sql = _staging_dedup_sql(
+            staging_table, dedup_table, natural_keys, all_columns
         )
-    finally:
-        try:
-            cursor.execute(f"DROP TABLE IF EXISTS {staging_table}")
-        except snowflake.connector.errors.Error:
-            logger.warning("Failed to drop staging table %s", staging_table)
-        cursor.close()
 
-    elapsed = time.monotonic() - start
+        cursor = connection.cursor()
+        try:
+            if prestaged_rows is not None:
+                staged_rows: int | None = prestaged_rows
+                _execute_step(
+                    cursor,
+                    dedup_sql,
+                    f"Deduplicating staging table {staging_table} failed",
+                    table=staging_table,
+                )
+            else:
+                statements = [copy_sql, dedup_sql]
+                if not staging_prepared:
+                    _forget_staging_table(connection, staging_table)
+                    statements.insert(0, prepare_sql)
+                batched = batch_roundtrip and _execute_batch(
+                    cursor,
+                    statements,
+                    table=target_table,
+                    file_path=stage_path,
+                )
+                if batched:
+                    staged_rows = _staged_row_count(
+                        cursor, staging_table, advance=not staging_prepared
+                    )
+                else:
+                    if not staging_prepared:
+                        _execute_step(
+                            cursor,
+                            prepare_sql,
+                            f"Failed to prepare staging table {staging_table}",
+                            table=target_table,
+                        )
+                    _execute_step(
+                        cursor,
+                        copy_sql,
+                        f"COPY INTO staging table {staging_table} failed",
+                        table=staging_table,
+                        file_path=stage_path,
+                    )
+                    staged_rows = _staged_row_count(
+                        cursor, staging_table, advance=False
+                    )
+                    _execute_step(
+                        cursor,
+                        dedup_sql,
+                        f"Deduplicating staging table {staging_table} failed",
+                        table=staging_table,
+                    )
+                _remember_staging_table(connection, staging_table)
+
+            if staged_rows == 0:
+                logger.info("MERGE skipped for %s: staging empty", target_table)
+                result = (0, 0)
+            elif merge_strategy is MergeStrategy.DELETE_INSERT:
+                result = _execute_delete_insert(
+                    cursor,
+                    target_table,
+                    dedup_table,
+                    natural_keys,
+                    all_columns,
+                )
+            else:
+                result = _execute_merge(
+                    cursor,
+                    target_table,
+                    dedup_table,
+                    natural_keys,
+                    all_columns,
+                )
+        finally:
+            cursor.close()
+
+    elapsed = timer()
 
     logger.info(
         "MERGE INTO %s: %d inserted, %d updated (%.1fs)",
@@ -661,38 +1408,138 @@ def merge_into_table(
         target_table=target_table,
         rows_inserted=result[0],
         rows_updated=result[1],
-        elapsed_seconds=round(elapsed, 3),
+        elapsed_seconds=elapsed,
     )
 
 
-def _copy_into_staging(
-    cursor: Any,
-    staging_table: str,
+def _copy_sql(
+    table_name: str,
     stage_path: str,
     column_mapping: list[str],
-) -> None:
-    """COPY INTO the temporary staging table from internal stage."""
-    cols = ", ".join(column_mapping)
-    positional = ", ".join(f"${i}" for i in range(1, len(column_mapping) + 1))
+    *,
+    purge: bool,
+) -> str:
+    """Build a COPY INTO from a directory of the internal stage.
 
-    copy_sql = (
-        f"COPY INTO {staging_table} ({cols}) "
-        f"FROM (SELECT {positional} FROM {_STAGE_PATH}/{stage_path}) "
+    Raises:
+        ValueError: If stage_path is not a directory path ending in "/";
+            the anchored PATTERN would match no files.
+    """
+    if not stage_path.endswith("/"):
+        msg = f"Stage path must be a directory ending in '/': {stage_path!r}"
+        raise ValueError(msg)
+    # Backslashes from re.escape are doubled for the SQL string literal.
+    path_pattern = re.escape(stage_path).replace("\\", "\\\\")
+    fragments = _fragments_for(column_mapping)
+    return (
+        f"COPY INTO {table_name} ({fragments.cols}) "
+        f"FROM {_STAGE_PATH}/{stage_path} "
+        f"FILE_FORMAT = (FORMAT_NAME = '{_FILE_FORMAT}') "
+        f"PATTERN = '{path_pattern}{_STAGED_FILE_PATTERN}' "
         f"ON_ERROR = 'ABORT_STATEMENT' "
-        f"PURGE = FALSE"
+        f"PURGE = {'TRUE' if purge else 'FALSE'}"
     )
 
+
+def _staged_row_count(cursor: Any, staging_table: str, *, advance: bool) -> int | None:
+    """Return rows loaded by the staging COPY, or None if unreported.
+
+    Args:
+        cursor: Cursor positioned on, or just before, the COPY result.
+        staging_table: Staging table the COPY loaded.
+        advance: Move to the next result set of a multi-statement
+            request (from the prepare statement to the COPY) first.
+    """
     try:
-        cursor.execute(copy_sql)
+        if advance and cursor.nextset() is None:
+            return None
+        rows = list(cursor)
     except snowflake.connector.errors.Error as exc:
         raise LoadError(
-            f"COPY INTO staging table {staging_table} failed: "
+            f"Reading COPY INTO {staging_table} results failed: "
             f"{getattr(exc, 'msg', str(exc))}",
             table=staging_table,
-            file_path=stage_path,
+        ) from exc
+    if not rows:
+        return None
+    return _parse_copy_rows(staging_table, rows).rows_loaded
+
+
+def _staging_dedup_sql(
+    staging_table: str,
+    dedup_table: str,
+    natural_keys: list[str],
+    all_columns: list[str],
+) -> str:
+    """Build the CTAS materializing one row per natural key from staging.
+
+    Prevents Snowflake error 100090 ("Duplicate row detected during DML
+    action") and nondeterministic upserts; source CSVs contain duplicates
+    (14 subway, 1228 bus, 1014 streetcar).
+    """
+    fragments = _fragments_for(all_columns, natural_keys)
+    return (
+        f"CREATE OR REPLACE TEMPORARY TABLE {dedup_table} AS "
+        f"SELECT * FROM {staging_table} "
+        f"QUALIFY ROW_NUMBER() OVER "
+        f"(PARTITION BY {fragments.partition_cols} "
+        f"ORDER BY {fragments.order_col}) = 1"
+    )
+
+
+def _execute_step(
+    cursor: Any,
+    sql: str,
+    failure: str,
+    *,
+    table: str,
+    file_path: str = "",
+) -> None:
+    """Execute one statement, wrapping connector errors in LoadError."""
+    try:
+        cursor.execute(sql)
+    except snowflake.connector.errors.Error as exc:
+        raise LoadError(
+            f"{failure}: {getattr(exc, 'msg', str(exc))}",
+            table=table,
+            file_path=file_path,
         ) from exc
 
 
+def _execute_batch(
+    cursor: Any,
+    statements: list[str],
+    *,
+    table: str,
+    file_path: str = "",
+) -> bool:
+    """Run result-less statements in one multi-statement round-trip.
+
+    Returns:
+        True if the batch ran, False if the account has multi-statement
+        requests disabled and the caller should run them one by one.
+
+    Raises:
+        LoadError: If any statement in the batch fails.
+    """
+    try:
+        cursor.execute(";\n".join(statements), num_statements=len(statements))
+    except snowflake.connector.errors.Error as exc:
+        message = getattr(exc, "msg", None) or str(exc)
+        if (
+            getattr(exc, "errno", None) == _MULTI_STATEMENT_DISABLED_ERRNO
+            or _MULTI_STATEMENT_DISABLED_MESSAGE.search(message)
+        ):
+            logger.debug("Multi-statement requests disabled; running singly")
+            return False
+        raise LoadError(
+            f"Preparing staging data for {table} failed: {message}",
+            table=table,
+            file_path=file_path,
+        ) from exc
+    return True
+
+
 def _execute_merge(
     cursor: Any,
     target_table: str,
@@ -701,36 +1548,14 @@ def _execute_merge(
     all_columns: list[str],
 ) -> tuple[int, int]:
     """Build and execute MERGE statement, return (inserted, updated)."""
-    on_clause = " AND ".join(f"target.{k} = staging.{k}" for k in natural_keys)
-
-    non_key_cols = [c for c in all_columns if c not in natural_keys]
-
-    update_set = ", ".join(f"target.{c} = staging.{c}" for c in non_key_cols)
-
-    insert_cols = ", ".join(all_columns)
-    insert_vals = ", ".join(f"staging.{c}" for c in all_columns)
-
-    # Deduplicate staging rows by natural key to prevent Snowflake
-    # error 100090 ("Duplicate row detected during DML action").
-    # Source CSVs contain duplicates (14 subway, 1228 bus, 1014 streetcar).
-    partition_cols = ", ".join(natural_keys)
-    dedup_source = (
-        f"(SELECT * FROM {staging_table} "
-        f"QUALIFY ROW_NUMBER() OVER "
-        f"(PARTITION BY {partition_cols} ORDER BY {natural_keys[0]}) = 1)"
-    )
+    fragments = _fragments_for(all_columns, natural_keys)
 
     merge_sql = (
         f"MERGE INTO {target_table} AS target "
-        f"USING {dedup_source} AS staging "
-        f"ON {on_clause}"
+        f"USING {staging_table} AS staging "
+        f"ON {fragments.on_clause}{fragments.merge_actions}"
     )
 
-    if update_set:
-        merge_sql += f" WHEN MATCHED THEN UPDATE SET {update_set}"
-
-    merge_sql += f" WHEN NOT MATCHED THEN INSERT ({insert_cols}) VALUES ({insert_vals})"
-
     try:
         cursor.execute(merge_sql)
     except snowflake.connector.errors.Error as exc:
@@ -751,24 +1576,140 @@ def _execute_merge(
     return rows_inserted, rows_updated
 
 
+def _execute_delete_insert(
+    cursor: Any,
+    target_table: str,
+    staging_table: str,
+    natural_keys: list[str],
+    all_columns: list[str],
+) -> tuple[int, int]:
+    """Replace matching target rows via DELETE + INSERT.
+
+    Returns (inserted, updated), where rows whose key already existed in
+    the target count as updated, mirroring the MERGE result.
+    """
+    fragments = _fragments_for(all_columns, natural_keys)
+    keys = fragments.partition_cols
+
+    delete_sql = (
+        f"DELETE FROM {target_table} "
+        f"WHERE ({keys}) IN (SELECT {keys} FROM {staging_table})"
+    )
+    insert_sql = (
+        f"INSERT INTO {target_table} ({fragments.cols}) "
+        f"SELECT {fragments.cols} FROM {staging_table}"
+    )
+
+    try:
+        cursor.execute(delete_sql)
+        rows_deleted = max(int(cursor.rowcount or 0), 0)
+        cursor.execute(insert_sql)
+        rows_written = max(int(cursor.rowcount or 0), 0)
+    except snowflake.connector.errors.Error as exc:
+        raise LoadError(
+            f"DELETE/INSERT into {target_table} failed: "
+            f"{getattr(exc, 'msg', str(exc))}",
+            table=target_table,
+        ) from exc
+
+    rows_updated = min(rows_deleted, rows_written)
+    return rows_written - rows_updated, rows_updated
+
+
 # ---- Convenience: load a full dataset ----------------------------------------
 
 
+def _stage_pipelined(
+    connection: SnowflakeConnection,
+    config: TableConfig,
+    stage_files: list[Path],
+    prepare_id: str,
+) -> int:
+    """Upload files in batches, copying each into staging during the next PUT.
+
+    Every batch goes to its own stage directory so its COPY lists only
+    that batch. The COPYs run on one background thread with their own
+    cursors, so at most one COPY is in flight while the caller's thread
+    PUTs the following batch.
+
+    Args:
+        connection: Active Snowflake connection.
+        config: Table configuration of the dataset being loaded.
+        stage_files: Local files to upload, already split.
+        prepare_id: Query ID of the submitted staging prepare, awaited
+            before the first COPY.
+
+    Returns:
+        Total rows copied into the staging table.
+
+    Raises:
+        LoadError: If any PUT or COPY fails; no further batches are sent.
+    """
+    staging_table = _staging_table_name(config.table_name)
+    columns = list(config.columns)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="copy") as copier:
+        pending: list[Future[CopyResult]] = []
+        try:
+            for start in range(0, len(stage_files), _PIPELINE_BATCH_FILES):
+                # Any finished COPY may have failed, not only the latest one
+                failed = next((f for f in pending if f.done() and f.exception()), None)
+                if failed is not None:
+                    failed.result()
+                batch_path = (
+                    f"{config.stage_prefix}/batch_{start // _PIPELINE_BATCH_FILES:04d}/"
+                )
+                upload_files_to_stage(
+                    connection,
+                    stage_files[start : start + _PIPELINE_BATCH_FILES],
+                    batch_path,
+                )
+                if not pending:
+                    _await_staging_prepare(connection, config.table_name, prepare_id)
+                pending.append(
+                    copier.submit(
+                        copy_into_table,
+                        connection,
+                        staging_table,
+                        batch_path,
+                        columns,
+                        purge=True,
+                    )
+                )
+            return sum(future.result().rows_loaded for future in pending)
+        except BaseException:
+            # Queued COPYs must not run on the shared connection after a
+            # failed PUT or COPY; one already running is left to finish.
+            for future in pending:
+                future.cancel()
+            raise
+
+
 def load_dataset(
     connection: SnowflakeConnection,
     dataset_name: str,
     csv_files: list[Path],
+    *,
+    batch_roundtrip: bool = True,
+    pipeline: bool = True,
 ) -> MergeResult:
     """Upload and MERGE a set of CSV files for a dataset.
 
-    Orchestrates the full load sequence: PUT each file to stage, then
-    execute a single MERGE from the staged directory into the target table.
+    Orchestrates the full load sequence: split oversized CSVs into
+    chunks, PUT every file to stage in one parallel wildcard PUT, then
+    execute a single MERGE from the staged directory into the target
+    table. With ``pipeline`` set, datasets of more than
+    ``_PIPELINE_BATCH_FILES`` files are instead PUT in batches whose
+    COPYs into staging overlap the following batch's upload. Staged
+    files are purged once copied, since every load re-PUTs them.
     Callers are responsible for transaction boundaries (BEGIN/COMMIT).
 
     Args:
         connection: Active Snowflake connection.
         dataset_name: Machine-readable dataset identifier.
         csv_files: Validated CSV file paths to load.
+        batch_roundtrip: Send the MERGE's staging statements in one
+            multi-statement request.
+        pipeline: Overlap PUT and COPY for multi-batch datasets.
 
     Returns:
         MergeResult from the final MERGE operation.
@@ -778,10 +1719,38 @@ def load_dataset(
         KeyError: If dataset_name has no table configuration.
     """
     config = get_table_config(dataset_name)
+    # The staging table does not depend on the upload, so it is created or
+    # truncated on the server while the files are split and PUT.
+    prepare_id = _submit_staging_prepare(connection, config.table_name)
 
-    for csv_path in csv_files:
-        stage_dest = f"{config.stage_prefix}/{csv_path.name}"
-        upload_to_stage(connection, csv_path, stage_dest)
+    try:
+        with tempfile.TemporaryDirectory(prefix="split_") as split_dir:
+            stage_files: list[Path] = []
+            for index, csv_path in enumerate(csv_files):
+                if csv_path.stat().st_size > _SPLIT_THRESHOLD_BYTES:
+                    # One directory per source file: files sharing a stem
+                    # (e.g. from different year folders) would otherwise
+                    # overwrite each other's chunks.
+                    chunk_dir = Path(split_dir) / f"{index:04d}"
+                    chunk_dir.mkdir()
+                    stage_files.extend(_split_csv(csv_path, chunk_dir))
+                else:
+                    stage_files.append(csv_path)
+            if pipeline and len(stage_files) > _PIPELINE_BATCH_FILES:
+                prestaged_rows: int | None = _stage_pipelined(
+                    connection, config, stage_files, prepare_id
+                )
+            else:
+                prestaged_rows = None
+                upload_files_to_stage(
+                    connection, stage_files, f"{config.stage_prefix}/"
+                )
+                _await_staging_prepare(connection, config.table_name, prepare_id)
+    except BaseException:
+        # Never leave the prepare running behind a failed upload; cancelling
+        # one that already finished is a no-op.
+        _cancel_query_quietly(connection, prepare_id)
+        raise
 
     return merge_into_table(
         connection,
@@ -790,4 +1759,9 @@ def load_dataset(
         all_columns=list(config.columns),
         stage_path=f"{config.stage_prefix}/",
         column_mapping=list(config.columns),
+        merge_strategy=config.merge_strategy,
+        batch_roundtrip=batch_roundtrip,
+        purge=True,
+        staging_prepared=True,
+        prestaged_rows=prestaged_rows,
     )
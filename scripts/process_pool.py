@@ -0,0 +1,73 @@
+"""Process pools whose workers log through the parent process.
+
+Worker processes do not share the parent's logging handlers: a forked
+worker writes into its own copy of any in-process queue (such as the
+QueueHandler set up by ingest.main), and a forkserver worker has no
+handlers at all. logging_process_pool gives every worker a QueueHandler
+on a multiprocessing queue, and a listener thread in the parent replays
+the records through the parent's loggers, so they reach whatever
+handlers the parent has configured.
+
+Workers start from a forkserver rather than by forking the caller, which
+may be running other threads (ingest's stage workers) at the time.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from multiprocessing.queues import Queue
+
+_START_METHOD: Final[str] = "forkserver"
+
+
+class _ReplayHandler(logging.Handler):
+    """Hand a worker's record to the parent logger of the same name."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+def _init_worker(log_queue: Queue[logging.LogRecord], level: int) -> None:
+    """Route all of a worker's logging to the parent's listener."""
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(level)
+
+
+@contextmanager
+def logging_process_pool(max_workers: int) -> Iterator[ProcessPoolExecutor]:
+    """Yield a ProcessPoolExecutor whose workers' log records reach the parent.
+
+    Records below the parent's root level are dropped in the worker. The
+    listener stops only after the pool has shut down, so records logged
+    by the last tasks are not lost.
+
+    Args:
+        max_workers: Worker processes in the pool.
+
+    Yields:
+        The running pool; it is shut down when the block exits.
+    """
+    context = multiprocessing.get_context(_START_METHOD)
+    log_queue: Queue[logging.LogRecord] = context.Queue()
+    listener = QueueListener(log_queue, _ReplayHandler())
+    listener.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(log_queue, logging.getLogger().getEffectiveLevel()),
+        ) as pool:
+            yield pool
+    finally:
+        listener.stop()
+        log_queue.close()
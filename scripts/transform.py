@@ -3,7 +3,8 @@
 Provides three capabilities required between file acquisition (E-301)
 and schema validation / Snowflake loading (E-303):
 
-1. XLSX-to-CSV conversion for TTC delay files (openpyxl, streaming).
+1. XLSX-to-CSV conversion for TTC delay files (python-calamine, with an
+   openpyxl streaming fallback).
 2. Encoding detection and UTF-8 normalization (charset-normalizer).
 3. ZIP archive extraction for Bike Share ridership files (zipfile).
 
@@ -12,31 +13,95 @@ All functions are idempotent and produce deterministic output.
 
 from __future__ import annotations
 
+import codecs
 import csv
+import datetime
+import errno
+import fnmatch
+import io
+import itertools
 import logging
+import os
+import queue
+import re
 import shutil
+import sqlite3
+import struct
+import threading
 import time
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path, PurePosixPath
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO, Literal, cast
 
 import openpyxl
 from charset_normalizer import from_path
+from python_calamine import CalamineError, CalamineWorkbook
+
+from scripts.process_pool import logging_process_pool
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
     from openpyxl.worksheet.worksheet import Worksheet
+    from python_calamine import CalamineSheet
 
 logger = logging.getLogger(__name__)
 
 _ENCODING_CONFIDENCE_THRESHOLD: float = 0.7
+# Detection samples this many chunks of this many bytes, and only tries
+# the encodings Toronto Open Data and Bike Share files actually use.
+_DETECTION_STEPS: int = 5
+_DETECTION_CHUNK_SIZE: int = 512
+_DETECTION_CANDIDATES: tuple[str, ...] = (
+    "utf_8",
+    "ascii",
+    "cp1252",
+    "latin_1",
+    "utf_16",
+    "utf_16_le",
+    "utf_16_be",
+)
 _ENCODING_CHUNK_SIZE: int = 1_048_576  # 1 MB
+# Threads decompressing members of one ZIP archive; zlib releases the GIL.
+_ZIP_EXTRACT_WORKERS: int = 8
+# Per-thread buffer reused for every extracted member.
+_ZIP_COPY_BUFFER_SIZE: int = 1_048_576  # 1 MB
+_copy_buffers = threading.local()
+# Local file header: signature, 22 fixed bytes, filename and extra lengths.
+_ZIP_LOCAL_HEADER: struct.Struct = struct.Struct("<4s22xHH")
+_ZIP_LOCAL_SIGNATURE: bytes = b"PK\x03\x04"
+# copy_file_range errors that mean "unsupported here", not "copy failed".
+_COPY_FILE_RANGE_FALLBACK: frozenset[int] = frozenset(
+    {errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP}
+)
+# Write buffer for CSV output, so large files go out in few write(2) calls.
+_CSV_WRITE_BUFFER: int = 1_048_576  # 1 MB
+# Workbooks at least this large parse on a background thread while the
+# main thread writes CSV (openpyxl engine only).
+_PARSE_PIPELINE_MIN_BYTES: int = 5 * 1024 * 1024
+_PARSE_BATCH_ROWS: int = 1000
+_PARSE_QUEUE_DEPTH: int = 64
+# Rows encoded per str.join pass when writing calamine output.
+_CSV_ENCODE_BATCH_ROWS: int = 10_000
 
 # BOM byte sequences to strip from file start
 _UTF8_BOM: bytes = b"\xef\xbb\xbf"
 _UTF16_LE_BOM: bytes = b"\xff\xfe"
 _UTF16_BE_BOM: bytes = b"\xfe\xff"
 
+# Any byte that cannot occur in plain ASCII text. NUL is included so
+# BOM-less UTF-16 holding ASCII characters is not mistaken for ASCII.
+_NON_ASCII_BYTE: re.Pattern[bytes] = re.compile(rb"[\x00\x80-\xff]")
+# Encoding names (casefolded) whose bytes are already valid UTF-8.
+_UTF8_COMPATIBLE: frozenset[str] = frozenset(
+    {"utf8", "utf_8", "utf-8", "ascii", "us-ascii", "us_ascii"}
+)
+
 
 # ---------------------------------------------------------------------------
 # Exceptions
@@ -124,16 +189,22 @@ def convert_xlsx_to_csv(
     xlsx_path: Path,
     csv_path: Path,
     sheet_name: str | None = None,
+    engine: Literal["calamine", "openpyxl"] = "calamine",
 ) -> TransformResult:
-    """Convert a single XLSX file to UTF-8 CSV using streaming reads.
+    """Convert a single XLSX file to UTF-8 CSV.
 
-    Uses openpyxl in read-only mode to avoid loading the entire workbook
-    into memory. Writes output with csv.QUOTE_MINIMAL quoting.
+    The default calamine engine parses the sheet in Rust and returns all
+    rows in one call; cell values are rendered as the openpyxl engine
+    would, so both produce the same CSV. The openpyxl engine streams the
+    workbook in read-only mode. Writes output with csv.QUOTE_MINIMAL
+    quoting.
 
     Args:
         xlsx_path: Path to the source XLSX file.
         csv_path: Path for the output CSV file. Parent dirs are created.
-        sheet_name: Worksheet name to read. Reads the active sheet if None.
+        sheet_name: Worksheet name to read. Reads the active sheet
+            (calamine: the first sheet) if None.
+        engine: XLSX parser to use.
 
     Returns:
         TransformResult with conversion metadata.
@@ -145,31 +216,14 @@ def convert_xlsx_to_csv(
     """
     start = time.monotonic()
 
-    try:
-        wb = openpyxl.load_workbook(xlsx_path, read_only=True, data_only=True)
-    except zipfile.BadZipFile as exc:
-        raise TransformError(
-            f"'{xlsx_path}' is not a valid XLSX file "
-            f"(may be a CSV with .xlsx extension): {exc}"
-        ) from exc
-    try:
-        ws = _resolve_worksheet(wb, sheet_name, xlsx_path)
-        csv_path.parent.mkdir(parents=True, exist_ok=True)
-
-        row_count = 0
-        column_count = 0
-
-        with csv_path.open("w", newline="", encoding="utf-8") as fout:
-            writer = csv.writer(fout, quoting=csv.QUOTE_MINIMAL)
-            for i, row in enumerate(ws.iter_rows()):
-                values = ["" if cell.value is None else str(cell.value) for cell in row]
-                writer.writerow(values)
-                if i == 0:
-                    column_count = len(values)
-                else:
-                    row_count += 1
-    finally:
-        wb.close()
+    if engine == "calamine":
+        row_count, column_count = _convert_with_calamine(
+            xlsx_path, csv_path, sheet_name
+        )
+    else:
+        row_count, column_count = _convert_with_openpyxl(
+            xlsx_path, csv_path, sheet_name
+        )
 
     elapsed = time.monotonic() - start
     logger.info(
@@ -188,6 +242,185 @@ def convert_xlsx_to_csv(
     )
 
 
+def _convert_with_calamine(
+    xlsx_path: Path,
+    csv_path: Path,
+    sheet_name: str | None,
+) -> tuple[int, int]:
+    """Write a worksheet to CSV via calamine; return (rows, columns)."""
+    if not xlsx_path.exists():
+        raise FileNotFoundError(xlsx_path)
+    try:
+        wb = CalamineWorkbook.from_path(str(xlsx_path))
+    except CalamineError as exc:
+        raise TransformError(
+            f"'{xlsx_path}' is not a valid XLSX file "
+            f"(may be a CSV with .xlsx extension): {exc}"
+        ) from exc
+    try:
+        sheet = _resolve_calamine_sheet(wb, sheet_name, xlsx_path)
+        rows = sheet.to_python(skip_empty_area=False)
+    finally:
+        wb.close()
+
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    with csv_path.open("wb", buffering=_CSV_WRITE_BUFFER) as fout:
+        for start in range(0, len(rows), _CSV_ENCODE_BATCH_ROWS):
+            # Most cells are already str; only other types pay for a call.
+            batch = [
+                [v if type(v) is str else _calamine_text(v) for v in row]
+                for row in rows[start : start + _CSV_ENCODE_BATCH_ROWS]
+            ]
+            fout.write(_encode_csv_rows(batch))
+
+    if not rows:
+        return 0, 0
+    return len(rows) - 1, len(rows[0])
+
+
+def _encode_csv_rows(rows: list[list[str]]) -> bytes:
+    """Render rows as UTF-8 bytes identical to csv.writer's QUOTE_MINIMAL.
+
+    When no field holds a comma, quote, CR or LF, each row is just its
+    fields joined by commas. The batch is joined in one pass and then
+    checked by counting separators: any field needing quotes adds a
+    comma, newline or quote beyond the expected counts. Such batches,
+    and rows of fewer than two fields (csv.writer quotes a lone empty
+    field), go through csv.writer instead.
+    """
+    if rows and min(map(len, rows)) >= 2:
+        body = "\n".join([",".join(row) for row in rows])
+        if (
+            '"' not in body
+            and "\r" not in body
+            and body.count("\n") == len(rows) - 1
+            and body.count(",") == sum(map(len, rows)) - len(rows)
+        ):
+            return (body.replace("\n", "\r\n") + "\r\n").encode("utf-8")
+
+    buf = io.StringIO()
+    csv.writer(buf, quoting=csv.QUOTE_MINIMAL).writerows(rows)
+    return buf.getvalue().encode("utf-8")
+
+
+def _calamine_text(value: object) -> str:
+    """Render a calamine cell value the way the openpyxl engine does.
+
+    calamine reports every number as a float and date-formatted cells
+    as ``date`` objects, where openpyxl yields ints for whole numbers
+    and ``datetime`` objects.
+    """
+    if isinstance(value, float) and value.is_integer() and abs(value) < 2**53:
+        return str(int(value))
+    if isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):
+        return str(datetime.datetime.combine(value, datetime.time()))
+    return str(value)
+
+
+def _resolve_calamine_sheet(
+    wb: CalamineWorkbook,
+    sheet_name: str | None,
+    xlsx_path: Path,
+) -> CalamineSheet:
+    """Return the target calamine sheet, raising TransformError on mismatch."""
+    if sheet_name is None:
+        if not wb.sheet_names:
+            raise TransformError(f"Workbook '{xlsx_path}' has no worksheets")
+        return wb.get_sheet_by_index(0)
+
+    if sheet_name not in wb.sheet_names:
+        available = ", ".join(wb.sheet_names)
+        raise TransformError(
+            f"Sheet '{sheet_name}' not found in '{xlsx_path}'. "
+            f"Available sheets: {available}"
+        )
+    return wb.get_sheet_by_name(sheet_name)
+
+
+def _convert_with_openpyxl(
+    xlsx_path: Path,
+    csv_path: Path,
+    sheet_name: str | None,
+) -> tuple[int, int]:
+    """Stream a worksheet to CSV via openpyxl; return (rows, columns)."""
+    try:
+        wb = openpyxl.load_workbook(xlsx_path, read_only=True, data_only=True)
+    except zipfile.BadZipFile as exc:
+        raise TransformError(
+            f"'{xlsx_path}' is not a valid XLSX file "
+            f"(may be a CSV with .xlsx extension): {exc}"
+        ) from exc
+    try:
+        ws = _resolve_worksheet(wb, sheet_name, xlsx_path)
+        csv_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # values_only skips building a ReadOnlyCell per cell, and writerows
+        # drives the row loop from the C csv module.
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows, None)
+        with csv_path.open(
+            "w", buffering=_CSV_WRITE_BUFFER, newline="", encoding="utf-8"
+        ) as fout:
+            if header is None:
+                return 0, 0
+            writer = csv.writer(fout, quoting=csv.QUOTE_MINIMAL)
+            # csv.writer renders None as an empty field and calls str() on
+            # other non-str values itself, in C, so cells are passed as-is.
+            writer.writerow(header)
+            if xlsx_path.stat().st_size >= _PARSE_PIPELINE_MIN_BYTES:
+                data_rows = 0
+                for batch in _parse_in_background(rows):
+                    writer.writerows(batch)
+                    data_rows += len(batch)
+            else:
+                # zip pulls a row before a count, so the counter's next value
+                # is the number of data rows written.
+                counter = itertools.count()
+                writer.writerows(row for row, _ in zip(rows, counter, strict=False))
+                data_rows = next(counter)
+    finally:
+        wb.close()
+
+    return data_rows, len(header)
+
+
+def _parse_in_background(
+    rows: Iterator[tuple[object, ...]],
+) -> Iterator[list[tuple[object, ...]]]:
+    """Yield row batches pulled from rows on a separate parser thread.
+
+    The worksheet XML is parsed while the caller encodes and writes the
+    previous batch. The bounded queue caps how far the parser runs ahead.
+    Parser errors are re-raised in the caller; if the caller stops early
+    the parser is signalled to stop and the queue drained so it can exit.
+    """
+    batches: queue.Queue[list[tuple[object, ...]] | None] = queue.Queue(
+        maxsize=_PARSE_QUEUE_DEPTH
+    )
+    stop = threading.Event()
+
+    def produce() -> None:
+        try:
+            while not stop.is_set() and (
+                batch := list(itertools.islice(rows, _PARSE_BATCH_ROWS))
+            ):
+                batches.put(batch)
+        finally:
+            batches.put(None)
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="xlsx-parse") as pool:
+        future = pool.submit(produce)
+        try:
+            while (batch := batches.get()) is not None:
+                yield batch
+        finally:
+            stop.set()
+            while not future.done():
+                with suppress(queue.Empty):
+                    batches.get(timeout=0.05)
+        future.result()
+
+
 def _resolve_worksheet(
     wb: openpyxl.Workbook,
     sheet_name: str | None,
@@ -213,28 +446,65 @@ def batch_convert(
     source_dir: Path,
     output_dir: Path,
     file_pattern: str = "*.xlsx",
+    max_workers: int | None = None,
 ) -> list[TransformResult]:
     """Convert all matching XLSX files in a directory tree to CSV.
 
     Preserves subdirectory structure relative to source_dir in the
-    output directory. Each .xlsx file produces a .csv sibling.
+    output directory. Each .xlsx file produces a .csv sibling. Files
+    are converted in worker processes, since openpyxl's XML parsing
+    holds the GIL; workers log through this process's handlers.
 
     Args:
         source_dir: Root directory to scan for XLSX files.
         output_dir: Root directory for CSV output.
         file_pattern: Glob pattern for matching XLSX files.
+        max_workers: Worker processes to use. Defaults to the CPU count.
 
     Returns:
-        List of TransformResult, one per converted file.
+        List of TransformResult, one per converted file, in path order.
     """
-    results: list[TransformResult] = []
-    for xlsx_path in sorted(source_dir.rglob(file_pattern)):
-        relative = xlsx_path.relative_to(source_dir)
-        csv_name = relative.with_suffix(".csv")
-        csv_path = output_dir / csv_name
-        result = convert_xlsx_to_csv(xlsx_path, csv_path)
-        results.append(result)
-    return results
+    xlsx_paths = _find_files(source_dir, file_pattern)
+    csv_paths = [
+        output_dir / xlsx_path.relative_to(source_dir).with_suffix(".csv")
+        for xlsx_path in xlsx_paths
+    ]
+    workers = _pool_size(max_workers, len(xlsx_paths))
+    if workers <= 1:
+        return list(map(convert_xlsx_to_csv, xlsx_paths, csv_paths))
+    with logging_process_pool(workers) as pool:
+        return list(pool.map(convert_xlsx_to_csv, xlsx_paths, csv_paths))
+
+
+def _find_files(root: Path, pattern: str) -> list[Path]:
+    """Return files under root whose names match pattern, in path order.
+
+    Walks the tree with os.scandir, whose DirEntry type checks reuse the
+    type reported by the directory listing instead of a stat() per
+    entry. Symlinked directories are not followed. A missing root
+    yields no files, as rglob does.
+    """
+    if not root.is_dir():
+        return []
+    found: list[Path] = []
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif fnmatch.fnmatchcase(entry.name, pattern) and entry.is_file():
+                    found.append(Path(entry.path))
+    return sorted(found)
+
+
+def _pool_size(max_workers: int | None, job_count: int) -> int:
+    """Return how many worker processes a batch of jobs should use.
+
+    A single job, or a single worker, runs in-process (size 1) to avoid
+    the pool start-up cost.
+    """
+    return min(max_workers or os.cpu_count() or 1, job_count)
 
 
 # ---------------------------------------------------------------------------
@@ -242,18 +512,83 @@ def batch_convert(
 # ---------------------------------------------------------------------------
 
 
+class EncodingCache:
+    """SQLite-backed store of encoding detection results across runs.
+
+    Entries are keyed by file identity (device, inode, size, mtime in
+    nanoseconds) rather than path, so a rewritten or replaced file
+    misses and is detected again. An instance must be used from the
+    thread that created it.
+
+    Args:
+        path: SQLite database file. Parent dirs are created.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30.0)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS encoding_detection ("
+                "dev INTEGER, ino INTEGER, size INTEGER, mtime_ns INTEGER, "
+                "encoding TEXT NOT NULL, confidence REAL NOT NULL, "
+                "PRIMARY KEY (dev, ino, size, mtime_ns))"
+            )
+
+    def __enter__(self) -> EncodingCache:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def lookup(self, stat: os.stat_result) -> tuple[str, float] | None:
+        """Return the cached (encoding, confidence) for stat, if any."""
+        row = self._conn.execute(
+            "SELECT encoding, confidence FROM encoding_detection "
+            "WHERE dev = ? AND ino = ? AND size = ? AND mtime_ns = ?",
+            _stat_key(stat),
+        ).fetchone()
+        return None if row is None else (str(row[0]), float(row[1]))
+
+    def store(self, stat: os.stat_result, encoding: str, confidence: float) -> None:
+        """Record a detection result for the file identified by stat."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO encoding_detection VALUES (?, ?, ?, ?, ?, ?)",
+                (*_stat_key(stat), encoding, confidence),
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+def _stat_key(stat: os.stat_result) -> tuple[int, int, int, int]:
+    """Return the (dev, ino, size, mtime_ns) identity of a file."""
+    return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
 def normalize_encoding(
     input_path: Path,
     output_path: Path | None = None,
+    cache: EncodingCache | None = None,
 ) -> EncodingResult:
     """Detect file encoding and transcode to UTF-8 if necessary.
 
-    Uses charset-normalizer for detection. Strips BOM bytes from the
-    output. Processes files in 1 MB chunks to limit memory usage.
+    Files made only of ASCII bytes are recognized by a fast scan and
+    skip detection. Otherwise uses charset-normalizer, restricted to a few sampled
+    chunks and to ``_DETECTION_CANDIDATES``. Narrowing the candidates
+    makes detection much faster, but a file in any other encoding (e.g.
+    Shift-JIS) is then matched to the closest candidate or rejected by
+    the confidence check instead of being identified; extend the list
+    if new sources need it. Strips BOM bytes from the output. Processes
+    files in 1 MB chunks to limit memory usage.
 
     Args:
         input_path: Path to the source file.
         output_path: Destination path. Overwrites input_path if None.
+        cache: Detection results from earlier runs. On a hit detection is
+            skipped; misses are recorded, as is the UTF-8 file written.
 
     Returns:
         EncodingResult with detection metadata.
@@ -263,58 +598,47 @@ def normalize_encoding(
         FileNotFoundError: If input_path does not exist.
     """
     target = output_path if output_path is not None else input_path
-    detection = from_path(input_path)
-    best = detection.best()
-
-    if best is None:
-        raise EncodingError(
-            f"Cannot detect encoding for '{input_path}': no candidates returned"
-        )
-
-    detected_encoding: str = str(best.encoding)
-    # charset-normalizer uses chaos (0=perfect). Invert to confidence.
-    confidence: float = 1.0 - best.chaos
-
-    if confidence < _ENCODING_CONFIDENCE_THRESHOLD:
-        candidates = list(detection)[:3]
-        top_candidates = [f"{r.encoding} ({1.0 - r.chaos:.2f})" for r in candidates]
-        raise EncodingError(
-            f"Low confidence ({confidence:.2f}) detecting encoding for "
-            f"'{input_path}'. Top candidates: {', '.join(top_candidates)}"
-        )
-
-    raw_bytes = input_path.read_bytes()
-    had_bom = _has_bom(raw_bytes)
-
-    if had_bom:
-        raw_bytes = _strip_bom(raw_bytes)
-
-    is_utf8 = detected_encoding.lower().replace("-", "") in {
-        "utf8",
-        "ascii",
-    }
-
-    if is_utf8 and not had_bom and target == input_path:
-        return EncodingResult(
-            input_path=input_path,
-            output_path=target,
-            detected_encoding=detected_encoding,
-            confidence=round(confidence, 4),
-            byte_count=len(raw_bytes),
-            had_bom=had_bom,
-        )
-
-    if is_utf8:
-        # Already UTF-8 but needs BOM stripped or different output path
-        target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_bytes(raw_bytes)
+    input_stat = input_path.stat()
+    cached = cache.lookup(input_stat) if cache is not None else None
+    if cached is not None:
+        detected_encoding, confidence = cached
+    elif _is_ascii_file(input_path):
+        detected_encoding, confidence = "ascii", 1.0
     else:
-        # Transcode to UTF-8
-        text = raw_bytes.decode(detected_encoding)
-        target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_text(text, encoding="utf-8")
+        detected_encoding, confidence = _detect_encoding(input_path)
+    if cache is not None and cached is None:
+        cache.store(input_stat, detected_encoding, confidence)
+
+    is_utf8 = detected_encoding.casefold() in _UTF8_COMPATIBLE
+
+    with input_path.open("rb") as src:
+        bom_length = _bom_length(src.read(len(_UTF8_BOM)))
+        src.seek(bom_length)
+        had_bom = bom_length > 0
+
+        if is_utf8 and not had_bom and target == input_path:
+            return EncodingResult(
+                input_path=input_path,
+                output_path=target,
+                detected_encoding=detected_encoding,
+                confidence=round(confidence, 4),
+                byte_count=input_stat.st_size,
+                had_bom=had_bom,
+            )
 
-    byte_count = target.stat().st_size
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with _atomic_rewrite(target) as tmp_path, tmp_path.open("wb") as dst:
+            if is_utf8:
+                # Already UTF-8 but needs BOM stripped or different output path
+                shutil.copyfileobj(src, dst, _ENCODING_CHUNK_SIZE)
+            else:
+                _transcode_to_utf8(src, dst, detected_encoding)
+
+    target_stat = target.stat()
+    byte_count = target_stat.st_size
+    if cache is not None:
+        # The file just written is UTF-8 by construction.
+        cache.store(target_stat, "utf_8", 1.0)
 
     logger.info(
         "Normalized %s: %s (%.2f) -> UTF-8%s",
@@ -334,24 +658,72 @@ def normalize_encoding(
     )
 
 
-def _has_bom(data: bytes) -> bool:
-    """Check whether raw bytes begin with a known BOM sequence."""
-    return (
-        data.startswith(_UTF8_BOM)
-        or data.startswith(_UTF16_LE_BOM)
-        or data.startswith(_UTF16_BE_BOM)
+def _is_ascii_file(path: Path) -> bool:
+    """Return True if the file holds only non-NUL 7-bit bytes.
+
+    The regex search runs in C over each chunk, which is far cheaper
+    than charset-normalizer for the common all-ASCII export.
+    """
+    with path.open("rb") as f:
+        while chunk := f.read(_ENCODING_CHUNK_SIZE):
+            if _NON_ASCII_BYTE.search(chunk):
+                return False
+    return True
+
+
+def _detect_encoding(path: Path) -> tuple[str, float]:
+    """Detect a file's encoding with charset-normalizer.
+
+    Returns:
+        The detected encoding and its confidence between 0.0 and 1.0.
+
+    Raises:
+        EncodingError: If no candidate matches or confidence is below 0.7.
+    """
+    detection = from_path(
+        path,
+        steps=_DETECTION_STEPS,
+        chunk_size=_DETECTION_CHUNK_SIZE,
+        cp_isolation=list(_DETECTION_CANDIDATES),
     )
+    best = detection.best()
 
+    if best is None:
+        raise EncodingError(
+            f"Cannot detect encoding for '{path}': no candidates returned"
+        )
+
+    # charset-normalizer uses chaos (0=perfect). Invert to confidence.
+    confidence: float = 1.0 - best.chaos
 
-def _strip_bom(data: bytes) -> bytes:
-    """Remove leading BOM bytes from raw file content."""
-    if data.startswith(_UTF8_BOM):
-        return data[len(_UTF8_BOM) :]
-    if data.startswith(_UTF16_LE_BOM):
-        return data[len(_UTF16_LE_BOM) :]
-    if data.startswith(_UTF16_BE_BOM):
-        return data[len(_UTF16_BE_BOM) :]
-    return data
+    if confidence < _ENCODING_CONFIDENCE_THRESHOLD:
+        candidates = list(detection)[:3]
+        top_candidates = [f"{r.encoding} ({1.0 - r.chaos:.2f})" for r in candidates]
+        raise EncodingError(
+            f"Low confidence ({confidence:.2f}) detecting encoding for "
+            f"'{path}'. Top candidates: {', '.join(top_candidates)}"
+        )
+    return str(best.encoding), confidence
+
+
+def _bom_length(head: bytes) -> int:
+    """Return the length of the BOM at the start of head, or 0 if none."""
+    for bom in (_UTF8_BOM, _UTF16_LE_BOM, _UTF16_BE_BOM):
+        if head.startswith(bom):
+            return len(bom)
+    return 0
+
+
+def _transcode_to_utf8(src: BinaryIO, dst: BinaryIO, encoding: str) -> None:
+    """Decode src chunk by chunk and write it to dst as UTF-8.
+
+    An incremental decoder carries multi-byte sequences split across
+    chunk boundaries, so only one chunk is resident at a time.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    while chunk := src.read(_ENCODING_CHUNK_SIZE):
+        dst.write(decoder.decode(chunk).encode("utf-8"))
+    dst.write(decoder.decode(b"", final=True).encode("utf-8"))
 
 
 # ---------------------------------------------------------------------------
@@ -368,6 +740,8 @@ def extract_zip(
     Discovers CSV members dynamically via ZipFile.infolist(). Strips
     internal subdirectory prefixes to produce flat output. Skips
     extraction when a target file already exists with matching size.
+    Remaining members are decompressed on up to ``_ZIP_EXTRACT_WORKERS``
+    threads, each reading through its own ZipFile handle.
 
     Args:
         zip_path: Path to the source ZIP archive.
@@ -377,58 +751,167 @@ def extract_zip(
         List of ExtractResult, one per CSV member.
 
     Raises:
-        TransformError: If the archive is corrupt (fails integrity test).
+        TransformError: If an extracted member is corrupt (CRC mismatch or
+            truncated data, detected while it is read).
         FileNotFoundError: If zip_path does not exist.
     """
     output_dir.mkdir(parents=True, exist_ok=True)
 
     with zipfile.ZipFile(zip_path, "r") as zf:
-        corrupt_member = zf.testzip()
-        if corrupt_member is not None:
-            raise TransformError(
-                f"Corrupt ZIP archive '{zip_path}': bad member '{corrupt_member}'"
+        csv_members = _discover_csv_members(zf)
+
+    results: list[ExtractResult] = []
+    pending: list[tuple[zipfile.ZipInfo, Path]] = []
+    for info in csv_members:
+        flat_name = PurePosixPath(info.filename).name
+        target = output_dir / flat_name
+        skipped = target.exists() and target.stat().st_size == info.file_size
+        if skipped:
+            logger.debug("SKIPPED %s (size match)", flat_name)
+        else:
+            pending.append((info, target))
+        results.append(
+            ExtractResult(
+                zip_path=zip_path,
+                extracted_path=target,
+                original_name=info.filename,
+                byte_size=info.file_size,
+                skipped=skipped,
             )
+        )
 
-        csv_members = _discover_csv_members(zf)
-        results: list[ExtractResult] = []
-
-        for info in csv_members:
-            flat_name = PurePosixPath(info.filename).name
-            target = output_dir / flat_name
-
-            if target.exists() and target.stat().st_size == info.file_size:
-                logger.debug("SKIPPED %s (size match)", flat_name)
-                results.append(
-                    ExtractResult(
-                        zip_path=zip_path,
-                        extracted_path=target,
-                        original_name=info.filename,
-                        byte_size=info.file_size,
-                        skipped=True,
-                    )
-                )
-                continue
+    workers = min(_ZIP_EXTRACT_WORKERS, len(pending))
+    if len({target for _, target in pending}) < len(pending):
+        # Members flattening to the same name must overwrite in order.
+        workers = 1
+    if workers <= 1:
+        for info, target in pending:
+            _extract_member(zip_path, info, target)
+    else:
+        with ThreadPoolExecutor(workers, thread_name_prefix="unzip") as pool:
+            # list() drains the results so worker exceptions propagate.
+            list(pool.map(lambda job: _extract_member(zip_path, *job), pending))
 
-            with zf.open(info.filename) as src, target.open("wb") as dst:
-                shutil.copyfileobj(src, dst)
+    return results
 
-            logger.info(
-                "Extracted %s -> %s (%d bytes)",
-                info.filename,
-                target.name,
-                info.file_size,
-            )
-            results.append(
-                ExtractResult(
-                    zip_path=zip_path,
-                    extracted_path=target,
-                    original_name=info.filename,
-                    byte_size=info.file_size,
-                    skipped=False,
+
+def _extract_member(zip_path: Path, info: zipfile.ZipInfo, target: Path) -> None:
+    """Decompress one member to target through a private ZipFile handle.
+
+    ZipFile objects are not safe to share between threads; a handle per
+    call gives each extraction its own file offset. ZipExtFile checks the
+    member's CRC32 as the stream reaches EOF, so corruption surfaces here
+    without a separate testzip() decompression pass.
+
+    Raises:
+        TransformError: If the member fails its CRC check or is truncated.
+            The partially written target is removed.
+    """
+    try:
+        if not _copy_stored_member(zip_path, info, target):
+            with (
+                zipfile.ZipFile(zip_path, "r") as zf,
+                zf.open(info) as src,
+                target.open("wb") as dst,
+            ):
+                # ZipFile.open is typed as IO[bytes] but returns a ZipExtFile,
+                # which is a BufferedIOBase and supports readinto.
+                _copy_stream(cast("zipfile.ZipExtFile", src), dst)
+    except (zipfile.BadZipFile, EOFError, zlib.error) as exc:
+        target.unlink(missing_ok=True)
+        raise TransformError(
+            f"Corrupt ZIP archive '{zip_path}': bad member '{info.filename}'"
+        ) from exc
+
+    logger.info(
+        "Extracted %s -> %s (%d bytes)",
+        info.filename,
+        target.name,
+        info.file_size,
+    )
+
+
+def _copy_stored_member(zip_path: Path, info: zipfile.ZipInfo, target: Path) -> bool:
+    """Copy an uncompressed member with os.copy_file_range.
+
+    STORED members are a plain byte range of the archive, so the kernel
+    can copy them without passing data through Python. The CRC32 is
+    then checked against the written file, matching what ZipExtFile
+    would have verified.
+
+    Returns:
+        True if the member was copied, False if the caller should fall
+        back to a buffered copy (compressed or encrypted member, platform
+        without copy_file_range, or a filesystem that rejects it).
+
+    Raises:
+        zipfile.BadZipFile: If the local header is invalid or the CRC
+            of the copied bytes does not match.
+        EOFError: If the archive ends before the member's data does.
+    """
+    if (
+        not hasattr(os, "copy_file_range")
+        or info.compress_type != zipfile.ZIP_STORED
+        or info.flag_bits & 0x1
+    ):
+        return False
+
+    with zip_path.open("rb") as src, target.open("wb") as dst:
+        src.seek(info.header_offset)
+        signature, name_len, extra_len = _ZIP_LOCAL_HEADER.unpack(
+            src.read(_ZIP_LOCAL_HEADER.size)
+        )
+        if signature != _ZIP_LOCAL_SIGNATURE:
+            raise zipfile.BadZipFile(f"Bad local header for {info.filename!r}")
+        offset = info.header_offset + _ZIP_LOCAL_HEADER.size + name_len + extra_len
+        remaining = info.file_size
+        try:
+            while remaining:
+                copied = os.copy_file_range(
+                    src.fileno(), dst.fileno(), remaining, offset_src=offset
                 )
-            )
+                if copied == 0:
+                    raise EOFError(f"Truncated member {info.filename!r}")
+                offset += copied
+                remaining -= copied
+        except OSError as exc:
+            if exc.errno not in _COPY_FILE_RANGE_FALLBACK:
+                raise
+            logger.debug("copy_file_range unavailable (%s); using buffered copy", exc)
+            return False
+
+    if _file_crc32(target) != info.CRC:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+    return True
 
-    return results
+
+def _thread_copy_buffer() -> memoryview:
+    """Return this thread's reusable 1 MB copy buffer."""
+    buf: bytearray | None = getattr(_copy_buffers, "buf", None)
+    if buf is None:
+        buf = _copy_buffers.buf = bytearray(_ZIP_COPY_BUFFER_SIZE)
+    return memoryview(buf)
+
+
+def _copy_stream(src: zipfile.ZipExtFile, dst: BinaryIO) -> None:
+    """Copy src to dst through this thread's reusable 1 MB buffer.
+
+    readinto fills the same bytearray on every call, so a copy allocates
+    no new bytes objects however many members a thread extracts.
+    """
+    view = _thread_copy_buffer()
+    while n := src.readinto(view):
+        dst.write(view[:n])
+
+
+def _file_crc32(path: Path) -> int:
+    """Compute the CRC32 of a file through the thread's copy buffer."""
+    view = _thread_copy_buffer()
+    crc = 0
+    with path.open("rb") as f:
+        while n := f.readinto(view):
+            crc = zlib.crc32(view[:n], crc)
+    return crc
 
 
 def _discover_csv_members(
@@ -444,14 +927,97 @@ def _discover_csv_members(
     ]
 
 
+def transform_csv_header_and_columns(
+    csv_path: Path,
+    column_map: dict[str, str] | None = None,
+    allowed_columns: frozenset[str] | None = None,
+) -> bool:
+    """Rename header columns and drop disallowed columns in one pass.
+
+    The header line is parsed once with csv.reader, so quoted names
+    containing commas stay intact. Renames are applied first, matching
+    names with surrounding whitespace ignored, so allowed_columns refers
+    to the renamed header; that comparison is case-insensitive to match
+    the validation engine. When only renames apply, the new header is
+    followed by a byte copy of the remaining rows and keeps the original
+    line terminator. When columns are dropped, rows are streamed through
+    csv.reader and csv.writer. Either way the output goes to a temporary
+    sibling that atomically replaces the file.
+
+    Args:
+        csv_path: Path to the CSV file to modify.
+        column_map: Mapping of old column names to new column names.
+            None renames nothing.
+        allowed_columns: Set of column names to retain. None keeps every
+            column.
+
+    Returns:
+        True if the file was rewritten, False if no changes needed.
+    """
+    with csv_path.open("rb") as src:
+        first_line = src.readline().decode("utf-8")
+        header_text = first_line.rstrip("\r\n")
+        fields = next(csv.reader([header_text]), [])
+        if not fields:
+            return False
+
+        header = (
+            [column_map.get(field.strip(), field) for field in fields]
+            if column_map
+            else fields
+        )
+        if allowed_columns is None:
+            keep_indices = list(range(len(header)))
+        else:
+            allowed_lower = {c.lower() for c in allowed_columns}
+            keep_indices = [
+                i
+                for i, col in enumerate(header)
+                if col.strip().lower() in allowed_lower
+            ]
+
+        strip = len(keep_indices) < len(header)
+        if not strip and header == fields:
+            return False
+
+        if strip:
+            with (
+                _atomic_rewrite(csv_path) as tmp_path,
+                tmp_path.open(
+                    "w", buffering=_CSV_WRITE_BUFFER, encoding="utf-8", newline=""
+                ) as out,
+            ):
+                reader = csv.reader(io.TextIOWrapper(src, encoding="utf-8", newline=""))
+                writer = csv.writer(out, quoting=csv.QUOTE_MINIMAL)
+                select = _column_selector(keep_indices)
+                writer.writerow(select(header))
+                writer.writerows(map(select, reader))
+        else:
+            new_header = io.StringIO()
+            terminator = first_line[len(header_text) :]
+            csv.writer(new_header, lineterminator=terminator).writerow(header)
+            with _atomic_rewrite(csv_path) as tmp_path, tmp_path.open("wb") as dst:
+                dst.write(new_header.getvalue().encode("utf-8"))
+                shutil.copyfileobj(src, dst, _CSV_WRITE_BUFFER)
+
+    renames = {old: new for old, new in zip(fields, header, strict=True) if old != new}
+    if renames:
+        logger.info("Renamed columns in %s: %s", csv_path.name, renames)
+    if strip:
+        kept = set(keep_indices)
+        removed = [col for i, col in enumerate(header) if i not in kept]
+        logger.info("Stripped extra columns from %s: %s", csv_path.name, removed)
+    return True
+
+
 def rename_csv_columns(
     csv_path: Path,
     column_map: dict[str, str],
 ) -> bool:
     """Rename CSV header columns in-place using the provided mapping.
 
-    Reads the CSV, applies column renames to the header row, and writes
-    back. Only modifies the file if at least one rename was applied.
+    Thin wrapper over transform_csv_header_and_columns that keeps every
+    column, so only the header line is rewritten.
 
     Args:
         csv_path: Path to the CSV file to modify.
@@ -460,27 +1026,7 @@ def rename_csv_columns(
     Returns:
         True if any columns were renamed, False if no changes needed.
     """
-    raw = csv_path.read_text(encoding="utf-8")
-    lines = raw.split("\n")
-    if not lines:
-        return False
-
-    header = lines[0]
-    original_header = header
-    for old_name, new_name in column_map.items():
-        # Replace exact column name matches in the CSV header.
-        # Uses comma boundaries and start/end anchors to avoid partial matches.
-        parts = header.split(",")
-        parts = [new_name if p.strip() == old_name else p for p in parts]
-        header = ",".join(parts)
-
-    if header == original_header:
-        return False
-
-    lines[0] = header
-    csv_path.write_text("\n".join(lines), encoding="utf-8")
-    logger.info("Renamed columns in %s: %s", csv_path.name, column_map)
-    return True
+    return transform_csv_header_and_columns(csv_path, column_map=column_map)
 
 
 def strip_extra_columns(
@@ -489,7 +1035,7 @@ def strip_extra_columns(
 ) -> bool:
     """Remove columns not in the allowed set from a CSV file in-place.
 
-    Uses proper CSV parsing to handle quoted fields containing delimiters.
+    Thin wrapper over transform_csv_header_and_columns with no renames.
     Comparison is case-insensitive to match the validation engine.
 
     Args:
@@ -499,56 +1045,79 @@ def strip_extra_columns(
     Returns:
         True if any columns were removed, False if no changes needed.
     """
-    with csv_path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.reader(f)
-        header = next(reader, None)
-        if header is None:
-            return False
+    return transform_csv_header_and_columns(csv_path, allowed_columns=allowed_columns)
 
-        allowed_lower = {c.lower() for c in allowed_columns}
-        keep_indices = [
-            i for i, col in enumerate(header) if col.strip().lower() in allowed_lower
-        ]
 
-        if len(keep_indices) == len(header):
-            return False
+@contextmanager
+def _atomic_rewrite(path: Path) -> Iterator[Path]:
+    """Yield a temporary sibling path that replaces path on success.
 
-        removed = [header[i] for i in range(len(header)) if i not in set(keep_indices)]
+    The replacement keeps the permission bits of an existing path. On
+    failure the temporary file is removed and path is left untouched.
+    """
+    # Created by the caller's open(), so a new file gets the usual umask
+    # permissions; the pid keeps concurrent worker processes apart.
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        yield tmp_path
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
-        rows: list[list[str]] = [[header[i] for i in keep_indices]]
-        for row in reader:
-            rows.append([row[i] if i < len(row) else "" for i in keep_indices])
 
-    with csv_path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
-        writer.writerows(rows)
+def _column_selector(indices: list[int]) -> Callable[[list[str]], Sequence[str]]:
+    """Return a function picking the given columns of a row in one C call.
 
-    logger.info("Stripped extra columns from %s: %s", csv_path.name, removed)
-    return True
+    Rows too short to hold every index are padded with empty fields
+    first, which only costs anything for such rows.
+    """
+    if not indices:
+        return lambda row: ()
+    width = max(indices) + 1
+    getter = itemgetter(*indices)
+
+    def select(row: list[str]) -> Sequence[str]:
+        if len(row) < width:
+            row = row + [""] * (width - len(row))
+        picked: str | tuple[str, ...] = getter(row)
+        # itemgetter with one index returns the bare field.
+        return (picked,) if isinstance(picked, str) else picked
+
+    return select
 
 
 def batch_extract_zips(
     source_dir: Path,
     output_dir: Path,
     file_pattern: str = "*.zip",
+    max_workers: int | None = None,
 ) -> list[ExtractResult]:
     """Extract all matching ZIP archives in a directory tree.
 
     Preserves the <source>/<year>/ subdirectory structure from source_dir
-    in the output directory.
+    in the output directory. Archives are extracted in worker processes,
+    which log through this process's handlers.
 
     Args:
         source_dir: Root directory to scan for ZIP files.
         output_dir: Root directory for extracted output.
         file_pattern: Glob pattern for matching ZIP files.
+        max_workers: Worker processes to use. Defaults to the CPU count.
 
     Returns:
-        Flat list of ExtractResult across all archives.
+        Flat list of ExtractResult across all archives, in path order.
     """
-    all_results: list[ExtractResult] = []
-    for zip_path in sorted(source_dir.rglob(file_pattern)):
-        relative_dir = zip_path.parent.relative_to(source_dir)
-        target_dir = output_dir / relative_dir
-        results = extract_zip(zip_path, target_dir)
-        all_results.extend(results)
-    return all_results
+    zip_paths = _find_files(source_dir, file_pattern)
+    target_dirs = [
+        output_dir / zip_path.parent.relative_to(source_dir) for zip_path in zip_paths
+    ]
+    workers = _pool_size(max_workers, len(zip_paths))
+    if workers <= 1:
+        per_archive = list(map(extract_zip, zip_paths, target_dirs))
+    else:
+        with logging_process_pool(workers) as pool:
+            per_archive = list(pool.map(extract_zip, zip_paths, target_dirs))
+    return [result for results in per_archive for result in results]
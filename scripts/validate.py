@@ -15,30 +15,116 @@ from __future__ import annotations
 
 import argparse
 import csv
+import itertools
 import logging
+import os
 import re
 import sys
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
 
-from scripts.contracts import CONTRACTS, SchemaContract
+from scripts.contracts import CONTRACTS, ColumnContract, SchemaContract
+from scripts.process_pool import logging_process_pool
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 logger = logging.getLogger(__name__)
 
 _TYPE_SAMPLE_ROWS: int = 1_000
+# Read size for counting the rows after the type sample.
+_COUNT_BATCH_BYTES: int = 1_048_576
+# Buffer for validate_file's reads; the default 8 KB means a syscall per
+# few dozen rows.
+_READ_BUFFER_BYTES: int = 1_048_576
+# Datasets with at most this many files validate in-process; the pool's
+# start-up cost outweighs the gain.
+_SERIAL_MAX_FILES: int = 2
+# Leading bytes inspected by validate_and_normalize. A BOM or a NUL byte
+# (BOM-less UTF-16) there means the file needs normalizing before it can
+# be validated as UTF-8.
+_ENCODING_PROBE_BYTES: int = 4096
+_NEEDS_NORMALIZING_BOMS: tuple[bytes, ...] = (
+    b"\xef\xbb\xbf",
+    b"\xff\xfe",
+    b"\xfe\xff",
+)
 
-# Regex patterns for type validation.
-# DATE accepts YYYY-MM-DD and YYYY-MM-DD HH:MM:SS (openpyxl datetime str output).
-# INTEGER accepts optional .0 suffix (openpyxl renders int cells as float strings).
-_DATE_PATTERN: re.Pattern[str] = re.compile(r"^\d{4}-\d{2}-\d{2}([T ]00:00:00)?$")
-_TIME_PATTERN: re.Pattern[str] = re.compile(r"^\d{1,2}:\d{2}(:\d{2})?$")
-_INTEGER_PATTERN: re.Pattern[str] = re.compile(r"^-?\d+(\.0)?$")
-_DECIMAL_PATTERN: re.Pattern[str] = re.compile(r"^-?\d+\.?\d*$")
-_TIMESTAMP_PATTERN: re.Pattern[str] = re.compile(
-    r"^\d{1,2}/\d{1,2}/\d{4}\s+\d{1,2}:\d{2}$"
-    r"|^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2})?$"
+# Regex patterns for type validation. DATE, TIME and INTEGER are fixed-shape
+# and checked with str methods instead (see _is_date and friends below).
+# Patterns are unanchored and applied with fullmatch. Values are stripped
+# before checking, so fullmatch and the old ^...$ with match agree.
+_DECIMAL_PATTERN: re.Pattern[str] = re.compile(r"-?\d+\.?\d*")
+# TIMESTAMP has two shapes; _is_timestamp picks one pattern by value[4]
+# instead of trying an alternation.
+_TIMESTAMP_SLASH_PATTERN: re.Pattern[str] = re.compile(
+    r"\d{1,2}/\d{1,2}/\d{4}\s+\d{1,2}:\d{2}"
+)
+_TIMESTAMP_ISO_PATTERN: re.Pattern[str] = re.compile(
+    r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2})?"
 )
 
+# Midnight suffixes accepted on DATE values (openpyxl datetime str output).
+_MIDNIGHT_SUFFIXES: frozenset[str] = frozenset({" 00:00:00", "T00:00:00"})
+
+
+def _is_date(value: str) -> bool:
+    """Match YYYY-MM-DD, optionally followed by a midnight time."""
+    return (
+        (len(value) == 10 or value[10:] in _MIDNIGHT_SUFFIXES)
+        and value[4:5] == "-"
+        and value[7:8] == "-"
+        and value[:4].isdecimal()
+        and value[5:7].isdecimal()
+        and value[8:10].isdecimal()
+    )
+
+
+def _is_time(value: str) -> bool:
+    """Match H:MM, HH:MM, H:MM:SS or HH:MM:SS."""
+    parts = value.split(":")
+    return (
+        2 <= len(parts) <= 3
+        and 1 <= len(parts[0]) <= 2
+        and all(len(part) == 2 for part in parts[1:])
+        and all(part.isdecimal() for part in parts)
+    )
+
+
+def _is_integer(value: str) -> bool:
+    """Match an optionally negative integer with an optional .0 suffix.
+
+    openpyxl renders int cells as float strings, hence the suffix.
+    """
+    digits = value[:-2] if value.endswith(".0") else value
+    if digits.startswith("-"):
+        digits = digits[1:]
+    return digits.isdecimal()
+
+
+def _is_timestamp(value: str) -> bool:
+    """Match M/D/YYYY H:MM or YYYY-MM-DD[T ]HH:MM[:SS].
+
+    Only the ISO form can have '-' at index 4, so that character selects
+    the single pattern worth trying.
+    """
+    if value[4:5] == "-":
+        return _TIMESTAMP_ISO_PATTERN.fullmatch(value) is not None
+    return _TIMESTAMP_SLASH_PATTERN.fullmatch(value) is not None
+
+
+# Dtype -> checker; a truthy result means the value conforms.
+_TYPE_CHECKERS: dict[str, Callable[[str], object]] = {
+    "STRING": lambda _value: True,
+    "DATE": _is_date,
+    "TIME": _is_time,
+    "INTEGER": _is_integer,
+    "DECIMAL": _DECIMAL_PATTERN.fullmatch,
+    "TIMESTAMP": _is_timestamp,
+}
+
 
 # ---------------------------------------------------------------------------
 # Exceptions
@@ -69,6 +155,23 @@ class SchemaValidationError(Exception):
         detail = "; ".join(mismatches)
         super().__init__(f"Schema validation failed for '{file_path}': {detail}")
 
+    def __reduce__(
+        self,
+    ) -> tuple[
+        type[SchemaValidationError], tuple[Path, list[str], list[str], list[str]]
+    ]:
+        # Rebuild from the original arguments so the error survives the trip
+        # back from a validate_dataset worker process.
+        return (
+            type(self),
+            (
+                self.file_path,
+                self.expected_columns,
+                self.actual_columns,
+                self.mismatches,
+            ),
+        )
+
 
 # ---------------------------------------------------------------------------
 # Result dataclass
@@ -109,7 +212,8 @@ def validate_file(
 
     Phase 1 checks column presence (case-insensitive set comparison).
     Phase 2 samples first 1,000 rows for type conformance.
-    Raises SchemaValidationError on the first structural failure.
+    Raises SchemaValidationError on the first structural failure. The
+    whole file is read as UTF-8.
 
     Args:
         csv_path: Path to the CSV file to validate.
@@ -120,10 +224,14 @@ def validate_file(
 
     Raises:
         SchemaValidationError: On any structural or type deviation.
+        UnicodeDecodeError: If the file is not valid UTF-8.
     """
-    with csv_path.open("r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        if reader.fieldnames is None:
+    with csv_path.open("rb", buffering=_READ_BUFFER_BYTES) as f:
+        # csv.reader pulls one line at a time from this generator, so after
+        # the sample f is positioned at the start of the next record.
+        reader = csv.reader(line.decode("utf-8") for line in f)
+        header = next(reader, None)
+        if header is None:
             raise SchemaValidationError(
                 file_path=csv_path,
                 expected_columns=list(contract.column_names),
@@ -131,35 +239,44 @@ def validate_file(
                 mismatches=["File has no header row"],
             )
 
-        actual_columns = list(reader.fieldnames)
+        actual_columns = header
 
         # Phase 1: structural validation
         _validate_structure(csv_path, contract, actual_columns)
 
-        # Build case-insensitive column name mapping for type checks
-        actual_lower_map: dict[str, str] = {col.lower(): col for col in actual_columns}
+        # Resolve each contract column to its header position once, matching
+        # case-insensitively; a repeated name resolves to its last occurrence.
+        actual_lower_index: dict[str, int] = {
+            col.lower(): i for i, col in enumerate(actual_columns)
+        }
+        checks: list[tuple[int, ColumnContract]] = [
+            (actual_lower_index[name_lower], col_def)
+            for col_def, name_lower in zip(
+                contract.columns, contract.column_names_lower, strict=True
+            )
+            if name_lower in actual_lower_index
+        ]
 
         # Phase 2: type validation on sampled rows
-        rows_checked = 0
         total_rows = 0
-        type_errors: list[str] = []
-
         for row in reader:
+            if not row:
+                # Blank line; csv.DictReader skipped these too.
+                continue
             total_rows += 1
-            if rows_checked < _TYPE_SAMPLE_ROWS:
-                row_errors = _validate_row_types(
-                    row, contract, actual_lower_map, total_rows
+            type_errors = _validate_row_types(row, checks, total_rows)
+            if type_errors:
+                raise SchemaValidationError(
+                    file_path=csv_path,
+                    expected_columns=list(contract.column_names),
+                    actual_columns=actual_columns,
+                    mismatches=type_errors,
                 )
-                type_errors.extend(row_errors)
-                rows_checked += 1
+            if total_rows == _TYPE_SAMPLE_ROWS:
+                break
 
-                if type_errors:
-                    raise SchemaValidationError(
-                        file_path=csv_path,
-                        expected_columns=list(contract.column_names),
-                        actual_columns=actual_columns,
-                        mismatches=type_errors,
-                    )
+        # Past the sample, rows only need counting.
+        total_rows += _count_remaining_rows(f)
 
         # Row count sanity check
         if total_rows < contract.min_row_count:
@@ -186,20 +303,49 @@ def validate_file(
     )
 
 
+def _count_remaining_rows(f: BinaryIO) -> int:
+    """Count the non-blank CSV records left in f, positioned at a record start.
+
+    While the remaining lines hold no quote character, every line is one
+    record, so lines are counted in ~1 MB batches without CSV parsing.
+    A quote may open a field that spans lines, so from the first batch
+    containing one the rest of the file is parsed with csv.reader.
+
+    Raises:
+        UnicodeDecodeError: If the remaining bytes are not valid UTF-8.
+            Batches end at a newline, so each one decodes on its own.
+    """
+    count = 0
+    while lines := f.readlines(_COUNT_BATCH_BYTES):
+        batch = b"".join(lines)
+        batch.decode("utf-8")
+        if b'"' in batch:
+            rest = itertools.chain(lines, f)
+            records = csv.reader(line.decode("utf-8") for line in rest)
+            return count + sum(1 for row in records if row)
+        count += len(lines) - lines.count(b"\n") - lines.count(b"\r\n")
+    return count
+
+
 def _validate_structure(
     csv_path: Path,
     contract: SchemaContract,
     actual_columns: list[str],
 ) -> None:
     """Check that all required contract columns exist in the CSV header."""
-    actual_lower = {col.lower() for col in actual_columns}
-    expected_lower = {col.lower() for col in contract.required_columns}
+    actual_lowered = [col.lower() for col in actual_columns]
+    actual_lower = set(actual_lowered)
+    expected_lower = contract.required_columns_lower
 
     missing = expected_lower - actual_lower
     if missing:
         # Map back to original contract names for clear error messages
         missing_original = [
-            c.name for c in contract.columns if c.name.lower() in missing
+            c.name
+            for c, name_lower in zip(
+                contract.columns, contract.column_names_lower, strict=True
+            )
+            if name_lower in missing
         ]
         raise SchemaValidationError(
             file_path=csv_path,
@@ -210,7 +356,11 @@ def _validate_structure(
 
     extra = actual_lower - expected_lower
     if extra:
-        extra_original = [col for col in actual_columns if col.lower() in extra]
+        extra_original = [
+            col
+            for col, col_lower in zip(actual_columns, actual_lowered, strict=True)
+            if col_lower in extra
+        ]
         logger.warning(
             "%s: extra columns not in contract (non-blocking): %s",
             csv_path.name,
@@ -218,12 +368,13 @@ def _validate_structure(
         )
 
     # Case mismatch warning
-    for col_contract in contract.columns:
-        for actual_col in actual_columns:
-            if (
-                actual_col.lower() == col_contract.name.lower()
-                and actual_col != col_contract.name
-            ):
+    for col_contract, name_lower in zip(
+        contract.columns, contract.column_names_lower, strict=True
+    ):
+        for actual_col, actual_col_lower in zip(
+            actual_columns, actual_lowered, strict=True
+        ):
+            if actual_col_lower == name_lower and actual_col != col_contract.name:
                 logger.warning(
                     "%s: column case mismatch: expected '%s', found '%s'",
                     csv_path.name,
@@ -233,20 +384,20 @@ def _validate_structure(
 
 
 def _validate_row_types(
-    row: dict[str, str | None],
-    contract: SchemaContract,
-    actual_lower_map: dict[str, str],
+    row: list[str],
+    checks: list[tuple[int, ColumnContract]],
     row_number: int,
 ) -> list[str]:
-    """Validate column values in a single row against contract dtypes."""
-    errors: list[str] = []
+    """Validate column values in a single row against contract dtypes.
 
-    for col_def in contract.columns:
-        actual_key = actual_lower_map.get(col_def.name.lower())
-        if actual_key is None:
-            continue
+    checks pairs each contract column present in the header with its
+    index; a row too short to reach an index is treated as empty there.
+    """
+    errors: list[str] = []
+    row_length = len(row)
 
-        value = row.get(actual_key)
+    for idx, col_def in checks:
+        value = row[idx] if idx < row_length else None
         if value is None or value.strip() == "" or value.strip().upper() == "NULL":
             if not col_def.nullable:
                 errors.append(
@@ -268,36 +419,102 @@ def _validate_row_types(
 
 def _check_type(value: str, expected_dtype: str) -> bool:
     """Return True if value conforms to the expected logical dtype."""
-    match expected_dtype:
-        case "STRING":
-            return True
-        case "DATE":
-            return bool(_DATE_PATTERN.match(value))
-        case "TIME":
-            return bool(_TIME_PATTERN.match(value))
-        case "INTEGER":
-            return bool(_INTEGER_PATTERN.match(value))
-        case "DECIMAL":
-            return bool(_DECIMAL_PATTERN.match(value))
-        case "TIMESTAMP":
-            return bool(_TIMESTAMP_PATTERN.match(value))
-        case _:
-            logger.warning("Unknown dtype '%s', skipping check", expected_dtype)
-            return True
+    checker = _TYPE_CHECKERS.get(expected_dtype)
+    if checker is None:
+        logger.warning("Unknown dtype '%s', skipping check", expected_dtype)
+        return True
+    return bool(checker(value))
+
+
+def validate_and_normalize(
+    csv_path: Path,
+    contract: SchemaContract,
+    encoding_cache_path: Path | None = None,
+) -> ValidationResult:
+    """Normalize a CSV to BOM-less UTF-8 in place and validate it.
+
+    A file that already is BOM-less UTF-8, the common case, needs no
+    rewrite, and validate_file reading it without a decode error proves
+    that; such files are read once instead of once per step. A file
+    that starts with a BOM or holds NUL bytes (BOM-less UTF-16), or that
+    fails to decode, is normalized with normalize_encoding first and
+    then validated.
+
+    Args:
+        csv_path: Path to the CSV file to normalize and validate.
+        contract: Schema contract to validate against.
+        encoding_cache_path: EncodingCache database used when the file
+            has to be normalized. None disables caching.
+
+    Returns:
+        ValidationResult if the file passes all checks.
+
+    Raises:
+        SchemaValidationError: On any structural or type deviation.
+    """
+    with csv_path.open("rb") as f:
+        head = f.read(_ENCODING_PROBE_BYTES)
+    if not head.startswith(_NEEDS_NORMALIZING_BOMS) and b"\x00" not in head:
+        try:
+            return validate_file(csv_path, contract)
+        except UnicodeDecodeError:
+            logger.debug("%s is not UTF-8; normalizing", csv_path.name)
+
+    from scripts.transform import EncodingCache, normalize_encoding
+
+    if encoding_cache_path is None:
+        normalize_encoding(csv_path)
+    else:
+        with EncodingCache(encoding_cache_path) as cache:
+            normalize_encoding(csv_path, cache=cache)
+    return validate_file(csv_path, contract)
+
+
+def find_csv_files(root: Path) -> list[Path]:
+    """Return the CSV files under root in path order; empty if root is missing.
+
+    Walks the tree with os.scandir and builds Path objects only for
+    matches, unlike rglob which builds one per directory entry.
+    Symlinked directories are not followed.
+    """
+    if not root.is_dir():
+        return []
+    found: list[Path] = []
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".csv") and entry.is_file():
+                    found.append(Path(entry.path))
+    return sorted(found)
 
 
 def validate_dataset(
     dataset_dir: Path,
     contract: SchemaContract,
+    *,
+    normalize: bool = False,
+    encoding_cache_path: Path | None = None,
+    max_workers: int | None = None,
 ) -> list[ValidationResult]:
     """Validate all CSV files in a directory tree against a contract.
 
-    Fails fast on the first invalid file by propagating
-    SchemaValidationError from validate_file.
+    Files are validated in worker processes, one per CPU by default,
+    unless there are only a few. Workers log through this process's
+    handlers (see logging_process_pool). Fails fast on the first invalid
+    file in path order by propagating SchemaValidationError from
+    validate_file; files not yet started are cancelled.
 
     Args:
         dataset_dir: Root directory containing CSV files.
         contract: Schema contract to validate against.
+        normalize: Normalize each file to UTF-8 as part of validating it
+            (see validate_and_normalize).
+        encoding_cache_path: EncodingCache database for normalization.
+        max_workers: Worker processes to use. Defaults to the CPU count;
+            callers validating several datasets at once pass their share.
 
     Returns:
         List of ValidationResult for all valid files.
@@ -306,15 +523,28 @@ def validate_dataset(
         SchemaValidationError: On first file that fails validation.
     """
     results: list[ValidationResult] = []
-    csv_files = sorted(dataset_dir.rglob("*.csv"))
+    csv_files = find_csv_files(dataset_dir)
 
     if not csv_files:
         logger.warning("No CSV files found in %s", dataset_dir)
         return results
 
-    for csv_path in csv_files:
-        result = validate_file(csv_path, contract)
-        results.append(result)
+    check: Callable[[Path, SchemaContract], ValidationResult] = (
+        partial(validate_and_normalize, encoding_cache_path=encoding_cache_path)
+        if normalize
+        else validate_file
+    )
+    workers = min(max_workers or os.cpu_count() or 1, len(csv_files))
+    if len(csv_files) <= _SERIAL_MAX_FILES or workers <= 1:
+        return [check(csv_path, contract) for csv_path in csv_files]
+
+    with logging_process_pool(workers) as pool:
+        futures = [pool.submit(check, p, contract) for p in csv_files]
+        try:
+            results.extend(future.result() for future in futures)
+        except BaseException:
+            pool.shutdown(cancel_futures=True)
+            raise
 
     return results
 
@@ -378,6 +608,9 @@ def _dataset_source_dir(
 # 2019 TTC Bus and Streetcar files use incompatible column names.
 _MIN_YEAR: int = 2020
 
+# Encoding detection cache kept beside the validated output it describes.
+_ENCODING_CACHE_NAME: str = ".encoding_cache.sqlite3"
+
 # 2025+ TTC Bus and Streetcar files switched to the unified subway-style
 # schema (Line, Station, Code, Bound). Remap to historical contract names.
 _UNIFIED_YEAR: int = 2025
@@ -419,9 +652,13 @@ def _run_pipeline(
     contract: SchemaContract,
     source_dir: Path,
     output_dir: Path,
+    max_workers: int | None = None,
 ) -> list[ValidationResult]:
     """Execute transform + validate pipeline for a single dataset.
 
+    max_workers caps the worker processes used to validate the dataset's
+    files (see validate_dataset).
+
     Steps:
     1. Convert XLSX files to CSV (TTC datasets).
     2. Extract ZIP archives (Bike Share).
@@ -434,9 +671,7 @@ def _run_pipeline(
     from scripts.transform import (
         TransformError,
         convert_xlsx_to_csv,
-        normalize_encoding,
-        rename_csv_columns,
-        strip_extra_columns,
+        transform_csv_header_and_columns,
     )
 
     subdir = _dataset_source_dir(source_dir, dataset_name)
@@ -482,42 +717,46 @@ def _run_pipeline(
 
             extract_zip(zip_path, target_dir)
 
-    # Step 2.5: Rename columns in 2025+ bus/streetcar files to match contracts.
-    # Toronto Open Data switched to a unified subway-style schema in 2025.
-    if dataset_name in {"ttc_bus_delays", "ttc_streetcar_delays"}:
-        rename_map = (
-            _BUS_COLUMN_RENAMES
-            if dataset_name == "ttc_bus_delays"
-            else _STREETCAR_COLUMN_RENAMES
-        )
-        for csv_file in sorted(validated_dir.rglob("*.csv")):
-            year = _extract_year(csv_file)
-            if year is not None and year >= _UNIFIED_YEAR:
-                rename_csv_columns(csv_file, rename_map)
-
-    # Step 2.7: Strip columns not in the contract (e.g. _id, Vehicle).
+    # Step 2.5: Rename and strip columns in a single pass per file.
+    # Toronto Open Data switched to a unified subway-style schema in 2025,
+    # so 2025+ bus/streetcar columns are renamed to match the contracts.
+    # Columns not in the contract (e.g. _id, Vehicle) are then stripped:
     # 2025 Open Data files prepended an _id column that shifts positional
     # COPY INTO mapping in the Snowflake load step.
     if dataset_name.startswith("ttc_"):
-        allowed = contract.required_columns
-        for csv_file in sorted(validated_dir.rglob("*.csv")):
-            strip_extra_columns(csv_file, allowed)
+        rename_map = {
+            "ttc_bus_delays": _BUS_COLUMN_RENAMES,
+            "ttc_streetcar_delays": _STREETCAR_COLUMN_RENAMES,
+        }.get(dataset_name)
+        for csv_file in find_csv_files(validated_dir):
+            year = _extract_year(csv_file)
+            unified = year is not None and year >= _UNIFIED_YEAR
+            transform_csv_header_and_columns(
+                csv_file,
+                column_map=rename_map if unified else None,
+                allowed_columns=contract.required_columns,
+            )
 
     # Step 3: Copy weather CSVs to validated dir
     if dataset_name == "weather_daily":
         validated_dir.mkdir(parents=True, exist_ok=True)
-        for csv_file in sorted(raw_dir.rglob("*.csv")):
+        for csv_file in find_csv_files(raw_dir):
             relative = csv_file.relative_to(raw_dir)
             dest = validated_dir / relative
             dest.parent.mkdir(parents=True, exist_ok=True)
             shutil.copy2(csv_file, dest)
 
-    # Step 4: Normalize encoding on all CSVs in validated dir
-    for csv_file in sorted(validated_dir.rglob("*.csv")):
-        normalize_encoding(csv_file)
-
-    # Step 5: Validate all CSVs against contract
-    results = validate_dataset(validated_dir, contract)
+    # Step 4: Normalize encoding and validate all CSVs against the contract
+    # in one pass per file; files already in UTF-8 are read only once.
+    # Detection results persist across runs so files that do need
+    # normalizing skip charset-normalizer when unchanged.
+    results = validate_dataset(
+        validated_dir,
+        contract,
+        normalize=True,
+        encoding_cache_path=output_dir / _ENCODING_CACHE_NAME,
+        max_workers=max_workers,
+    )
     return results
 
 
@@ -11,17 +11,27 @@ Usage:
 from __future__ import annotations
 
 import csv
+import json
 import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Final
 
 from scripts.load import TABLE_CONFIGS, LoadError, SnowflakeConnectionManager
+from scripts.validate import find_csv_files
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
 _TOLERANCE_PCT: Final[float] = 1.0
+_COUNT_CHUNK_BYTES: Final[int] = 1_048_576
+# Row counting is I/O-bound and file reads release the GIL, so threads
+# overlap reads across a dataset's files.
+_COUNT_WORKERS: Final[int] = 8
 _VALIDATED_DIR: Final[Path] = Path("data/validated")
+# Per-file row counts from earlier runs: path -> [mtime_ns, size, rows].
+_ROW_COUNT_CACHE_PATH: Final[Path] = Path("data/.cache/rowcounts.json")
 
 _DATASET_SUBDIRS: Final[dict[str, str]] = {
     "ttc_subway_delays": "ttc_subway",
@@ -32,30 +42,110 @@ _DATASET_SUBDIRS: Final[dict[str, str]] = {
 }
 
 
-def _count_source_rows(dataset_name: str) -> int:
+def _count_source_rows(
+    dataset_name: str,
+    row_cache: dict[str, list[int]] | None = None,
+) -> int:
     """Count total data rows across all validated CSV files for a dataset.
 
     Args:
         dataset_name: Machine-readable dataset identifier.
+        row_cache: Cached counts keyed by path. A file whose mtime and
+            size match its entry is not read; other files are counted
+            and their entries updated in place.
 
     Returns:
         Total row count (excluding header rows).
     """
+    if row_cache is None:
+        row_cache = {}
     subdir = _DATASET_SUBDIRS.get(dataset_name, "")
-    validated_dir = _VALIDATED_DIR / subdir
-    if not validated_dir.exists():
-        return 0
 
     total = 0
-    for csv_path in sorted(validated_dir.rglob("*.csv")):
-        with csv_path.open("r", encoding="utf-8") as fh:
-            reader = csv.reader(fh)
-            next(reader, None)  # skip header
-            total += sum(1 for _ in reader)
+    misses: list[tuple[Path, os.stat_result]] = []
+    for csv_path in find_csv_files(_VALIDATED_DIR / subdir):
+        stat = csv_path.stat()
+        entry = row_cache.get(str(csv_path))
+        if entry is not None and entry[:2] == [stat.st_mtime_ns, stat.st_size]:
+            total += entry[2]
+        else:
+            misses.append((csv_path, stat))
 
+    for (csv_path, stat), rows in zip(
+        misses, _count_files([p for p, _ in misses]), strict=True
+    ):
+        row_cache[str(csv_path)] = [stat.st_mtime_ns, stat.st_size, rows]
+        total += rows
     return total
 
 
+def _count_files(csv_paths: list[Path]) -> list[int]:
+    """Count data rows in each file, reading up to _COUNT_WORKERS at once."""
+    workers = min(_COUNT_WORKERS, len(csv_paths))
+    if workers <= 1:
+        return list(map(_count_file_rows, csv_paths))
+    with ThreadPoolExecutor(workers, thread_name_prefix="count") as pool:
+        return list(pool.map(_count_file_rows, csv_paths))
+
+
+def _count_file_rows(csv_path: Path) -> int:
+    """Count the data rows in one CSV file, excluding the header.
+
+    Without a quote character no field can span lines, so the row count
+    is the line count, taken with bytes.count over 1 MB chunks. A file
+    that contains a quote is counted with csv.reader instead.
+    """
+    lines = 0
+    last = b""
+    with csv_path.open("rb") as fh:
+        if hasattr(os, "posix_fadvise"):
+            # The file is read once front to back; ask for larger readahead.
+            os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        while chunk := fh.read(_COUNT_CHUNK_BYTES):
+            if b'"' in chunk:
+                break
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+        else:
+            if last not in (b"", b"\n"):
+                lines += 1  # final line without a trailing newline
+            return max(lines - 1, 0)
+
+    with csv_path.open(
+        "r", buffering=_COUNT_CHUNK_BYTES, encoding="utf-8", newline=""
+    ) as fh:
+        reader = csv.reader(fh)
+        next(reader, None)  # skip header
+        return sum(1 for _ in reader)
+
+
+def _load_row_count_cache(path: Path) -> dict[str, list[int]]:
+    """Load cached per-file row counts; a missing or corrupt cache is empty."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {
+        str(key): [int(v) for v in value]
+        for key, value in data.items()
+        if isinstance(value, list) and len(value) == 3
+    }
+
+
+def _save_row_count_cache(path: Path, row_cache: dict[str, list[int]]) -> None:
+    """Persist row counts via atomic write (temp file + replace).
+
+    Entries for files that no longer exist are dropped.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    live = {key: value for key, value in row_cache.items() if Path(key).exists()}
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(live, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
 def _count_snowflake_rows(
     dataset_name: str,
     connection_manager: SnowflakeConnectionManager,
@@ -90,6 +180,7 @@ def validate_row_counts() -> bool:
         True if all datasets are within the 1% tolerance threshold.
     """
     connection_manager = SnowflakeConnectionManager()
+    row_cache = _load_row_count_cache(_ROW_COUNT_CACHE_PATH)
     all_pass = True
 
     header = (
@@ -103,7 +194,7 @@ def validate_row_counts() -> bool:
     print("-" * 80)
 
     for dataset_name in TABLE_CONFIGS:
-        source_rows = _count_source_rows(dataset_name)
+        source_rows = _count_source_rows(dataset_name, row_cache)
 
         try:
             sf_rows = _count_snowflake_rows(dataset_name, connection_manager)
@@ -130,6 +221,8 @@ def validate_row_counts() -> bool:
             f"{diff_pct:>7.2f}% {status:<8}"
         )
 
+    _save_row_count_cache(_ROW_COUNT_CACHE_PATH, row_cache)
+
     print("-" * 80)
     overall = "PASS" if all_pass else "FAIL"
     print(f"Overall: {overall}")
@@ -30,11 +30,30 @@ CREATE STAGE IF NOT EXISTS TORONTO_MOBILITY.RAW.INGESTION_STAGE
     )
     COMMENT = 'Internal stage for CSV file ingestion into RAW schema tables';
 
+-- Named copy of the stage file format, referenced by the loader's COPY INTO
+-- so it can use the direct-scan column-list COPY instead of a SELECT transform.
+-- scripts/load.py requires it, so existing deployments must re-run this script.
+-- ERROR_ON_COLUMN_COUNT_MISMATCH = FALSE keeps the tolerance of the old
+-- SELECT $1..$n projection: extra trailing columns (only TTC files are
+-- stripped to their contract columns) are ignored instead of aborting COPY.
+CREATE OR REPLACE FILE FORMAT TORONTO_MOBILITY.RAW.CSV_DEFAULT
+    TYPE = 'CSV'
+    FIELD_DELIMITER = ','
+    RECORD_DELIMITER = '\n'
+    FIELD_OPTIONALLY_ENCLOSED_BY = '"'
+    SKIP_HEADER = 1
+    NULL_IF = ('', 'NULL', 'null')
+    COMPRESSION = 'AUTO'
+    ENCODING = 'UTF8'
+    ERROR_ON_COLUMN_COUNT_MISMATCH = FALSE
+    COMMENT = 'CSV format for COPY INTO RAW schema tables';
+
 -- =============================================================================
--- SECTION 2: LOADER_ROLE GRANTS ON STAGE
+-- SECTION 2: LOADER_ROLE GRANTS ON STAGE AND FILE FORMAT
 -- =============================================================================
 
 GRANT USAGE ON STAGE TORONTO_MOBILITY.RAW.INGESTION_STAGE TO ROLE LOADER_ROLE;
+GRANT USAGE ON FILE FORMAT TORONTO_MOBILITY.RAW.CSV_DEFAULT TO ROLE LOADER_ROLE;
 
 -- =============================================================================
 -- SECTION 3: RAW SCHEMA TABLE DEFINITIONS
@@ -108,6 +127,11 @@ CREATE TABLE IF NOT EXISTS TORONTO_MOBILITY.RAW.BIKE_SHARE_TRIPS (
 )
 COMMENT = 'Bike Share Toronto trip records from Toronto Open Data Portal (2019-present)';
 
+-- No clustering key: the loader's DELETE filters on TRIP_ID alone, which a
+-- date key cannot prune and a near-unique TRIP_ID key would only keep
+-- reclustering. Drop any key set by earlier versions of this script.
+ALTER TABLE TORONTO_MOBILITY.RAW.BIKE_SHARE_TRIPS DROP CLUSTERING KEY;
+
 -- Weather Daily (DESIGN-DOC Section 4.3.3)
 -- Environment Canada Historical Climate Data, Station ID 51459 (Toronto Pearson)
 -- All 31 standard daily weather columns preserved for completeness
@@ -146,6 +170,10 @@ CREATE TABLE IF NOT EXISTS TORONTO_MOBILITY.RAW.WEATHER_DAILY (
 )
 COMMENT = 'Environment Canada daily weather observations for Toronto Pearson (2019-present)';
 
+-- A few thousand rows fit in a handful of micro-partitions; a clustering
+-- key would only spend automatic-clustering credits.
+ALTER TABLE TORONTO_MOBILITY.RAW.WEATHER_DAILY DROP CLUSTERING KEY;
+
 -- =============================================================================
 -- SECTION 4: VERIFICATION QUERIES
 -- =============================================================================
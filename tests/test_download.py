@@ -8,6 +8,7 @@ and SHA-256 integrity verification. All HTTP calls are mocked via respx.
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Final
 
@@ -306,6 +307,7 @@ class TestDownloadManifest:
 
         assert len(manifest.entries) == 1
         assert manifest.entries[0].byte_size == 200
+        assert manifest.find_entry("https://example.com/file.csv") is entry_v2
 
     def test_prune_removes_missing_files(self, tmp_path: Path) -> None:
         existing: Path = tmp_path / "exists.csv"
@@ -336,6 +338,7 @@ class TestDownloadManifest:
         assert removed == 1
         assert len(manifest.entries) == 1
         assert manifest.entries[0].url == "https://example.com/exists.csv"
+        assert manifest.find_entry("https://example.com/gone.csv") is None
 
     def test_atomic_save_creates_file(self, tmp_path: Path) -> None:
         manifest_path: Path = tmp_path / "subdir" / ".manifest.json"
@@ -343,6 +346,29 @@ class TestDownloadManifest:
         manifest.save()
         assert manifest_path.exists()
 
+    def test_concurrent_upsert_and_save(self, tmp_path: Path) -> None:
+        manifest: DownloadManifest = DownloadManifest(path=tmp_path / ".manifest.json")
+
+        def record(idx: int) -> None:
+            manifest.upsert(
+                ManifestEntry(
+                    url=f"https://example.com/{idx}.csv",
+                    file_path=str(tmp_path / f"{idx}.csv"),
+                    byte_size=idx,
+                    sha256_hash="abc",
+                    download_timestamp="2024-01-01T00:00:00+00:00",
+                    http_status=200,
+                )
+            )
+            manifest.save()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(record, range(64)))
+
+        reloaded: DownloadManifest = DownloadManifest.load(manifest.path)
+        assert len(manifest.entries) == 64
+        assert len(reloaded.entries) == 64
+
 
 # ---------------------------------------------------------------------------
 # CKAN download
@@ -0,0 +1,146 @@
+"""Tests for TTC station mapping seed generation.
+
+Covers station name resolution (explicit overrides, core lookup after
+suffix stripping, compound and APPROACHING forms), line code
+normalization, seed CSV output, and pooled versus inline resolution.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+import pytest
+
+import scripts.generate_station_mapping as mapping
+from scripts.generate_station_mapping import (
+    _OUTPUT_COLUMNS,
+    _normalize_line_code,
+    _resolve_all,
+    _resolve_batch,
+    _resolve_station,
+    _write_mapping,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_resolve_cache() -> Iterator[None]:
+    """Keep memoized resolutions from leaking between tests."""
+    _resolve_station.cache_clear()
+    yield
+    _resolve_station.cache_clear()
+
+
+class TestResolveStation:
+    """Priority-ordered matching of raw names to canonical stations."""
+
+    @pytest.mark.parametrize(
+        ("raw_name", "expected"),
+        [
+            # Explicit override, including its line
+            ("YONGE BD STATION", ("Bloor-Yonge", "ST_011", "BD")),
+            # Core lookup after stripping a station suffix
+            ("UNION STATION", ("Union", "ST_017", "YU")),
+            # Core lookup after stripping a line qualifier
+            ("KENNEDY BD STATION", ("Kennedy", "ST_066", "BD")),
+            # "X TO Y" resolves to the first station
+            ("ST GEORGE TO MUSEUM", ("St. George", "ST_023", "YU")),
+            # APPROACHING qualifiers, bare and parenthesised
+            ("APPROACHING UNION", ("Union", "ST_017", "YU")),
+            ("(APPROACHING) KENNEDY", ("Kennedy", "ST_066", "BD")),
+        ],
+    )
+    def test_resolves_representative_names(
+        self, raw_name: str, expected: tuple[str, str, str]
+    ) -> None:
+        assert _resolve_station(raw_name, "YU") == expected
+
+    def test_unknown_uses_normalized_primary_line(self) -> None:
+        assert _resolve_station("FOO BAR", "bd line") == ("Unknown", "ST_000", "BD")
+
+    def test_explicit_override_on_qualified_name_wins(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        override = ("Finch", "ST_001", "YU")
+        monkeypatch.setitem(mapping._EXPLICIT_FULL, "APPROACHING UNION", override)
+
+        assert _resolve_station("APPROACHING UNION", "YU") == override
+
+
+class TestNormalizeLineCode:
+    """Line code extraction from free-form values."""
+
+    @pytest.mark.parametrize(
+        ("raw_line", "expected"),
+        [
+            ("yu", "YU"),
+            ("BD LINE", "BD"),
+            ("SHEP", "SHP"),
+            ("SRT/YU", "SRT"),
+            ("YU/BD", "YU"),
+            ("??", "YU"),
+        ],
+    )
+    def test_normalizes(self, raw_line: str, expected: str) -> None:
+        assert _normalize_line_code(raw_line) == expected
+
+
+class TestWriteMapping:
+    """Seed CSV output on the fast and quoting paths."""
+
+    @staticmethod
+    def _csv_writer_bytes(rows: list[list[str]]) -> bytes:
+        buf = io.StringIO(newline="")
+        writer = csv.writer(buf)
+        writer.writerow(_OUTPUT_COLUMNS)
+        writer.writerows(rows)
+        return buf.getvalue().encode("utf-8")
+
+    def test_unquoted_rows_match_csv_writer(self, tmp_path: Path) -> None:
+        rows = [["UNION STN", "Union", "ST_017", "YU"]]
+        output = tmp_path / "seeds" / "mapping.csv"
+
+        _write_mapping(output, rows)
+
+        assert output.read_bytes() == self._csv_writer_bytes(rows)
+
+    def test_fields_needing_quotes_fall_back_to_csv_writer(
+        self, tmp_path: Path
+    ) -> None:
+        rows = [
+            ["UNION STN", "Union", "ST_017", "YU"],
+            ['BLOOR, "YONGE"', "Bloor-Yonge", "ST_011", "YU"],
+        ]
+        output = tmp_path / "mapping.csv"
+
+        _write_mapping(output, rows)
+
+        assert output.read_bytes() == self._csv_writer_bytes(rows)
+        with output.open(encoding="utf-8", newline="") as f:
+            assert list(csv.reader(f))[2][0] == 'BLOOR, "YONGE"'
+
+
+class TestResolveAll:
+    """Inline and process-pool resolution agree."""
+
+    def test_pooled_matches_inline(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        pairs = [
+            ("Union Station", "YU"),
+            ("KENNEDY BD STATION", "BD"),
+            ("Approaching Union", "YU"),
+            ("St George to Museum", "YU"),
+            ("YONGE BD STATION", "BD"),
+            ("Foo Bar", "SHEP"),
+        ] * 3
+        expected = _resolve_batch(pairs)
+        monkeypatch.setattr(mapping, "_PARALLEL_MIN_NAMES", 1)
+        monkeypatch.setattr(mapping, "_PARALLEL_CHUNK_SIZE", 4)
+
+        assert _resolve_all(pairs) == expected
+        # Raw spelling is kept as the join key
+        assert expected[0][0] == "Union Station"
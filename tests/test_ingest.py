@@ -6,6 +6,7 @@ Tests cover pipeline flow, error handling, and CLI behavior.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -52,6 +53,12 @@ def mock_merge_result():
 class TestRunPipeline:
     """Tests for the run_pipeline orchestration function."""
 
+    @pytest.fixture(autouse=True)
+    def mock_connection_manager(self):
+        """Stub the Snowflake connection shared by the load stage."""
+        with patch("scripts.load.SnowflakeConnectionManager") as mock_mgr_cls:
+            yield mock_mgr_cls
+
     @patch("scripts.ingest._run_load")
     @patch("scripts.ingest._run_transform_and_validate")
     @patch("scripts.ingest._run_download")
@@ -74,6 +81,8 @@ class TestRunPipeline:
         assert result.success is True
         assert len(result.datasets_processed) == 1
         assert result.datasets_processed[0].status == DatasetStatus.SUCCESS
+        assert result.datasets_processed[0].rows_loaded == 100
+        assert result.total_rows_loaded == 100
         mock_download.assert_called_once()
         mock_validate.assert_called_once()
         mock_load.assert_called_once()
@@ -106,7 +115,7 @@ class TestRunPipeline:
                     mismatches=["Missing column: Date"],
                 )
 
-        mock_validate.side_effect = lambda n: validate_side_effect(n)
+        mock_validate.side_effect = lambda n, **_: validate_side_effect(n)
         mock_load.return_value = mock_merge_result
 
         result = run_pipeline(datasets=["ttc_subway_delays", "ttc_bus_delays"])
@@ -116,6 +125,72 @@ class TestRunPipeline:
         assert statuses["ttc_subway_delays"] == DatasetStatus.FAILED
         assert statuses["ttc_bus_delays"] == DatasetStatus.SUCCESS
 
+    @patch("scripts.ingest._run_load")
+    @patch("scripts.ingest._run_transform_and_validate")
+    @patch("scripts.ingest._run_download")
+    @patch("scripts.ingest._get_validated_csvs")
+    def test_results_preserve_input_order(
+        self,
+        mock_csvs,
+        mock_download,
+        mock_validate,
+        mock_load,
+        mock_merge_result,
+    ):
+        """Concurrent datasets are reported in the order they were requested."""
+        mock_csvs.return_value = [Path("test.csv")]
+        mock_load.return_value = mock_merge_result
+        names = ["weather_daily", "ttc_bus_delays", "ttc_subway_delays"]
+
+        result = run_pipeline(datasets=names, workers=2)
+
+        assert [r.dataset_name for r in result.datasets_processed] == names
+
+    @patch("scripts.ingest._run_load")
+    @patch("scripts.ingest._run_transform_and_validate")
+    @patch("scripts.ingest._run_download")
+    @patch("scripts.ingest._get_validated_csvs")
+    def test_loads_share_one_connection(
+        self,
+        mock_csvs,
+        mock_download,
+        mock_validate,
+        mock_load,
+        mock_merge_result,
+        mock_connection_manager,
+    ):
+        """All datasets load over a single connection opened once."""
+        mock_csvs.return_value = [Path("test.csv")]
+        mock_load.return_value = mock_merge_result
+        mock_mgr = mock_connection_manager.return_value
+
+        run_pipeline(datasets=["ttc_subway_delays", "ttc_bus_delays"])
+
+        mock_connection_manager.assert_called_once_with(autocommit=False)
+        mock_mgr.connect.assert_called_once()
+        conns = {c.args[1] for c in mock_load.call_args_list}
+        assert conns == {mock_mgr.connect.return_value}
+        mock_mgr.__exit__.assert_called_once()
+
+    @patch("scripts.ingest._run_load")
+    @patch("scripts.ingest._run_transform_and_validate")
+    @patch("scripts.ingest._run_download")
+    @patch("scripts.ingest._get_validated_csvs")
+    def test_unexpected_error_propagates(
+        self,
+        mock_csvs,
+        mock_download,
+        mock_validate,
+        mock_load,
+    ):
+        """Errors outside the pipeline's failure types are re-raised."""
+        mock_validate.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            run_pipeline(datasets=["ttc_subway_delays"])
+
+        mock_load.assert_not_called()
+
     @patch("scripts.ingest._run_load")
     @patch("scripts.ingest._run_transform_and_validate")
     @patch("scripts.ingest._run_download")
@@ -189,6 +264,107 @@ class TestRunPipeline:
         assert ds.stage == PipelineStage.DOWNLOAD
 
 
+# ---- Validated CSV listing tests -------------------------------------------
+
+
+class TestGetValidatedCsvs:
+    """Tests for the cached validated-CSV listing."""
+
+    def test_listing_cached_until_validation(self, validated_csvs, monkeypatch):
+        """Repeat lookups reuse the listing; validation invalidates it."""
+        monkeypatch.setattr("scripts.ingest._VALIDATED_DIR", validated_csvs)
+        monkeypatch.setattr("scripts.ingest._VALIDATED_CSV_CACHE", {})
+        from scripts.ingest import _get_validated_csvs, _run_transform_and_validate
+
+        first = _get_validated_csvs("ttc_subway_delays")
+        (validated_csvs / "ttc_subway" / "test_2024.csv").write_text("a\n1\n")
+
+        assert _get_validated_csvs("ttc_subway_delays") is first
+        assert len(first) == 1
+
+        with patch("scripts.validate._run_pipeline"):
+            _run_transform_and_validate("ttc_subway_delays")
+
+        assert len(_get_validated_csvs("ttc_subway_delays")) == 2
+
+    def test_listing_matches_rglob_order(self, tmp_path, monkeypatch):
+        """Nested CSVs are found and sorted exactly as rglob would."""
+        root = tmp_path / "ttc_bus"
+        for rel in ("2024/b.csv", "2023/a.csv", "2023-x/c.csv", "2023/n.txt"):
+            path = root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("a\n1\n")
+        monkeypatch.setattr("scripts.ingest._VALIDATED_DIR", tmp_path)
+        monkeypatch.setattr("scripts.ingest._VALIDATED_CSV_CACHE", {})
+        from scripts.ingest import _get_validated_csvs
+
+        assert _get_validated_csvs("ttc_bus_delays") == sorted(root.rglob("*.csv"))
+
+
+class TestValidationCache:
+    """Tests for skipping validation when raw inputs are unchanged."""
+
+    def test_unchanged_inputs_skip_validation(self, tmp_path, monkeypatch):
+        """A repeat run reuses outputs; a raw change re-validates."""
+        raw_dir = tmp_path / "raw"
+        validated_dir = tmp_path / "validated"
+        raw_file = raw_dir / "weather" / "2024" / "weather_daily_2024.csv"
+        raw_file.parent.mkdir(parents=True)
+        raw_file.write_text("a\n1\n")
+        monkeypatch.setattr("scripts.ingest._RAW_DIR", raw_dir)
+        monkeypatch.setattr("scripts.ingest._VALIDATED_DIR", validated_dir)
+        monkeypatch.setattr("scripts.ingest._VALIDATED_CSV_CACHE", {})
+        from scripts.ingest import _run_transform_and_validate
+
+        def fake_validate(**kwargs):
+            out = validated_dir / "weather" / "2024" / "weather_daily_2024.csv"
+            out.parent.mkdir(parents=True, exist_ok=True)
+            out.write_text(raw_file.read_text())
+
+        with patch("scripts.validate._run_pipeline", side_effect=fake_validate) as run:
+            _run_transform_and_validate("weather_daily")
+            _run_transform_and_validate("weather_daily")
+            assert run.call_count == 1
+
+            raw_file.write_text("a\n2\n")
+            _run_transform_and_validate("weather_daily")
+            assert run.call_count == 2
+
+    def test_edited_output_or_code_revalidates(self, tmp_path, monkeypatch):
+        """A same-size edit to an output or a code change re-validates."""
+        raw_dir = tmp_path / "raw"
+        validated_dir = tmp_path / "validated"
+        raw_file = raw_dir / "weather" / "2024" / "weather_daily_2024.csv"
+        raw_file.parent.mkdir(parents=True)
+        raw_file.write_text("a\n1\n")
+        code = tmp_path / "validate.py"
+        code.write_text("VERSION = 1\n")
+        monkeypatch.setattr("scripts.ingest._RAW_DIR", raw_dir)
+        monkeypatch.setattr("scripts.ingest._VALIDATED_DIR", validated_dir)
+        monkeypatch.setattr("scripts.ingest._VALIDATED_CSV_CACHE", {})
+        monkeypatch.setattr("scripts.ingest._PIPELINE_SOURCES", (code,))
+        from scripts.ingest import _run_transform_and_validate
+
+        out = validated_dir / "weather" / "2024" / "weather_daily_2024.csv"
+
+        def fake_validate(**kwargs):
+            out.parent.mkdir(parents=True, exist_ok=True)
+            out.write_text(raw_file.read_text())
+
+        with patch("scripts.validate._run_pipeline", side_effect=fake_validate) as run:
+            _run_transform_and_validate("weather_daily")
+
+            out.write_text("a\n9\n")
+            mtime_ns = out.stat().st_mtime_ns + 1_000_000_000
+            os.utime(out, ns=(mtime_ns, mtime_ns))
+            _run_transform_and_validate("weather_daily")
+            assert run.call_count == 2
+
+            code.write_text("VERSION = 2\n")
+            _run_transform_and_validate("weather_daily")
+            assert run.call_count == 3
+
+
 # ---- Transaction control tests -----------------------------------------------
 
 
@@ -196,14 +372,14 @@ class TestTransactionControl:
     """Tests for per-dataset atomic transaction boundaries."""
 
     @patch("scripts.ingest._get_validated_csvs")
-    @patch("scripts.ingest.SnowflakeConnectionManager")
-    def test_begin_commit_on_success(self, mock_mgr_cls, mock_csvs, tmp_path):
-        """Successful load executes BEGIN and COMMIT."""
+    def test_commit_on_success(self, mock_csvs, tmp_path):
+        """Successful load commits without an explicit BEGIN round-trip."""
         csv_path = tmp_path / "test.csv"
         csv_path.write_text("Date\n2023-01-01\n")
         mock_csvs.return_value = [csv_path]
 
         mock_conn = MagicMock()
+        mock_conn.is_still_running.return_value = False
         mock_cursor = MagicMock()
         mock_conn.cursor.return_value = mock_cursor
         mock_cursor.fetchall.return_value = [
@@ -211,22 +387,16 @@ class TestTransactionControl:
         ]
         mock_cursor.fetchone.return_value = (50, 0)
 
-        mock_mgr = MagicMock()
-        mock_mgr.__enter__ = MagicMock(return_value=mock_conn)
-        mock_mgr.__exit__ = MagicMock(return_value=False)
-        mock_mgr_cls.return_value = mock_mgr
-
         from scripts.ingest import _run_load
 
-        _run_load("ttc_subway_delays", mock_mgr)
+        _run_load("ttc_subway_delays", mock_conn)
 
         sqls = [c[0][0] for c in mock_cursor.execute.call_args_list if c[0]]
-        assert any("BEGIN" in s for s in sqls)
+        assert not any("BEGIN" in s for s in sqls)
         mock_conn.commit.assert_called_once()
 
     @patch("scripts.ingest._get_validated_csvs")
-    @patch("scripts.ingest.SnowflakeConnectionManager")
-    def test_rollback_on_failure(self, mock_mgr_cls, mock_csvs, tmp_path):
+    def test_rollback_on_failure(self, mock_csvs, tmp_path):
         """Failed load executes ROLLBACK."""
         import snowflake.connector.errors
 
@@ -235,33 +405,77 @@ class TestTransactionControl:
         mock_csvs.return_value = [csv_path]
 
         mock_conn = MagicMock()
+        mock_conn.is_still_running.return_value = False
         mock_cursor = MagicMock()
         mock_conn.cursor.return_value = mock_cursor
         # PUT succeeds, then MERGE CREATE TEMP fails
         call_idx = 0
 
-        def execute_side_effect(sql: str) -> None:
+        def execute_side_effect(sql: str, **kwargs: object) -> None:
             nonlocal call_idx
             call_idx += 1
-            if "CREATE TEMPORARY" in sql:
+            if "TEMPORARY TABLE" in sql:
                 raise snowflake.connector.errors.Error(msg="No permissions")
 
         mock_cursor.execute.side_effect = execute_side_effect
+        mock_cursor.execute_async.side_effect = execute_side_effect
         mock_cursor.fetchall.return_value = [
             ("f.csv", "f.gz", 100, 50, "n", "g", "UPLOADED", "")
         ]
 
-        mock_mgr = MagicMock()
-        mock_mgr.__enter__ = MagicMock(return_value=mock_conn)
-        mock_mgr.__exit__ = MagicMock(return_value=False)
-        mock_mgr_cls.return_value = mock_mgr
-
         from scripts.ingest import _run_load
 
         with pytest.raises(LoadError):
-            _run_load("ttc_subway_delays", mock_mgr)
+            _run_load("ttc_subway_delays", mock_conn)
+
+        mock_conn.rollback.assert_called_once()
+
+    @patch("scripts.load.load_dataset")
+    @patch("scripts.ingest._get_validated_csvs")
+    def test_rollback_on_non_snowflake_error(self, mock_csvs, mock_load, tmp_path):
+        """Errors outside LoadError/Snowflake still roll back and propagate."""
+        mock_csvs.return_value = [tmp_path / "test.csv"]
+        mock_load.side_effect = OSError("disk read failed")
+        mock_conn = MagicMock()
+
+        from scripts.ingest import _run_load
+
+        with pytest.raises(OSError, match="disk read failed"):
+            _run_load("ttc_subway_delays", mock_conn)
 
         mock_conn.rollback.assert_called_once()
+        mock_conn.commit.assert_not_called()
+
+    @patch("scripts.ingest._run_load")
+    def test_session_discards_connection_after_failed_load(self, mock_run_load):
+        """A load failure caught by the caller still reaches the manager's exit."""
+        from scripts.ingest import _LoadSession
+
+        manager = MagicMock()
+        failure = LoadError("MERGE failed")
+        mock_run_load.side_effect = [failure, MagicMock()]
+
+        with _LoadSession(manager) as session:
+            with pytest.raises(LoadError):
+                session.load("ttc_subway_delays")
+            session.load("ttc_bus_delays")
+
+        manager.__exit__.assert_called_once_with(
+            LoadError, failure, failure.__traceback__
+        )
+
+    @patch("scripts.ingest._run_load")
+    def test_session_pools_connection_after_clean_loads(self, mock_run_load):
+        """Clean loads leave the manager free to pool the connection."""
+        from scripts.ingest import _LoadSession
+
+        manager = MagicMock()
+
+        with _LoadSession(manager) as session:
+            session.load("ttc_subway_delays")
+
+        manager.connect.assert_called_once()
+        manager.__exit__.assert_called_once_with(None, None, None)
 
 
 # ---- CLI tests ---------------------------------------------------------------
@@ -281,6 +495,8 @@ class TestCLI:
         mock_run.assert_called_once_with(
             datasets=None,
             skip_download=False,
+            workers=None,
+            pipeline=True,
         )
 
     @patch("scripts.ingest.run_pipeline")
@@ -294,6 +510,8 @@ class TestCLI:
         mock_run.assert_called_once_with(
             datasets=["ttc_subway_delays"],
             skip_download=False,
+            workers=None,
+            pipeline=True,
         )
 
     @patch("scripts.ingest.run_pipeline")
@@ -307,13 +525,45 @@ class TestCLI:
         mock_run.assert_called_once_with(
             datasets=None,
             skip_download=True,
+            workers=None,
+            pipeline=True,
+        )
+
+    @patch("scripts.ingest.run_pipeline")
+    def test_cli_workers(self, mock_run):
+        """--workers flag caps dataset concurrency in run_pipeline."""
+        mock_run.return_value = PipelineResult(success=True)
+
+        exit_code = main(["--all", "--workers", "2"])
+
+        assert exit_code == 0
+        mock_run.assert_called_once_with(
+            datasets=None,
+            skip_download=False,
+            workers=2,
+            pipeline=True,
+        )
+
+    @patch("scripts.ingest.run_pipeline")
+    def test_cli_no_pipeline(self, mock_run):
+        """--no-pipeline disables overlapping PUT and COPY."""
+        mock_run.return_value = PipelineResult(success=True)
+
+        exit_code = main(["--all", "--no-pipeline"])
+
+        assert exit_code == 0
+        mock_run.assert_called_once_with(
+            datasets=None,
+            skip_download=False,
+            workers=None,
+            pipeline=False,
         )
 
     @patch("scripts.ingest.run_pipeline")
     def test_cli_exits_1_on_failure(self, mock_run):
         """Exit code 1 when any dataset fails."""
         mock_run.return_value = PipelineResult(
-            datasets_processed=[
+            datasets_processed=(
                 DatasetResult(
                     dataset_name="test",
                     stage=PipelineStage.LOAD,
@@ -322,7 +572,7 @@ class TestCLI:
                     status=DatasetStatus.FAILED,
                     error_message="Load failed",
                 ),
-            ],
+            ),
             success=False,
         )
 
@@ -6,6 +6,10 @@ snowflake.connector.connect. No real Snowflake connections are made.
 
 from __future__ import annotations
 
+import gzip
+import os
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -15,14 +19,17 @@ from scripts.load import (
     CopyResult,
     LoadError,
     MergeResult,
+    MergeStrategy,
     SnowflakeConnectionManager,
     StageUploadResult,
     StageUploadStatus,
     TableConfig,
+    _split_csv,
     copy_into_table,
     get_table_config,
     load_dataset,
     merge_into_table,
+    upload_files_to_stage,
     upload_to_stage,
 )
 
@@ -40,6 +47,8 @@ def mock_connection():
         ("file.csv", "file.csv.gz", 1024, 512, "none", "gzip", "UPLOADED", "")
     ]
     cursor.fetchone.return_value = None
+    # Queries submitted with execute_async have already finished.
+    conn.is_still_running.return_value = False
     return conn
 
 
@@ -60,6 +69,13 @@ def sample_csv(tmp_path: Path) -> Path:
 # ---- Connection manager tests (S002) ----------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _empty_connection_pool():
+    """Keep pooled connections from leaking between tests."""
+    yield
+    SnowflakeConnectionManager.shutdown_pool()
+
+
 class TestSnowflakeConnectionManager:
     """Tests for credential resolution and connection lifecycle."""
 
@@ -83,6 +99,7 @@ class TestSnowflakeConnectionManager:
         assert call_kwargs["warehouse"] == "TRANSFORM_WH"
         assert call_kwargs["database"] == "TORONTO_MOBILITY"
         assert call_kwargs["schema"] == "RAW"
+        assert call_kwargs["autocommit"] is True
         assert call_kwargs["client_session_keep_alive"] is True
         assert call_kwargs["login_timeout"] == 30
         assert call_kwargs["network_timeout"] == 60
@@ -113,6 +130,34 @@ class TestSnowflakeConnectionManager:
         assert call_kwargs["user"] == "toml_user"
         assert call_kwargs["password"] == "toml_pass"
 
+    @patch("scripts.load.snowflake.connector.connect")
+    def test_credentials_resolved_once_per_manager(
+        self, mock_connect, tmp_path, monkeypatch
+    ):
+        """Credentials are cached per manager; toml re-read only on change."""
+        monkeypatch.delenv("SNOWFLAKE_ACCOUNT", raising=False)
+        monkeypatch.delenv("SNOWFLAKE_USER", raising=False)
+        monkeypatch.delenv("SNOWFLAKE_PASSWORD", raising=False)
+
+        toml_dir = tmp_path / ".snowflake"
+        toml_dir.mkdir()
+        toml_path = toml_dir / "connections.toml"
+        toml_path.write_text("[loader]\naccount = 'a1'\nuser = 'u1'\npassword = 'p1'\n")
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        mock_connect.return_value = MagicMock()
+
+        mgr = SnowflakeConnectionManager()
+        mgr.connect()
+        monkeypatch.setattr(Path, "home", lambda: Path("/nonexistent_home_dir"))
+        mgr.connect()
+        assert mock_connect.call_args[1]["account"] == "a1"
+
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        toml_path.write_text("[loader]\naccount = 'a2'\nuser = 'u2'\npassword = 'p2'\n")
+        os.utime(toml_path, ns=(0, toml_path.stat().st_mtime_ns + 1))
+        SnowflakeConnectionManager().connect()
+        assert mock_connect.call_args[1]["account"] == "a2"
+
     def test_connect_raises_when_no_credentials(self, monkeypatch):
         """LoadError raised when no credential source is available."""
         monkeypatch.delenv("SNOWFLAKE_ACCOUNT", raising=False)
@@ -125,20 +170,81 @@ class TestSnowflakeConnectionManager:
             mgr.connect()
 
     @patch("scripts.load.snowflake.connector.connect")
-    def test_context_manager_closes_connection(self, mock_connect, monkeypatch):
-        """Connection is closed when exiting the context manager."""
+    def test_password_hidden_from_credentials_repr(self, mock_connect, monkeypatch):
+        """The password reaches connect but not the credentials' repr."""
+        monkeypatch.setenv("SNOWFLAKE_ACCOUNT", "acct")
+        monkeypatch.setenv("SNOWFLAKE_USER", "user")
+        monkeypatch.delenv("SNOWFLAKE_PASSWORD", raising=False)
+        mock_connect.return_value = MagicMock()
+
+        mgr = SnowflakeConnectionManager(password="hunter2")
+        mgr.connect()
+
+        assert mock_connect.call_args[1]["password"] == "hunter2"
+        assert "hunter2" not in repr(mgr._resolve_credentials())
+
+    @patch("scripts.load.snowflake.connector.connect")
+    def test_context_manager_returns_connection_to_pool(
+        self, mock_connect, monkeypatch
+    ):
+        """Exiting the context pools the connection; shutdown closes it."""
         monkeypatch.setenv("SNOWFLAKE_ACCOUNT", "acct")
         monkeypatch.setenv("SNOWFLAKE_USER", "user")
         monkeypatch.setenv("SNOWFLAKE_PASSWORD", "pass")
 
         mock_conn = MagicMock()
+        mock_conn.is_closed.return_value = False
         mock_connect.return_value = mock_conn
 
         with SnowflakeConnectionManager() as conn:
             assert conn is mock_conn
+        mock_conn.close.assert_not_called()
 
+        SnowflakeConnectionManager.shutdown_pool()
         mock_conn.close.assert_called_once()
 
+    @patch("scripts.load.snowflake.connector.connect")
+    def test_pooled_connection_is_reused(self, mock_connect, monkeypatch):
+        """A live pooled connection is reused without re-authenticating."""
+        monkeypatch.setenv("SNOWFLAKE_ACCOUNT", "acct")
+        monkeypatch.setenv("SNOWFLAKE_USER", "user")
+        monkeypatch.setenv("SNOWFLAKE_PASSWORD", "pass")
+
+        mock_conn = MagicMock()
+        mock_conn.is_closed.return_value = False
+        mock_connect.return_value = mock_conn
+
+        with SnowflakeConnectionManager() as first:
+            pass
+        with SnowflakeConnectionManager() as second:
+            assert second is first
+
+        mock_connect.assert_called_once()
+        mock_conn.cursor().execute.assert_called_with("SELECT 1")
+
+    @patch("scripts.load.snowflake.connector.connect")
+    def test_stale_or_failed_connections_are_not_pooled(
+        self, mock_connect, monkeypatch
+    ):
+        """Connections from failed blocks are closed; settings isolate pools."""
+        monkeypatch.setenv("SNOWFLAKE_ACCOUNT", "acct")
+        monkeypatch.setenv("SNOWFLAKE_USER", "user")
+        monkeypatch.setenv("SNOWFLAKE_PASSWORD", "pass")
+
+        first, second, third = MagicMock(), MagicMock(), MagicMock()
+        for conn in (first, second, third):
+            conn.is_closed.return_value = False
+        mock_connect.side_effect = [first, second, third]
+
+        with pytest.raises(RuntimeError), SnowflakeConnectionManager():
+            raise RuntimeError("boom")
+        first.close.assert_called_once()
+
+        with SnowflakeConnectionManager(autocommit=False):
+            pass
+        with SnowflakeConnectionManager() as conn:
+            assert conn is third
+
     @patch("scripts.load.snowflake.connector.connect")
     def test_connect_failure_raises_load_error(self, mock_connect, monkeypatch):
         """LoadError raised with Snowflake error details on failure."""
@@ -190,9 +296,16 @@ class TestUploadToStage:
     def test_skipped_status_detected(self, mock_connection, sample_csv):
         """SKIPPED status from PUT is correctly propagated."""
         cursor = mock_connection.cursor()
-        cursor.fetchall.return_value = [
-            ("f.csv", "f.csv.gz", 100, 50, "none", "gzip", "SKIPPED", "")
-        ]
+        cursor.fetchone.return_value = (
+            "f.csv",
+            "f.csv.gz",
+            100,
+            50,
+            "none",
+            "gzip",
+            "SKIPPED",
+            "",
+        )
 
         result = upload_to_stage(mock_connection, sample_csv, "test/f.csv")
         assert result.status == StageUploadStatus.SKIPPED
@@ -210,6 +323,139 @@ class TestUploadToStage:
             upload_to_stage(mock_connection, sample_csv, "bad/path.csv")
 
 
+class TestUploadFilesToStage:
+    """Tests for the batched wildcard PUT."""
+
+    def test_maps_result_rows_to_local_files(self, mock_connection, tmp_path):
+        """Each PUT result row becomes a StageUploadResult for its file."""
+        paths = []
+        for name in ("a.csv", "b.csv"):
+            path = tmp_path / name
+            path.write_text("x\n1\n")
+            paths.append(path)
+        cursor = mock_connection.cursor()
+        cursor.__iter__.return_value = iter(
+            [
+                ("a.csv.gz", "a.csv.gz", 24, 24, "gzip", "gzip", "UPLOADED", ""),
+                ("b.csv.gz", "b.csv.gz", 24, 31, "gzip", "gzip", "SKIPPED", ""),
+            ]
+        )
+        staged: dict[str, bytes] = {}
+
+        def capture(sql: str) -> None:
+            tmp_dir = Path(sql.split("'file://", 1)[1].split("/*'", 1)[0])
+            for gz in tmp_dir.iterdir():
+                staged[gz.name] = gzip.decompress(gz.read_bytes())
+
+        cursor.execute.side_effect = capture
+
+        results = upload_files_to_stage(mock_connection, paths, "ttc_bus/")
+
+        assert [r.local_path for r in results] == paths
+        assert [r.stage_path for r in results] == ["ttc_bus/a.csv", "ttc_bus/b.csv"]
+        assert results[0].status == StageUploadStatus.UPLOADED
+        assert results[1].status == StageUploadStatus.SKIPPED
+        assert results[1].dest_size_bytes == 31
+        assert results[0].source_size_bytes == 4
+        assert staged == {"a.csv.gz": b"x\n1\n", "b.csv.gz": b"x\n1\n"}
+        put_sql = cursor.execute.call_args[0][0]
+        assert "AUTO_COMPRESS=FALSE SOURCE_COMPRESSION=GZIP" in put_sql
+
+    def test_duplicate_base_names_get_distinct_stage_names(
+        self, mock_connection, tmp_path
+    ):
+        """Same-named files from different directories are all staged."""
+        paths = []
+        for year in ("2023", "2024"):
+            path = tmp_path / year / "trips.csv"
+            path.parent.mkdir()
+            path.write_text(f"x\n{year}\n")
+            paths.append(path)
+        other = tmp_path / "other.csv"
+        other.write_text("x\n0\n")
+        paths.append(other)
+        cursor = mock_connection.cursor()
+        staged: dict[str, bytes] = {}
+
+        def capture(sql: str) -> None:
+            tmp_dir = Path(sql.split("'file://", 1)[1].split("/*'", 1)[0])
+            for gz in tmp_dir.iterdir():
+                staged[gz.name] = gzip.decompress(gz.read_bytes())
+            cursor.__iter__.return_value = iter(
+                [(n, n, 1, 1, "gzip", "gzip", "UPLOADED", "") for n in sorted(staged)]
+            )
+
+        cursor.execute.side_effect = capture
+
+        results = upload_files_to_stage(mock_connection, paths, "bike_share/")
+
+        assert staged == {
+            "0000_trips.csv.gz": b"x\n2023\n",
+            "0001_trips.csv.gz": b"x\n2024\n",
+            "other.csv.gz": b"x\n0\n",
+        }
+        assert {r.stage_path: r.local_path for r in results} == {
+            "bike_share/0000_trips.csv": paths[0],
+            "bike_share/0001_trips.csv": paths[1],
+            "bike_share/other.csv": other,
+        }
+
+
+class TestSplitCsv:
+    """Tests for chunking oversized CSVs before PUT."""
+
+    def test_chunks_keep_header_and_quoted_newlines(self, tmp_path):
+        """Chunks repeat the header and never cut inside a quoted field."""
+        rows = [f'{i},"note {i}\nsecond line",x' for i in range(40)]
+        source = tmp_path / "big.csv"
+        source.write_text("id,note,flag\n" + "\n".join(rows) + "\n")
+        out_dir = tmp_path / "chunks"
+        out_dir.mkdir()
+
+        chunks = _split_csv(source, out_dir, target_bytes=100)
+
+        assert len(chunks) > 1
+        assert chunks[0].name == "big_part0000.csv"
+        bodies = []
+        for chunk in chunks:
+            header, body = chunk.read_text().split("\n", 1)
+            assert header == "id,note,flag"
+            assert body.count('"') % 2 == 0
+            bodies.append(body)
+        assert "".join(bodies) == "\n".join(rows) + "\n"
+
+    def test_same_stem_files_split_without_clobbering(self, mock_connection, tmp_path):
+        """Oversized files sharing a stem each stage all of their chunks."""
+        cursor = mock_connection.cursor()
+        cursor.fetchone.return_value = (0, 0)
+        staged: dict[str, bytes] = {}
+
+        def capture(sql: str, **kwargs: object) -> None:
+            if sql.startswith("PUT"):
+                tmp_dir = Path(sql.split("'file://", 1)[1].split("/*'", 1)[0])
+                for gz in tmp_dir.iterdir():
+                    staged[gz.name] = gzip.decompress(gz.read_bytes())
+
+        cursor.execute.side_effect = capture
+        csvs = []
+        for year in ("2023", "2024"):
+            path = tmp_path / year / "trips.csv"
+            path.parent.mkdir()
+            rows = "".join(f"{year}-{i:03d}\n" for i in range(30))
+            path.write_text("id\n" + rows)
+            csvs.append(path)
+
+        with patch("scripts.load._SPLIT_THRESHOLD_BYTES", 100):
+            load_dataset(mock_connection, "bike_share_ridership", csvs, pipeline=False)
+
+        bodies = sorted(
+            line for data in staged.values() for line in data.decode().splitlines()[1:]
+        )
+        assert bodies == sorted(
+            f"{year}-{i:03d}" for year in ("2023", "2024") for i in range(30)
+        )
+
+
 # ---- COPY INTO tests (S003) -------------------------------------------------
 
 
@@ -234,17 +480,41 @@ class TestCopyIntoTable:
         assert "COPY INTO" in executed_sql
         assert "TTC_SUBWAY_DELAYS" in executed_sql
         assert "DATE, TIME, STATION" in executed_sql
-        assert "$1, $2, $3" in executed_sql
+        assert "FROM @TORONTO_MOBILITY.RAW.INGESTION_STAGE/ttc_subway/ " in (
+            executed_sql
+        )
+        assert "FORMAT_NAME = 'TORONTO_MOBILITY.RAW.CSV_DEFAULT'" in executed_sql
+        assert "SELECT" not in executed_sql
         assert "ON_ERROR = 'ABORT_STATEMENT'" in executed_sql
+        assert "PATTERN = 'ttc_subway/[^/]*[.]csv([.]gz)?'" in executed_sql
         assert "PURGE = FALSE" in executed_sql
 
+    def test_pattern_escapes_stage_path(self, mock_connection):
+        """Regex metacharacters in the stage path match literally."""
+        cursor = mock_connection.cursor()
+        cursor.fetchall.return_value = []
+
+        copy_into_table(mock_connection, "T", "v1.2+x/", ["A"])
+
+        executed_sql = cursor.execute.call_args[0][0]
+        assert "PATTERN = 'v1\\\\.2\\\\+x/[^/]*[.]csv([.]gz)?'" in executed_sql
+
+    def test_rejects_file_level_stage_path(self, mock_connection):
+        """A stage path without a trailing slash would match no files."""
+        with pytest.raises(ValueError, match="ending in '/'"):
+            copy_into_table(mock_connection, "T", "ttc_subway/a.csv.gz", ["A"])
+
+        mock_connection.cursor().execute.assert_not_called()
+
     def test_returns_copy_result_with_counts(self, mock_connection):
         """CopyResult contains parsed row counts from Snowflake response."""
         cursor = mock_connection.cursor()
-        cursor.fetchall.return_value = [
-            ("file1.csv.gz", "LOADED", 500, 500, 500, 0, None, None),
-            ("file2.csv.gz", "LOADED", 300, 300, 300, 0, None, None),
-        ]
+        cursor.__iter__.return_value = iter(
+            [
+                ("file1.csv.gz", "LOADED", 500, 500, 500, 0, None, None),
+                ("file2.csv.gz", "LOADED", 300, 300, 300, 0, None, None),
+            ]
+        )
 
         result = copy_into_table(
             mock_connection,
@@ -258,6 +528,24 @@ class TestCopyIntoTable:
         assert result.rows_parsed == 800
         assert result.errors_seen == 0
         assert result.first_error is None
+        assert result.files_loaded == ("file1.csv.gz", "file2.csv.gz")
+
+    def test_no_files_processed_row_is_ignored(self, mock_connection):
+        """The single-column status row for an empty COPY adds nothing."""
+        cursor = mock_connection.cursor()
+        cursor.__iter__.return_value = iter(
+            [("Copy executed with 0 files processed.",)]
+        )
+
+        result = copy_into_table(
+            mock_connection,
+            "TORONTO_MOBILITY.RAW.TTC_SUBWAY_DELAYS",
+            "ttc_subway/",
+            ["DATE", "TIME"],
+        )
+
+        assert result.rows_loaded == 0
+        assert result.files_loaded == ()
 
     def test_copy_failure_raises_load_error(self, mock_connection):
         """LoadError raised when COPY INTO fails."""
@@ -308,8 +596,8 @@ class TestMergeIntoTable:
         # Collect all executed SQL statements
         sqls = [call[0][0] for call in cursor.execute.call_args_list if call[0]]
 
-        # Verify CREATE TEMPORARY TABLE
-        assert any("CREATE TEMPORARY TABLE" in s for s in sqls)
+        # Verify the staging table is created like the target
+        assert any("TEMPORARY TABLE" in s and " LIKE " in s for s in sqls)
 
         # Verify COPY INTO staging
         assert any("COPY INTO" in s and "STAGING" in s for s in sqls)
@@ -322,9 +610,16 @@ class TestMergeIntoTable:
         assert "WHEN NOT MATCHED THEN INSERT" in merge_sql
         assert "target.DATE = staging.DATE" in merge_sql
         assert "target.CODE = staging.CODE" in merge_sql
+        assert "USING TORONTO_MOBILITY.RAW.TTC_SUBWAY_DELAYS_STAGING_DEDUP" in (
+            merge_sql
+        )
 
-        # Verify DROP TABLE in finally block
-        assert any("DROP TABLE IF EXISTS" in s for s in sqls)
+        # Verify staging rows are deduplicated by natural key first
+        dedup_sql = next(s for s in sqls if "_DEDUP AS" in s)
+        assert "PARTITION BY DATE, TIME, STATION" in dedup_sql
+
+        # Session-scoped temporary tables are left for Snowflake to drop
+        assert not any("DROP TABLE" in s for s in sqls)
 
     def test_returns_merge_result(self, mock_connection):
         """MergeResult contains insert and update counts."""
@@ -344,36 +639,176 @@ class TestMergeIntoTable:
         assert result.rows_updated == 25
         assert result.elapsed_seconds >= 0
 
-    def test_drops_staging_table_on_failure(self, mock_connection):
-        """Temporary table is dropped even when MERGE fails."""
+    def test_delete_insert_strategy(self, mock_connection):
+        """DELETE_INSERT replaces matching keys instead of running MERGE."""
+        cursor = self._setup_merge_cursor(mock_connection)
+        rowcounts = iter([40, 100])
+
+        def execute(sql: str, **kwargs: object) -> None:
+            if sql.startswith(("DELETE", "INSERT")):
+                cursor.rowcount = next(rowcounts)
+
+        cursor.execute.side_effect = execute
+
+        result = merge_into_table(
+            mock_connection,
+            target_table="TORONTO_MOBILITY.RAW.BIKE_SHARE_TRIPS",
+            natural_keys=["TRIP_ID"],
+            all_columns=["TRIP_ID", "BIKE_ID"],
+            stage_path="bike_share/",
+            column_mapping=["TRIP_ID", "BIKE_ID"],
+            merge_strategy=MergeStrategy.DELETE_INSERT,
+        )
+
+        sqls = [c[0][0] for c in cursor.execute.call_args_list]
+        assert not any("MERGE INTO" in s for s in sqls)
+        delete_sql = next(s for s in sqls if s.startswith("DELETE"))
+        assert "WHERE (TRIP_ID) IN (SELECT TRIP_ID FROM" in delete_sql
+        insert_sql = next(s for s in sqls if s.startswith("INSERT"))
+        assert insert_sql.endswith(
+            "(TRIP_ID, BIKE_ID) SELECT TRIP_ID, BIKE_ID "
+            "FROM TORONTO_MOBILITY.RAW.BIKE_SHARE_TRIPS_STAGING_DEDUP"
+        )
+        assert result.rows_inserted == 60
+        assert result.rows_updated == 40
+
+    def test_staging_statements_share_one_roundtrip(self, mock_connection):
+        """CREATE, COPY and dedup are sent as one multi-statement request."""
+        cursor = self._setup_merge_cursor(mock_connection)
+
+        merge_into_table(
+            mock_connection,
+            target_table="TORONTO_MOBILITY.RAW.TEST",
+            natural_keys=["ID"],
+            all_columns=["ID", "VAL"],
+            stage_path="test/",
+            column_mapping=["ID", "VAL"],
+        )
+
+        first = cursor.execute.call_args_list[0]
+        assert first.kwargs == {"num_statements": 3}
+        statements = first.args[0].split(";\n")
+        assert statements[0].startswith("CREATE OR REPLACE TEMPORARY TABLE")
+        assert statements[0].endswith("LIKE TORONTO_MOBILITY.RAW.TEST")
+        assert statements[1].startswith("COPY INTO")
+        assert statements[2].startswith("CREATE OR REPLACE TEMPORARY TABLE")
+
+    @pytest.mark.parametrize(
+        ("msg", "errno", "sqlstate"),
+        [
+            ("Actual statement count 3 did not match", 8, None),
+            (
+                "Actual statement count 3 did not match the desired statement count 1.",
+                None,
+                "0A000",
+            ),
+        ],
+        ids=["errno", "message"],
+    )
+    def test_falls_back_when_multi_statement_disabled(
+        self,
+        mock_connection,
+        msg: str,
+        errno: int | None,
+        sqlstate: str | None,
+    ):
+        """Statements run one by one when multi-statement is rejected."""
         import snowflake.connector.errors
 
-        cursor = mock_connection.cursor()
-        call_count = 0
+        cursor = self._setup_merge_cursor(mock_connection)
 
-        def side_effect(sql: str) -> None:
-            nonlocal call_count
-            call_count += 1
-            # Fail on the MERGE (third execute call after CREATE and COPY)
-            if "MERGE INTO" in sql:
-                raise snowflake.connector.errors.Error(msg="Merge failed")
+        def execute(sql: str, **kwargs: object) -> None:
+            if kwargs.get("num_statements"):
+                raise snowflake.connector.errors.ProgrammingError(
+                    msg=msg, errno=errno, sqlstate=sqlstate
+                )
 
-        cursor.execute.side_effect = side_effect
-        cursor.fetchall.return_value = []
+        cursor.execute.side_effect = execute
 
-        with pytest.raises(LoadError, match="MERGE INTO"):
-            merge_into_table(
-                mock_connection,
-                target_table="TORONTO_MOBILITY.RAW.TEST",
-                natural_keys=["ID"],
-                all_columns=["ID", "VAL"],
-                stage_path="test/",
-                column_mapping=["ID", "VAL"],
-            )
+        merge_into_table(
+            mock_connection,
+            target_table="TORONTO_MOBILITY.RAW.TEST",
+            natural_keys=["ID"],
+            all_columns=["ID", "VAL"],
+            stage_path="test/",
+            column_mapping=["ID", "VAL"],
+        )
+
+        sqls = [c.args[0] for c in cursor.execute.call_args_list[1:]]
+        assert sqls[0].endswith("_STAGING LIKE TORONTO_MOBILITY.RAW.TEST")
+        assert sqls[1].startswith("COPY INTO")
+        assert sqls[2].startswith("CREATE OR REPLACE TEMPORARY TABLE")
+        assert sqls[3].startswith("MERGE INTO")
+
+    def test_skips_upsert_when_staging_is_empty(self, mock_connection):
+        """No MERGE is issued when the staging COPY loaded zero rows."""
+        cursor = self._setup_merge_cursor(mock_connection)
+        cursor.__iter__.return_value = iter(
+            [("Copy executed with 0 files processed.",)]
+        )
+
+        result = merge_into_table(
+            mock_connection,
+            target_table="TORONTO_MOBILITY.RAW.TEST",
+            natural_keys=["ID"],
+            all_columns=["ID", "VAL"],
+            stage_path="test/",
+            column_mapping=["ID", "VAL"],
+        )
+
+        cursor.nextset.assert_called_once()
+        sqls = [c.args[0] for c in cursor.execute.call_args_list]
+        assert not any("MERGE INTO" in s for s in sqls)
+        assert (result.rows_inserted, result.rows_updated) == (0, 0)
+
+    def test_reuses_staging_table_within_session(self, mock_connection):
+        """Later loads on the same connection TRUNCATE instead of CREATE."""
+        cursor = self._setup_merge_cursor(mock_connection)
+        kwargs = {
+            "target_table": "TORONTO_MOBILITY.RAW.TEST",
+            "natural_keys": ["ID"],
+            "all_columns": ["ID", "VAL"],
+            "stage_path": "test/",
+            "column_mapping": ["ID", "VAL"],
+        }
 
-        # Verify DROP was attempted (last execute call)
-        last_call = cursor.execute.call_args_list[-1]
-        assert "DROP TABLE IF EXISTS" in last_call[0][0]
+        merge_into_table(mock_connection, **kwargs)
+        merge_into_table(mock_connection, **kwargs)
+
+        batches = [c.args[0] for c in cursor.execute.call_args_list if c.kwargs]
+        assert "LIKE TORONTO_MOBILITY.RAW.TEST;" in batches[0]
+        assert batches[1].startswith(
+            "TRUNCATE TABLE TORONTO_MOBILITY.RAW.TEST_STAGING;"
+        )
+
+    def test_failed_load_recreates_staging_table(self, mock_connection):
+        """After a failed MERGE the next load recreates the staging table."""
+        import snowflake.connector.errors
+
+        cursor = self._setup_merge_cursor(mock_connection)
+        kwargs = {
+            "target_table": "TORONTO_MOBILITY.RAW.TEST",
+            "natural_keys": ["ID"],
+            "all_columns": ["ID", "VAL"],
+            "stage_path": "test/",
+            "column_mapping": ["ID", "VAL"],
+        }
+        merge_into_table(mock_connection, **kwargs)
+
+        def side_effect(sql: str, **kwargs: object) -> None:
+            if "TRUNCATE" in sql:
+                raise snowflake.connector.errors.Error(msg="Table dropped")
+
+        cursor.execute.side_effect = side_effect
+        with pytest.raises(LoadError, match="Preparing staging data"):
+            merge_into_table(mock_connection, **kwargs)
+
+        cursor.execute.side_effect = None
+        merge_into_table(mock_connection, **kwargs)
+        last_batch = next(
+            c.args[0] for c in reversed(cursor.execute.call_args_list) if c.kwargs
+        )
+        assert last_batch.startswith("CREATE OR REPLACE TEMPORARY TABLE")
 
     def test_natural_keys_match_design_doc(self):
         """Table configs use natural keys from DESIGN-DOC Section 6.4."""
@@ -436,9 +871,227 @@ class TestLoadDataset:
         assert isinstance(result, MergeResult)
         sqls = [call[0][0] for call in cursor.execute.call_args_list if call[0]]
         assert any("PUT" in s for s in sqls)
-        assert any("CREATE TEMPORARY TABLE" in s for s in sqls)
+        assert any("TEMPORARY TABLE" in s for s in sqls)
         assert any("MERGE INTO" in s for s in sqls)
 
+    def test_load_dataset_stages_files_in_one_put(self, mock_connection, tmp_path):
+        """All CSVs go up in one parallel wildcard PUT before one MERGE."""
+        cursor = mock_connection.cursor()
+        cursor.fetchall.return_value = [
+            (f"delays_{y}.csv", f"delays_{y}.csv.gz", 30, 20, "", "", "UPLOADED", "")
+            for y in range(2019, 2024)
+        ]
+        cursor.fetchone.return_value = (50, 0)
+
+        csvs = []
+        for year in range(2019, 2024):
+            path = tmp_path / f"delays_{year}.csv"
+            path.write_text("Date,Time\n2023-01-01,08:00\n")
+            csvs.append(path)
+
+        load_dataset(mock_connection, "ttc_subway_delays", csvs, pipeline=False)
+
+        sqls = [call[0][0] for call in cursor.execute.call_args_list if call[0]]
+        puts = [s for s in sqls if s.startswith("PUT")]
+        assert len(puts) == 1
+        assert "/*'" in puts[0]
+        assert "PARALLEL=8" in puts[0]
+        assert "'@TORONTO_MOBILITY.RAW.INGESTION_STAGE/ttc_subway/'" in puts[0]
+        assert sum("MERGE INTO" in s for s in sqls) == 1
+        assert any("COPY INTO" in s and "PURGE = TRUE" in s for s in sqls)
+
+    def test_load_dataset_pipelines_put_and_copy(self, mock_connection, tmp_path):
+        """Batches are PUT to their own directories and copied into staging."""
+        cursor = mock_connection.cursor()
+        cursor.fetchall.return_value = []
+
+        def result_rows() -> object:
+            if threading.current_thread().name.startswith("copy"):
+                return iter([("batch.csv.gz", "LOADED", 10, 10, 1, 0, None)])
+            return iter([])
+
+        cursor.__iter__.side_effect = result_rows
+        cursor.fetchone.return_value = (20, 0)
+
+        csvs = []
+        for year in range(2019, 2024):
+            path = tmp_path / f"delays_{year}.csv"
+            path.write_text("Date,Time\n2023-01-01,08:00\n")
+            csvs.append(path)
+
+        result = load_dataset(mock_connection, "ttc_subway_delays", csvs)
+
+        sqls = [call[0][0] for call in cursor.execute.call_args_list if call[0]]
+        puts = [s for s in sqls if s.startswith("PUT")]
+        copies = [s for s in sqls if s.startswith("COPY INTO")]
+        assert len(puts) == 2
+        assert "/ttc_subway/batch_0000/'" in puts[0]
+        assert "/ttc_subway/batch_0001/'" in puts[1]
+        assert len(copies) == 2
+        assert all("_STAGING " in s for s in copies)
+        assert "PATTERN = 'ttc_subway/batch_0001/[^/]*[.]csv" in copies[1]
+        assert all("PURGE = TRUE" in s for s in copies)
+        cursor.execute_async.assert_called_once()
+        prepare_sql = cursor.execute_async.call_args[0][0]
+        assert prepare_sql.startswith("CREATE OR REPLACE TEMPORARY TABLE")
+        assert not any("TEMPORARY TABLE" in s and "_DEDUP" not in s for s in sqls)
+        assert sum("MERGE INTO" in s for s in sqls) == 1
+        assert result.rows_inserted == 20
+
+    def test_staging_prepare_overlaps_put(self, mock_connection, tmp_path):
+        """The staging table is prepared asynchronously and awaited after PUT."""
+        cursor = mock_connection.cursor()
+        cursor.sfqid = "01-prepare"
+        cursor.fetchone.return_value = (1, 0)
+        csv1 = tmp_path / "delays_2023.csv"
+        csv1.write_text("Date,Time\n2023-01-01,08:00\n")
+
+        load_dataset(mock_connection, "ttc_subway_delays", [csv1])
+
+        prepare_sql = cursor.execute_async.call_args[0][0]
+        assert prepare_sql.startswith("CREATE OR REPLACE TEMPORARY TABLE")
+        mock_connection.get_query_status_throw_if_error.assert_called_with("01-prepare")
+        sqls = [call[0][0] for call in cursor.execute.call_args_list if call[0]]
+        assert sqls[0].startswith("PUT")
+        assert sqls[1].startswith("COPY INTO")
+
+    def test_stuck_staging_prepare_times_out(self, mock_connection, tmp_path):
+        """A prepare still running at the deadline is cancelled and fails."""
+        mock_connection.cursor().sfqid = "01-prepare"
+        mock_connection.is_still_running.return_value = True
+        csv1 = tmp_path / "delays_2023.csv"
+        csv1.write_text("Date,Time\n2023-01-01,08:00\n")
+
+        with (
+            patch("scripts.load._ASYNC_PREPARE_TIMEOUT_SECONDS", 0.0),
+            pytest.raises(LoadError, match="did not finish"),
+        ):
+            load_dataset(mock_connection, "ttc_subway_delays", [csv1])
+
+        cursor = mock_connection.cursor()
+        cursor.abort_query.assert_called_with("01-prepare")
+        sqls = [call[0][0] for call in cursor.execute.call_args_list if call[0]]
+        assert not any("MERGE INTO" in s for s in sqls)
+
+    def test_pipelined_copy_failure_skips_merge(self, mock_connection, tmp_path):
+        """A failed batch COPY is re-raised and no MERGE is attempted."""
+        import snowflake.connector.errors
+
+        cursor = mock_connection.cursor()
+        cursor.fetchall.return_value = []
+
+        def execute_side_effect(sql: str, **kwargs: object) -> None:
+            if sql.startswith("COPY INTO"):
+                raise snowflake.connector.errors.Error(msg="COPY failed")
+
+        cursor.execute.side_effect = execute_side_effect
+        csvs = []
+        for year in range(2019, 2024):
+            path = tmp_path / f"delays_{year}.csv"
+            path.write_text("Date,Time\n2023-01-01,08:00\n")
+            csvs.append(path)
+
+        with pytest.raises(LoadError, match="COPY failed"):
+            load_dataset(mock_connection, "ttc_subway_delays", csvs)
+
+        sqls = [call[0][0] for call in cursor.execute.call_args_list if call[0]]
+        assert not any("MERGE INTO" in s for s in sqls)
+
+    def test_earlier_copy_failure_stops_puts(self, mock_connection, tmp_path):
+        """A failed COPY stops the PUTs even while a later COPY is running."""
+        import snowflake.connector.errors
+
+        cursor = mock_connection.cursor()
+        cursor.fetchall.return_value = []
+        second_copy_started = threading.Event()
+
+        def execute_side_effect(sql: str, **kwargs: object) -> None:
+            if sql.startswith("COPY INTO") and "batch_0000" in sql:
+                raise snowflake.connector.errors.Error(msg="COPY failed")
+            if sql.startswith("COPY INTO") and "batch_0001" in sql:
+                second_copy_started.set()
+                # Still running when the next batch is about to be PUT
+                time.sleep(0.5)
+            if sql.startswith("PUT") and "batch_0002" in sql:
+                # batch_0001's COPY starts only after batch_0000's has failed
+                second_copy_started.wait(timeout=5)
+
+        cursor.execute.side_effect = execute_side_effect
+        csvs = []
+        for year in range(2019, 2023):
+            path = tmp_path / f"delays_{year}.csv"
+            path.write_text("Date,Time\n2023-01-01,08:00\n")
+            csvs.append(path)
+
+        with (
+            patch("scripts.load._PIPELINE_BATCH_FILES", 1),
+            pytest.raises(LoadError, match="COPY failed"),
+        ):
+            load_dataset(mock_connection, "ttc_subway_delays", csvs)
+
+        sqls = [call[0][0] for call in cursor.execute.call_args_list if call[0]]
+        # batch_0000's failure is seen no later than the final batch, while
+        # the latest COPY (batch_0001 or batch_0002) is still unfinished
+        assert not any("batch_0003" in s for s in sqls)
+
+    def test_put_failure_cancels_queued_copies(self, mock_connection, tmp_path):
+        """A failed PUT cancels COPYs still queued behind a running one."""
+        import snowflake.connector.errors
+
+        cursor = mock_connection.cursor()
+        cursor.fetchall.return_value = []
+        first_copy_started = threading.Event()
+        release_copy = threading.Event()
+
+        def execute_side_effect(sql: str, **kwargs: object) -> None:
+            if sql.startswith("COPY INTO") and "batch_0000" in sql:
+                first_copy_started.set()
+                release_copy.wait(timeout=5)
+            if sql.startswith("PUT") and "batch_0001" in sql:
+                first_copy_started.wait(timeout=5)
+            if sql.startswith("PUT") and "batch_0002" in sql:
+                # Let batch_0000's COPY finish only after the cancellation
+                threading.Timer(0.2, release_copy.set).start()
+                raise snowflake.connector.errors.Error(msg="Upload failed")
+
+        cursor.execute.side_effect = execute_side_effect
+        csvs = []
+        for year in range(2019, 2023):
+            path = tmp_path / f"delays_{year}.csv"
+            path.write_text("Date,Time\n2023-01-01,08:00\n")
+            csvs.append(path)
+
+        with (
+            patch("scripts.load._PIPELINE_BATCH_FILES", 1),
+            pytest.raises(LoadError, match="Upload failed"),
+        ):
+            load_dataset(mock_connection, "ttc_subway_delays", csvs)
+
+        sqls = [call[0][0] for call in cursor.execute.call_args_list if call[0]]
+        copies = [s for s in sqls if s.startswith("COPY INTO")]
+        assert len(copies) == 1
+        assert "batch_0000" in copies[0]
+
+    def test_put_failure_skips_merge(self, mock_connection, tmp_path):
+        """A failed PUT is re-raised and no MERGE is attempted."""
+        import snowflake.connector.errors
+
+        cursor = mock_connection.cursor()
+
+        def execute_side_effect(sql: str) -> None:
+            if sql.startswith("PUT"):
+                raise snowflake.connector.errors.Error(msg="Upload failed")
+
+        cursor.execute.side_effect = execute_side_effect
+        csv1 = tmp_path / "delays_2023.csv"
+        csv1.write_text("Date,Time\n2023-01-01,08:00\n")
+
+        with pytest.raises(LoadError, match="Upload failed"):
+            load_dataset(mock_connection, "ttc_subway_delays", [csv1])
+
+        sqls = [call[0][0] for call in cursor.execute.call_args_list if call[0]]
+        assert not any("MERGE INTO" in s for s in sqls)
+
     def test_unknown_dataset_raises_key_error(self, mock_connection):
         """KeyError raised for unknown dataset names."""
         with pytest.raises(KeyError, match="Unknown dataset"):
@@ -451,6 +1104,30 @@ class TestLoadDataset:
 class TestTableConfig:
     """Tests for table configuration registry."""
 
+    def test_rejects_unsafe_identifiers(self):
+        """Identifiers that would need quoting are rejected up front."""
+        with pytest.raises(ValueError, match="Invalid Snowflake identifier"):
+            TableConfig(
+                table_name="DB.RAW.T; DROP TABLE X",
+                columns=("ID",),
+                natural_keys=("ID",),
+                stage_prefix="t",
+            )
+        with pytest.raises(ValueError, match="Invalid Snowflake identifier"):
+            TableConfig(
+                table_name="DB.RAW.T",
+                columns=("ID", "NAME\n"),
+                natural_keys=("ID",),
+                stage_prefix="t",
+            )
+        with pytest.raises(ValueError, match=r"not in DB\.RAW\.T columns"):
+            TableConfig(
+                table_name="DB.RAW.T",
+                columns=("ID",),
+                natural_keys=("KEY",),
+                stage_prefix="t",
+            )
+
     def test_all_five_datasets_configured(self):
         """All five datasets have table configurations."""
         expected = {
@@ -7,22 +7,33 @@ and ZIP archive extraction with idempotency checks.
 from __future__ import annotations
 
 import csv
+import errno
+import os
+import threading
 import zipfile
 from typing import TYPE_CHECKING
 
 import pytest
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
 from scripts.transform import (
+    EncodingCache,
     TransformError,
+    _encode_csv_rows,
+    _find_files,
+    _parse_in_background,
+    _transcode_to_utf8,
+    batch_convert,
     batch_extract_zips,
     convert_xlsx_to_csv,
     extract_zip,
     normalize_encoding,
     rename_csv_columns,
     strip_extra_columns,
+    transform_csv_header_and_columns,
 )
 
 
@@ -82,6 +93,88 @@ class TestConvertXlsxToCsv:
         assert "delays" in str(exc_info.value)
         assert "metadata" in str(exc_info.value)
 
+    def test_engines_produce_identical_csv(self, tmp_path: Path) -> None:
+        import datetime
+
+        import openpyxl
+
+        xlsx_path = tmp_path / "typed.xlsx"
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        assert ws is not None
+        ws.append(["Date", "Time", "Min Delay", "Ratio", "Code"])
+        ws.append([datetime.datetime(2023, 1, 1), datetime.time(8, 5), 5, 2.5, None])
+        ws.append([datetime.datetime(2023, 1, 2, 6, 30), "08:00", 0, -1.25, "MUIS"])
+        wb.save(xlsx_path)
+        wb.close()
+
+        calamine_csv = tmp_path / "calamine.csv"
+        openpyxl_csv = tmp_path / "openpyxl.csv"
+        fast = convert_xlsx_to_csv(xlsx_path, calamine_csv)
+        slow = convert_xlsx_to_csv(xlsx_path, openpyxl_csv, engine="openpyxl")
+
+        assert calamine_csv.read_bytes() == openpyxl_csv.read_bytes()
+        assert (fast.row_count, fast.column_count) == (slow.row_count, 5)
+
+    @pytest.mark.parametrize(
+        "rows",
+        [
+            [["Date", "Station"], ["2023-01-01", "UNION"]],
+            [["a", "b,c"], ["1", "2"]],
+            [["a", 'say "hi"'], ["1", "2"]],
+            [["a", "line\nbreak"], ["1", "cr\rlf"]],
+            [["", ""], ["x", ""]],
+            [[""], ["only"]],
+            [],
+        ],
+    )
+    def test_encoded_rows_match_csv_writer(self, rows: list[list[str]]) -> None:
+        import io
+
+        expected = io.StringIO()
+        csv.writer(expected, quoting=csv.QUOTE_MINIMAL).writerows(rows)
+
+        assert _encode_csv_rows(rows) == expected.getvalue().encode("utf-8")
+
+    def test_background_parse_matches_serial(
+        self, valid_xlsx: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        serial_csv = tmp_path / "serial.csv"
+        serial = convert_xlsx_to_csv(valid_xlsx, serial_csv, engine="openpyxl")
+
+        monkeypatch.setattr("scripts.transform._PARSE_PIPELINE_MIN_BYTES", 0)
+        monkeypatch.setattr("scripts.transform._PARSE_BATCH_ROWS", 3)
+        piped_csv = tmp_path / "piped.csv"
+        piped = convert_xlsx_to_csv(valid_xlsx, piped_csv, engine="openpyxl")
+
+        assert piped_csv.read_bytes() == serial_csv.read_bytes()
+        assert (piped.row_count, piped.column_count) == (serial.row_count, 10)
+
+    def test_background_parse_error_reaches_caller(self) -> None:
+        def rows() -> Iterator[tuple[object, ...]]:
+            yield ("a",)
+            raise ValueError("bad sheet XML")
+
+        with pytest.raises(ValueError, match="bad sheet XML"):
+            list(_parse_in_background(rows()))
+
+    def test_background_parse_stops_when_caller_stops(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("scripts.transform._PARSE_BATCH_ROWS", 1)
+        monkeypatch.setattr("scripts.transform._PARSE_QUEUE_DEPTH", 1)
+        batches = _parse_in_background(iter([(i,) for i in range(10_000)]))
+
+        assert next(batches) == [(0,)]
+        batches.close()
+
+    def test_non_xlsx_raises_transform_error(self, tmp_path: Path) -> None:
+        fake_xlsx = tmp_path / "really_a.xlsx"
+        fake_xlsx.write_text("Date,Line\n2023-01-01,YU\n")
+
+        with pytest.raises(TransformError, match="not a valid XLSX"):
+            convert_xlsx_to_csv(fake_xlsx, tmp_path / "out.csv")
+
     def test_none_cells_become_empty_strings(self, tmp_path: Path) -> None:
         import openpyxl
 
@@ -115,6 +208,55 @@ class TestNormalizeEncoding:
         assert result.confidence >= 0.7
         assert result.had_bom is False
 
+    def test_pure_ascii_skips_detection(self, tmp_path: Path) -> None:
+        from unittest.mock import patch
+
+        csv_path = tmp_path / "ascii.csv"
+        csv_path.write_bytes(b"Date,Station\n2023-01-01,UNION\n")
+
+        with patch("scripts.transform.from_path") as mock_detect:
+            result = normalize_encoding(csv_path)
+
+        mock_detect.assert_not_called()
+        assert (result.detected_encoding, result.confidence) == ("ascii", 1.0)
+
+    def test_cache_skips_detection_for_unchanged_files(
+        self, windows_1252_csv: Path, tmp_path: Path
+    ) -> None:
+        from unittest.mock import patch
+
+        output = tmp_path / "out.csv"
+        with EncodingCache(tmp_path / "cache" / "enc.db") as cache:
+            first = normalize_encoding(windows_1252_csv, output, cache=cache)
+            with patch("scripts.transform.from_path") as mock_detect:
+                again = normalize_encoding(windows_1252_csv, output, cache=cache)
+                written = normalize_encoding(output, cache=cache)
+
+        mock_detect.assert_not_called()
+        assert again.detected_encoding == first.detected_encoding
+        assert again.confidence == first.confidence
+        assert (written.detected_encoding, written.confidence) == ("utf_8", 1.0)
+
+    def test_cache_misses_after_file_changes(self, tmp_path: Path) -> None:
+        csv_path = tmp_path / "data.csv"
+        csv_path.write_bytes(b"Date,Station\n2023-01-01,UNION\n")
+
+        with EncodingCache(tmp_path / "enc.db") as cache:
+            normalize_encoding(csv_path, cache=cache)
+            csv_path.write_bytes("Date,Station\n2023-01-01,Café\n".encode("cp1252"))
+            result = normalize_encoding(csv_path, cache=cache)
+
+        assert result.detected_encoding != "ascii"
+        assert "Café" in csv_path.read_text(encoding="utf-8")
+
+    def test_nul_bytes_are_not_treated_as_ascii(self, tmp_path: Path) -> None:
+        csv_path = tmp_path / "utf16.csv"
+        csv_path.write_bytes("Date,Station\n".encode("utf-16-le"))
+
+        result = normalize_encoding(csv_path, tmp_path / "out.csv")
+
+        assert result.detected_encoding != "ascii"
+
     def test_transcodes_windows_1252(
         self, windows_1252_csv: Path, tmp_path: Path
     ) -> None:
@@ -150,6 +292,19 @@ class TestNormalizeEncoding:
         content = windows_1252_csv.read_text(encoding="utf-8")
         assert "Café" in content
 
+    def test_transcode_handles_sequences_split_across_chunks(self) -> None:
+        import io
+        from unittest.mock import patch
+
+        text = "Station,Note\nUnion,Café élevé\n" * 3
+        src = io.BytesIO(text.encode("utf-16-le"))
+        dst = io.BytesIO()
+
+        with patch("scripts.transform._ENCODING_CHUNK_SIZE", 3):
+            _transcode_to_utf8(src, dst, "utf-16-le")
+
+        assert dst.getvalue() == text.encode("utf-8")
+
 
 class TestExtractZip:
     """ZIP archive extraction tests."""
@@ -184,6 +339,73 @@ class TestExtractZip:
         results2 = extract_zip(valid_zip, output_dir)
         assert all(r.skipped for r in results2)
 
+    def test_extracts_many_members_in_order(self, tmp_path: Path) -> None:
+        zip_path = tmp_path / "many.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for month in range(1, 13):
+                zf.writestr(f"inner/trips_{month:02d}.csv", f"a,b\n{month},x\n" * 50)
+
+        results = extract_zip(zip_path, tmp_path / "out")
+
+        assert [r.original_name for r in results] == [
+            f"inner/trips_{month:02d}.csv" for month in range(1, 13)
+        ]
+        for month, result in enumerate(results, start=1):
+            assert result.extracted_path.read_text() == f"a,b\n{month},x\n" * 50
+
+    def test_member_larger_than_copy_buffer(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("scripts.transform._ZIP_COPY_BUFFER_SIZE", 64)
+        monkeypatch.setattr("scripts.transform._copy_buffers", threading.local())
+        payload = "".join(f"{i},row{i}\n" for i in range(500))
+        zip_path = tmp_path / "big.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("big.csv", payload)
+
+        results = extract_zip(zip_path, tmp_path / "out")
+
+        assert results[0].extracted_path.read_text() == payload
+
+    def test_stored_member_copied_in_kernel(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        if not hasattr(os, "copy_file_range"):
+            pytest.skip("os.copy_file_range not available")
+        calls: list[int] = []
+        real = os.copy_file_range
+
+        def spy(src: int, dst: int, count: int, **kwargs: int) -> int:
+            calls.append(count)
+            return real(src, dst, count, **kwargs)
+
+        monkeypatch.setattr(os, "copy_file_range", spy)
+        payload = b"a,b\n" + b"1,2\n" * 1000
+        zip_path = tmp_path / "stored.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_STORED) as zf:
+            zf.writestr("inner/data.csv", payload)
+
+        results = extract_zip(zip_path, tmp_path / "out")
+
+        assert calls
+        assert results[0].extracted_path.read_bytes() == payload
+
+    def test_stored_member_falls_back_when_copy_file_range_rejected(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def cross_device(*_args: object, **_kwargs: object) -> int:
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(os, "copy_file_range", cross_device, raising=False)
+        payload = b"a,b\n" + b"1,2\n" * 1000
+        zip_path = tmp_path / "stored.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_STORED) as zf:
+            zf.writestr("data.csv", payload)
+
+        results = extract_zip(zip_path, tmp_path / "out")
+
+        assert results[0].extracted_path.read_bytes() == payload
+
     def test_skips_macosx_metadata(self, zip_with_macosx: Path, tmp_path: Path) -> None:
         output_dir = tmp_path / "extracted"
         results = extract_zip(zip_with_macosx, output_dir)
@@ -197,6 +419,65 @@ class TestExtractZip:
         with pytest.raises((TransformError, zipfile.BadZipFile)):
             extract_zip(corrupt_zip, output_dir)
 
+    def test_crc_mismatch_raises_and_removes_partial_file(self, tmp_path: Path) -> None:
+        zip_path = tmp_path / "crc.zip"
+        content = b"a,b\n" + b"1,2\n" * 100
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_STORED) as zf:
+            zf.writestr("data.csv", content)
+        raw = zip_path.read_bytes()
+        offset = raw.index(b"1,2\n")
+        zip_path.write_bytes(raw[:offset] + b"9" + raw[offset + 1 :])
+        output_dir = tmp_path / "extracted"
+
+        with pytest.raises(TransformError, match=r"bad member 'data\.csv'"):
+            extract_zip(zip_path, output_dir)
+
+        assert not (output_dir / "data.csv").exists()
+
+
+class TestBatchConvert:
+    """Batch XLSX conversion tests."""
+
+    def test_discovery_matches_sorted_rglob(self, tmp_path: Path) -> None:
+        for rel in ("2023/b.xlsx", "2023/a.xlsx", "2020/q1/c.xlsx", "top.xlsx"):
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).touch()
+        (tmp_path / "2023" / "notes.txt").touch()
+        (tmp_path / "folder.xlsx").mkdir()
+
+        expected = [p for p in sorted(tmp_path.rglob("*.xlsx")) if p.is_file()]
+
+        assert _find_files(tmp_path, "*.xlsx") == expected
+        assert _find_files(tmp_path / "missing", "*.xlsx") == []
+
+    def test_parallel_matches_serial(self, tmp_path: Path) -> None:
+        import openpyxl
+
+        source = tmp_path / "source"
+        for year in (2024, 2023):
+            year_dir = source / str(year)
+            year_dir.mkdir(parents=True)
+            wb = openpyxl.Workbook()
+            ws = wb.active
+            assert ws is not None
+            ws.append(["Date", "Line"])
+            ws.append([f"{year}-01-01", "YU"])
+            wb.save(year_dir / f"delays_{year}.xlsx")
+            wb.close()
+
+        serial = batch_convert(source, tmp_path / "serial", max_workers=1)
+        pooled = batch_convert(source, tmp_path / "pooled", max_workers=2)
+
+        assert [r.input_path for r in pooled] == [r.input_path for r in serial]
+        assert [r.input_path.name for r in pooled] == [
+            "delays_2023.xlsx",
+            "delays_2024.xlsx",
+        ]
+        for result in serial:
+            relative = result.output_path.relative_to(tmp_path / "serial")
+            pooled_csv = tmp_path / "pooled" / relative
+            assert pooled_csv.read_bytes() == result.output_path.read_bytes()
+
 
 class TestBatchExtractZips:
     """Batch ZIP extraction tests."""
@@ -223,6 +504,42 @@ class TestBatchExtractZips:
         assert (output / "2023" / "file1.csv").exists()
         assert (output / "2024" / "file2.csv").exists()
 
+    def test_pooled_worker_logs_reach_queue_listener(self, tmp_path: Path) -> None:
+        """Workers' "Extracted" records reach a listener like ingest.main's."""
+        import logging
+        import queue
+        from logging.handlers import QueueHandler, QueueListener
+
+        source = tmp_path / "source"
+        for year in (2023, 2024):
+            (source / str(year)).mkdir(parents=True)
+            with zipfile.ZipFile(source / str(year) / f"d{year}.zip", "w") as zf:
+                zf.writestr(f"trips_{year}.csv", "a,b\n1,2\n")
+
+        messages: list[str] = []
+
+        class Collect(logging.Handler):
+            def emit(self, record: logging.LogRecord) -> None:
+                messages.append(record.getMessage())
+
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        listener = QueueListener(log_queue, Collect())
+        root = logging.getLogger()
+        previous_level = root.level
+        root.addHandler(queue_handler)
+        root.setLevel(logging.INFO)
+        listener.start()
+        try:
+            batch_extract_zips(source, tmp_path / "out", max_workers=2)
+        finally:
+            listener.stop()
+            root.removeHandler(queue_handler)
+            root.setLevel(previous_level)
+
+        extracted = sorted(m.split()[1] for m in messages if m.startswith("Extracted"))
+        assert extracted == ["trips_2023.csv", "trips_2024.csv"]
+
 
 class TestRenameCsvColumns:
     """Column renaming tests for 2025 unified schema handling."""
@@ -254,6 +571,15 @@ class TestRenameCsvColumns:
 
         assert result is False
 
+    def test_quoted_header_with_comma(self, tmp_path: Path) -> None:
+        csv_path = tmp_path / "data.csv"
+        csv_path.write_bytes(b'"Min Delay, mins",Line\r\n5,505\r\n')
+
+        result = rename_csv_columns(csv_path, {"Line": "Route"})
+
+        assert result is True
+        assert csv_path.read_bytes() == b'"Min Delay, mins",Route\r\n5,505\r\n'
+
     def test_preserves_data_rows(self, tmp_path: Path) -> None:
         csv_path = tmp_path / "data.csv"
         csv_path.write_text(
@@ -268,6 +594,53 @@ class TestRenameCsvColumns:
         assert lines[1] == "ABC,123"
         assert lines[2] == "DEF,456"
 
+    def test_body_bytes_copied_unchanged(self, tmp_path: Path) -> None:
+        csv_path = tmp_path / "data.csv"
+        body = b"ABC,\xc3\xa9t\xc3\xa9\r\nDEF,456\r\n"
+        csv_path.write_bytes(b"Code,Value\r\n" + body)
+
+        assert rename_csv_columns(csv_path, {"Code": "Incident"})
+
+        assert csv_path.read_bytes() == b"Incident,Value\r\n" + body
+        assert [p.name for p in tmp_path.iterdir()] == ["data.csv"]
+
+
+class TestTransformCsvHeaderAndColumns:
+    """Fused rename-and-strip tests."""
+
+    def test_renames_then_strips_in_one_pass(self, tmp_path: Path) -> None:
+        csv_path = tmp_path / "data.csv"
+        csv_path.write_text(
+            '_id,Line,"Incident, Code"\n1,505,"MUPAA, x"\n2,504,ETO\n',
+            encoding="utf-8",
+        )
+
+        result = transform_csv_header_and_columns(
+            csv_path,
+            column_map={"Line": "Route", "Incident, Code": "Incident"},
+            allowed_columns=frozenset({"Route", "Incident"}),
+        )
+
+        assert result is True
+        with csv_path.open(encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows == [
+            ["Route", "Incident"],
+            ["505", "MUPAA, x"],
+            ["504", "ETO"],
+        ]
+
+    def test_no_changes_returns_false(self, tmp_path: Path) -> None:
+        csv_path = tmp_path / "data.csv"
+        csv_path.write_text("A,B\n1,2\n", encoding="utf-8")
+
+        result = transform_csv_header_and_columns(
+            csv_path, column_map={"X": "Y"}, allowed_columns=frozenset({"a", "b"})
+        )
+
+        assert result is False
+        assert csv_path.read_text(encoding="utf-8") == "A,B\n1,2\n"
+
 
 class TestStripExtraColumns:
     """Column stripping tests for removing _id/Vehicle from 2025 files."""
@@ -384,3 +757,13 @@ class TestStripExtraColumns:
         header = csv_path.read_text(encoding="utf-8").split("\n")[0]
         expected = "Date,Route,Time,Day,Location,Incident,Min Delay,Min Gap,Direction"
         assert header == expected
+
+    def test_single_kept_column_and_short_rows(self, tmp_path: Path) -> None:
+        csv_path = tmp_path / "data.csv"
+        csv_path.write_text("_id,Date,Extra\n1,2025-01-01,x\n2\n", encoding="utf-8")
+
+        assert strip_extra_columns(csv_path, frozenset({"Date"}))
+
+        with csv_path.open("r", encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows == [["Date"], ["2025-01-01"], [""]]
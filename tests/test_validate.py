@@ -11,8 +11,15 @@ from pathlib import Path
 
 import pytest
 
-from scripts.contracts import TTC_SUBWAY_CONTRACT
-from scripts.validate import SchemaValidationError, validate_dataset, validate_file
+from scripts.contracts import TTC_SUBWAY_CONTRACT, ColumnContract, SchemaContract
+from scripts.validate import (
+    SchemaValidationError,
+    _check_type,
+    find_csv_files,
+    validate_and_normalize,
+    validate_dataset,
+    validate_file,
+)
 
 
 class TestValidateFileStructural:
@@ -66,6 +73,60 @@ class TestValidateFileTypes:
         assert "Min Delay" in str(err.mismatches)
         assert "INTEGER" in str(err.mismatches)
 
+    def test_short_row_treated_as_empty(self, tmp_path: Path) -> None:
+        from scripts.contracts import ColumnContract, SchemaContract
+
+        contract = SchemaContract(
+            dataset_name="test",
+            columns=(
+                ColumnContract(name="Id", expected_dtype="STRING", nullable=False),
+                ColumnContract(name="Note", expected_dtype="STRING", nullable=True),
+                ColumnContract(name="Count", expected_dtype="INTEGER", nullable=False),
+            ),
+            min_row_count=0,
+        )
+        csv_path = tmp_path / "short.csv"
+        csv_path.write_text("id,NOTE,Count\nA,,1\n\nB\n", encoding="utf-8")
+
+        with pytest.raises(SchemaValidationError) as exc_info:
+            validate_file(csv_path, contract)
+
+        assert exc_info.value.mismatches == [
+            "Row 2: column 'Count' is empty but not nullable"
+        ]
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            "A,1\nB,2\nC,3\n\nD,4\r\n\r\nE,5",
+            'A,1\nB,2\nC,3\n"multi\nline",4\n\nE,"5"\n',
+        ],
+    )
+    def test_rows_past_sample_counted_like_dictreader(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, body: str
+    ) -> None:
+        import csv as csv_mod
+
+        from scripts.contracts import ColumnContract, SchemaContract
+
+        monkeypatch.setattr("scripts.validate._TYPE_SAMPLE_ROWS", 2)
+        contract = SchemaContract(
+            dataset_name="test",
+            columns=(
+                ColumnContract(name="Id", expected_dtype="STRING", nullable=False),
+                ColumnContract(name="N", expected_dtype="INTEGER", nullable=False),
+            ),
+            min_row_count=0,
+        )
+        csv_path = tmp_path / "tail.csv"
+        csv_path.write_bytes(("Id,N\n" + body).encode("utf-8"))
+        with csv_path.open(encoding="utf-8") as f:
+            expected = sum(1 for _ in csv_mod.DictReader(f))
+
+        result = validate_file(csv_path, contract)
+
+        assert result.row_count == expected
+
     def test_empty_file_raises_error(self, tmp_path: Path) -> None:
         empty = tmp_path / "empty.csv"
         empty.write_text("", encoding="utf-8")
@@ -143,11 +204,177 @@ class TestValidateDataset:
         with pytest.raises(SchemaValidationError):
             validate_dataset(tmp_path, TTC_SUBWAY_CONTRACT)
 
+    def test_parallel_reports_first_invalid_file_in_path_order(
+        self,
+        valid_subway_csv: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        import shutil
+
+        monkeypatch.setattr("scripts.validate.os.cpu_count", lambda: 4)
+
+        dataset = tmp_path / "dataset"
+        dataset.mkdir()
+        for name in ("a.csv", "b.csv", "d.csv", "e.csv"):
+            shutil.copy2(valid_subway_csv, dataset / name)
+        (dataset / "c.csv").write_text("Date,Time\n2023-01-01,08:00\n")
+
+        with pytest.raises(SchemaValidationError) as exc_info:
+            validate_dataset(dataset, TTC_SUBWAY_CONTRACT)
+
+        assert exc_info.value.file_path == dataset / "c.csv"
+
+    def test_parallel_results_in_path_order(
+        self,
+        valid_subway_csv: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        import shutil
+
+        monkeypatch.setattr("scripts.validate.os.cpu_count", lambda: 4)
+
+        dataset = tmp_path / "dataset"
+        names = ["2020/a.csv", "2021/b.csv", "2022/c.csv", "2023/d.csv"]
+        for name in names:
+            (dataset / name).parent.mkdir(parents=True)
+            shutil.copy2(valid_subway_csv, dataset / name)
+
+        results = validate_dataset(dataset, TTC_SUBWAY_CONTRACT)
+
+        assert [r.file_path for r in results] == [dataset / n for n in names]
+        assert all(r.row_count == 10 for r in results)
+
+    def test_parallel_worker_warnings_reach_queue_listener(
+        self,
+        valid_subway_csv: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Worker records reach a QueueListener set up like ingest.main's."""
+        import logging
+        import queue
+        import shutil
+        from logging.handlers import QueueHandler, QueueListener
+
+        monkeypatch.setattr("scripts.validate.os.cpu_count", lambda: 4)
+        dataset = tmp_path / "dataset"
+        dataset.mkdir()
+        names = ["a.csv", "b.csv", "c.csv", "d.csv"]
+        for name in names:
+            shutil.copy2(valid_subway_csv, dataset / name)
+
+        records: list[logging.LogRecord] = []
+
+        class Collect(logging.Handler):
+            def emit(self, record: logging.LogRecord) -> None:
+                records.append(record)
+
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        listener = QueueListener(log_queue, Collect())
+        root = logging.getLogger()
+        root.addHandler(queue_handler)
+        listener.start()
+        try:
+            validate_dataset(dataset, TTC_SUBWAY_CONTRACT)
+        finally:
+            listener.stop()
+            root.removeHandler(queue_handler)
+
+        warned = sorted(
+            r.getMessage().split(":")[0]
+            for r in records
+            if r.levelno == logging.WARNING and "rows (expected" in r.getMessage()
+        )
+        assert warned == names
+
+    def test_find_csv_files_matches_sorted_rglob(self, tmp_path: Path) -> None:
+        for rel in ("2024/b.csv", "2024/a.csv", "2020/q1/c.csv", "top.csv", "x.txt"):
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).touch()
+        (tmp_path / "dir.csv").mkdir()
+
+        expected = [p for p in sorted(tmp_path.rglob("*.csv")) if p.is_file()]
+
+        assert find_csv_files(tmp_path) == expected
+        assert find_csv_files(tmp_path / "missing") == []
+
     def test_empty_directory_returns_empty(self, tmp_path: Path) -> None:
         results = validate_dataset(tmp_path, TTC_SUBWAY_CONTRACT)
         assert results == []
 
 
+class TestValidateAndNormalize:
+    """Fused encoding normalization and validation."""
+
+    @staticmethod
+    def _contract() -> SchemaContract:
+        return SchemaContract(
+            dataset_name="test",
+            columns=(
+                ColumnContract(name="Id", expected_dtype="STRING", nullable=False),
+                ColumnContract(name="N", expected_dtype="INTEGER", nullable=False),
+            ),
+            min_row_count=0,
+        )
+
+    def test_utf8_file_is_not_rewritten(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("normalize_encoding should not run")
+
+        monkeypatch.setattr("scripts.transform.normalize_encoding", fail)
+        csv_path = tmp_path / "utf8.csv"
+        csv_path.write_bytes("Id,N\nCafé,1\n".encode())
+
+        result = validate_and_normalize(csv_path, self._contract())
+
+        assert result.row_count == 1
+
+    def test_bom_file_is_normalized(self, tmp_path: Path) -> None:
+        csv_path = tmp_path / "bom.csv"
+        csv_path.write_bytes("Id,N\nCafé,1\n".encode("utf-8-sig"))
+
+        result = validate_and_normalize(
+            csv_path, self._contract(), tmp_path / "cache.sqlite3"
+        )
+
+        assert result.row_count == 1
+        assert csv_path.read_bytes() == "Id,N\nCafé,1\n".encode()
+
+    def test_non_utf8_past_sample_is_normalized(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("scripts.validate._TYPE_SAMPLE_ROWS", 1)
+        body = "".join(f"Row {i},{i}\n" for i in range(200))
+        csv_path = tmp_path / "cp1252.csv"
+        csv_path.write_bytes(
+            ("Id,N\n" + body + "Café Crème Brûlée,9\n").encode("cp1252")
+        )
+
+        with pytest.raises(UnicodeDecodeError):
+            validate_file(csv_path, self._contract())
+        result = validate_and_normalize(csv_path, self._contract())
+
+        assert result.row_count == 201
+        assert csv_path.read_text(encoding="utf-8").endswith("Crème Brûlée,9\n")
+
+    def test_dataset_normalize_option(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("scripts.validate.os.cpu_count", lambda: 4)
+        for name in ("a", "b", "c"):
+            (tmp_path / f"{name}.csv").write_bytes("Id,N\nCafé,1\n".encode("utf-8-sig"))
+
+        results = validate_dataset(tmp_path, self._contract(), normalize=True)
+
+        assert [r.row_count for r in results] == [1, 1, 1]
+        assert not (tmp_path / "a.csv").read_bytes().startswith(b"\xef\xbb\xbf")
+
+
 class TestNullStringHandling:
     """Literal 'NULL' string treated as null value."""
 
@@ -209,6 +436,45 @@ class TestNullStringHandling:
             validate_file(csv_path, strict_contract)
 
 
+class TestCheckType:
+    """Per-dtype value predicates."""
+
+    @pytest.mark.parametrize(
+        ("dtype", "value", "expected"),
+        [
+            ("DATE", "2023-01-01", True),
+            ("DATE", "2023-01-01 00:00:00", True),
+            ("DATE", "2023-01-01T00:00:00", True),
+            ("DATE", "2023-01-01 08:00:00", False),
+            ("DATE", "2023/01/01", False),
+            ("DATE", "23-01-01", False),
+            ("TIME", "8:05", True),
+            ("TIME", "08:05:30", True),
+            ("TIME", "123:05", False),
+            ("TIME", "08:5", False),
+            ("TIME", "08:05:", False),
+            ("INTEGER", "42", True),
+            ("INTEGER", "-42", True),
+            ("INTEGER", "42.0", True),
+            ("INTEGER", "42.5", False),
+            ("INTEGER", ".0", False),
+            ("INTEGER", "-", False),
+            ("INTEGER", "²", False),
+            ("DECIMAL", "-1.25", True),
+            ("TIMESTAMP", "1/2/2023 08:05", True),
+            ("TIMESTAMP", "2023-01-02T08:05:30", True),
+            ("TIMESTAMP", "2023-01-02 08:05", True),
+            ("TIMESTAMP", "2023-1-02 08:05", False),
+            ("TIMESTAMP", "1/2/23 08:05", False),
+            ("TIMESTAMP", "1/2", False),
+            ("STRING", "anything", True),
+            ("UNKNOWN", "anything", True),
+        ],
+    )
+    def test_value_conformance(self, dtype: str, value: str, expected: bool) -> None:
+        assert _check_type(value, dtype) is expected
+
+
 class TestSchemaValidationError:
     """Exception attribute verification."""
 
@@ -225,3 +491,19 @@ class TestSchemaValidationError:
         assert err.actual_columns == ["A", "C"]
         assert err.mismatches == ["Missing column: B"]
         assert "file.csv" in str(err)
+
+    def test_error_survives_pickling(self) -> None:
+        import pickle
+
+        err = SchemaValidationError(
+            file_path=Path("/test/file.csv"),
+            expected_columns=["A"],
+            actual_columns=[],
+            mismatches=["File has no header row"],
+        )
+
+        restored = pickle.loads(pickle.dumps(err))
+
+        assert restored.file_path == err.file_path
+        assert restored.mismatches == err.mismatches
+        assert str(restored) == str(err)